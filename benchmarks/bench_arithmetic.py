@@ -0,0 +1,135 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Microbenchmark of the Byte + Byte path.
+
+Compares the current table-driven addition of two Bytes with the previous
+implementation, which rippled the carry through the eight bits using the
+if/elif chains of __getitem__ and __setitem__.
+
+Run from the root of the repository with: python -m benchmarks.bench_arithmetic
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+
+from byte import Byte
+
+
+class LegacyByte:
+    """
+    Replica of the previous Byte implementation, restricted to what the
+    bit-ripple addition used, kept only as the baseline of the benchmark.
+    """
+
+    def __init__(self, *bits: bool) -> None:
+        bits = bits + (False,) * (8 - len(bits))
+        self.first_bit, self.second_bit, self.third_bit, self.forth_bit, \
+            self.fifth_bit, self.sixth_bit, self.seventh_bit, self.eighth_bit = bits
+        self.value = sum(bit << index for index, bit in enumerate(bits))
+        self.char = chr(self.value)
+
+    def __getitem__(self, item: int) -> int:
+        if item == 0:
+            return 1 if self.first_bit else 0
+        elif item == 1:
+            return 1 if self.second_bit else 0
+        elif item == 2:
+            return 1 if self.third_bit else 0
+        elif item == 3:
+            return 1 if self.forth_bit else 0
+        elif item == 4:
+            return 1 if self.fifth_bit else 0
+        elif item == 5:
+            return 1 if self.sixth_bit else 0
+        elif item == 6:
+            return 1 if self.seventh_bit else 0
+        elif item == 7:
+            return 1 if self.eighth_bit else 0
+
+    def __setitem__(self, key: int, value) -> None:
+        if isinstance(value, bool):
+            if key == 0:
+                self.first_bit = value
+            elif key == 1:
+                self.second_bit = value
+            elif key == 2:
+                self.third_bit = value
+            elif key == 3:
+                self.forth_bit = value
+            elif key == 4:
+                self.fifth_bit = value
+            elif key == 5:
+                self.sixth_bit = value
+            elif key == 6:
+                self.seventh_bit = value
+            elif key == 7:
+                self.eighth_bit = value
+        elif isinstance(value, int):
+            self.__setitem__(key, value != 0)
+
+    def __add__(self, other: LegacyByte) -> LegacyByte:
+        current_carry: int = 0
+        addition_byte: LegacyByte = LegacyByte()
+        for i in range(8):
+            sum_value: int = current_carry + self[i] + other[i]
+            if sum_value > 1:
+                current_carry = 1
+            else:
+                current_carry = 0
+            if sum_value == 1 or sum_value == 3:
+                final_value = 1
+            else:
+                final_value = 0
+            addition_byte[i] = final_value
+        return addition_byte
+
+
+def bits_of(value: int) -> list[bool]:
+    return [bool((value >> index) & 1) for index in range(8)]
+
+
+def best_time(statement, number: int, repeat: int) -> float:
+    """
+    :return: the best time in seconds of one execution of the statement.
+    """
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=20_000, help="additions per measure")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="number of measures")
+    args = parser.parse_args(argv)
+
+    legacy_left, legacy_right = LegacyByte(*bits_of(201)), LegacyByte(*bits_of(87))
+    left, right = Byte.from_int(201), Byte.from_int(87)
+    legacy_sum: LegacyByte = legacy_left + legacy_right
+    assert sum(legacy_sum[index] << index for index in range(8)) == int(left + right)
+
+    legacy: float = best_time(lambda: legacy_left + legacy_right, args.number, args.repeat)
+    current: float = best_time(lambda: left + right, args.number, args.repeat)
+
+    print(f"bit-ripple Byte + Byte:   {legacy * 1e9:10.1f} ns")
+    print(f"table-driven Byte + Byte: {current * 1e9:10.1f} ns")
+    print(f"speedup:                  {legacy / current:10.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Memory benchmark of Byte instances.
+
+Compares the bytes used per mutable instance by the previous layout of Byte
+(a per-instance __dict__ holding eight bools, the value and the character)
+with the current __slots__ layout holding a single integer.
+
+Run from the root of the repository with: python -m benchmarks.bench_memory
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tracemalloc
+
+from byte import Byte
+
+
+class LegacyByte:
+    """
+    Replica of the storage of the previous Byte implementation,
+    kept only to measure what an instance used to cost.
+    """
+
+    def __init__(self, first_bit: bool = False, second_bit: bool = False, third_bit: bool = False,
+                 forth_bit: bool = False, fifth_bit: bool = False, sixth_bit: bool = False,
+                 seventh_bit: bool = False, eighth_bit: bool = False) -> None:
+        self.__first_bit = first_bit
+        self.__second_bit = second_bit
+        self.__third_bit = third_bit
+        self.__forth_bit = forth_bit
+        self.__fifth_bit = fifth_bit
+        self.__sixth_bit = sixth_bit
+        self.__seventh_bit = seventh_bit
+        self.__eighth_bit = eighth_bit
+        self.__value = first_bit * 1 + second_bit * 2 + third_bit * 4 + forth_bit * 8 \
+            + fifth_bit * 16 + sixth_bit * 32 + seventh_bit * 64 + eighth_bit * 128
+        self.__char = chr(self.__value)
+
+
+def measure(factory, count: int) -> float:
+    """
+    Measures the average number of bytes allocated per object created by the factory.
+    :param factory: a callable taking the value (0 to 255) of the object to create.
+    :param count: the number of objects to create.
+    :return: the number of allocated bytes per object.
+    """
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        objects: list = [factory(index & 0xFF) for index in range(count)]
+        after: int = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # the list itself is not part of the cost of the objects
+    return max(after - before - sys.getsizeof(objects), 0) / count
+
+
+def bits_of(value: int) -> list[bool]:
+    return [bool((value >> index) & 1) for index in range(8)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--count", type=int, default=100_000, help="number of instances to create")
+    args = parser.parse_args(argv)
+
+    legacy: float = measure(lambda value: LegacyByte(*bits_of(value)), args.count)
+    mutable: float = measure(lambda value: Byte(*bits_of(value)), args.count)
+    interned: float = measure(Byte.from_int, args.count)
+
+    print(f"{'layout':<28}{'bytes/instance':>16}")
+    print(f"{'before (__dict__, 10 attrs)':<28}{legacy:>16.1f}")
+    print(f"{'after (__slots__, 1 int)':<28}{mutable:>16.1f}")
+    print(f"{'after (interned from_int)':<28}{interned:>16.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Benchmark of the radix conversion of huge integers.
+
+Compares the naive conversion, which divides (or multiplies) once per digit, with the
+divide-and-conquer conversion of the radix module, for growing sizes of random buffers.
+The naive conversion is skipped above --naive-limit bytes since it is quadratic.
+
+Run from the root of the repository with: python -m benchmarks.bench_radix
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+import radix
+
+
+def timed(function, *args) -> tuple[float, object]:
+    start: float = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="sizes in bytes of the numbers to convert")
+    parser.add_argument("--radices", type=int, nargs="+", default=[10, 36, 58, 62], help="radices to convert to")
+    parser.add_argument("--naive-limit", type=int, default=30_000,
+                        help="largest size in bytes converted with the naive conversion")
+    args = parser.parse_args(argv)
+
+    print(f"{'bytes':>10}{'radix':>7}{'naive enc':>12}{'d&c enc':>12}{'naive dec':>12}{'d&c dec':>12}")
+    for size in args.sizes:
+        number: int = int.from_bytes(os.urandom(size), "big")
+        for base in args.radices:
+            encode_time, text = timed(radix.int_to_str, number, base)
+            decode_time, back = timed(radix.str_to_int, text, base)
+            assert back == number
+            if size <= args.naive_limit:
+                naive_encode_time, naive_text = timed(radix.int_to_str_naive, number, base)
+                naive_decode_time, naive_back = timed(radix.str_to_int_naive, text, base)
+                assert naive_text == text and naive_back == number
+                naive_encode: str = f"{naive_encode_time:11.3f}s"
+                naive_decode: str = f"{naive_decode_time:11.3f}s"
+            else:
+                naive_encode = naive_decode = f"{'-':>12}"
+            print(f"{size:>10}{base:>7}{naive_encode}{encode_time:11.3f}s{naive_decode}{decode_time:11.3f}s",
+                  flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Benchmark suite of the Byte hot paths and of the bulk operations, with regression checks.
+
+Every path is timed with timeit, keeping the best of several measures, and reported in
+nanoseconds per call for the Byte paths and per byte for the bulk paths. The results can
+be written as JSON and compared with a previous run: the comparison fails when a path got
+slower by more than the threshold.
+
+Run from the root of the repository with: python -m benchmarks.run
+    python -m benchmarks.run --output baseline.json
+    python -m benchmarks.run --compare baseline.json --threshold 10
+    python -m benchmarks.run --compare baseline.json --current current.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from typing import NamedTuple
+
+import bulk
+from byte import Byte
+
+
+class Case(NamedTuple):
+    """
+    A benchmarked path.
+
+    Attributes\\:
+            name: the name of the path.\\n
+            statement: the statement timed, using the names of the namespace of the suite.\\n
+            unit: "call" for a single operation, "byte" for an operation over the bulk buffers.
+    """
+    name: str
+    statement: str
+    unit: str
+
+
+CASES: tuple[Case, ...] = (
+    Case("Byte.__init__", "Byte(True, False, False, True, False, False, True, True)", "call"),
+    Case("Byte.from_int", "Byte.from_int(201)", "call"),
+    Case("Byte.from_str", "Byte.from_str('10010011')", "call"),
+    Case("Byte.from_str (short)", "Byte.from_str('1001')", "call"),
+    Case("Byte.from_char", "Byte.from_char('A')", "call"),
+    Case("Byte.from_byte", "Byte.from_byte(left)", "call"),
+    Case("Byte.__add__ (Byte)", "left + right", "call"),
+    Case("Byte.__add__ (int)", "left + 87", "call"),
+    Case("Byte.__add__ (str)", "left + '11101010'", "call"),
+    Case("Byte.__getitem__ (int)", "left[3]", "call"),
+    Case("Byte.__getitem__ (str)", "left['3']", "call"),
+    Case("Byte.__getitem__ (Byte)", "left[index]", "call"),
+    Case("Byte.__setitem__ (int)", "mutable[3] = 1", "call"),
+    Case("Byte.__setitem__ (str)", "mutable['3'] = True", "call"),
+    Case("Byte.__setitem__ (Byte)", "mutable[index] = 0", "call"),
+    Case("Byte.__eq__ (Byte)", "left == right", "call"),
+    Case("Byte.__eq__ (int)", "left == 201", "call"),
+    Case("Byte.__eq__ (str)", "left == '10010011'", "call"),
+    Case("Byte.__ne__ (Byte)", "left != right", "call"),
+    Case("Byte.__str__", "str(left)", "call"),
+    Case("bulk.add", "bulk.add(first, second)", "byte"),
+    Case("bulk.subtract", "bulk.subtract(first, second)", "byte"),
+    Case("bulk.multiply", "bulk.multiply(first, second)", "byte"),
+    Case("bulk.less", "bulk.less(first, second)", "byte"),
+    Case("bulk.equal", "bulk.equal(first, second)", "byte"),
+    Case("bulk.bitwise_xor", "bulk.bitwise_xor(first, second, out)", "byte"),
+    Case("bulk.invert", "bulk.invert(first, out)", "byte"),
+    Case("bulk.shift_left", "bulk.shift_left(first, 3, out)", "byte"),
+    Case("bulk.rotate_left", "bulk.rotate_left(first, 3, out)", "byte"),
+    Case("bulk.reverse_bits", "bulk.reverse_bits(first, out)", "byte"),
+    Case("bulk.popcounts", "bulk.popcounts(first)", "byte"),
+    Case("bulk.popcount", "bulk.popcount(first)", "byte"),
+    Case("bulk.popcount_histogram", "bulk.popcount_histogram(first)", "byte"),
+)
+
+
+def _namespace(size: int) -> dict[str, object]:
+    """
+    The names used by the statements of the cases.
+    """
+    first: bytes = bytes((index * 131 + 7) & 0xFF for index in range(size))
+    return {
+        "Byte": Byte,
+        "bulk": bulk,
+        "left": Byte.from_int(201),
+        "right": Byte.from_int(87),
+        "index": Byte.from_int(3),
+        "mutable": Byte.from_byte(Byte.from_int(201)),
+        "first": first,
+        "second": first[::-1],
+        "out": bytearray(size),
+    }
+
+
+def run(cases: list[Case], number: int, bulk_number: int, repeat: int, size: int) -> dict[str, dict]:
+    """
+    Times the cases.
+    :return: the result of each case by name: its time in nanoseconds per unit and its unit.
+    """
+    namespace: dict[str, object] = _namespace(size)
+    results: dict[str, dict] = {}
+    for case in cases:
+        count: int = number if case.unit == "call" else bulk_number
+        timer: timeit.Timer = timeit.Timer(case.statement, globals=namespace)
+        best: float = min(timer.repeat(repeat=repeat, number=count)) / count
+        if case.unit == "byte":
+            best /= size
+        results[case.name] = {"ns": best * 1e9, "unit": case.unit}
+        print(f"{case.name:28} {best * 1e9:12.3f} ns/{case.unit}", flush=True)
+    return results
+
+
+def compare(baseline: dict[str, dict], current: dict[str, dict], threshold: float) -> list[str]:
+    """
+    Compares two runs and prints the change of each path.
+    :param threshold: the slowdown, in percent, above which a path is a regression.
+    :return: the names of the regressed paths.
+    """
+    regressions: list[str] = []
+    print(f"{'path':28} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name, result in current.items():
+        if name not in baseline:
+            print(f"{name:28} {'-':>12} {result['ns']:12.3f}      new")
+            continue
+        before: float = baseline[name]["ns"]
+        change: float = (result["ns"] - before) / before * 100 if before else 0.0
+        regressed: bool = change > threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:28} {before:12.3f} {result['ns']:12.3f} {change:+8.1f}%{'  REGRESSION' if regressed else ''}")
+    for name in sorted(baseline.keys() - current.keys()):
+        print(f"{name:28} {baseline[name]['ns']:12.3f} {'-':>12}  missing")
+    return regressions
+
+
+def _load(path: str) -> dict[str, dict]:
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    parser.add_argument("-c", "--compare", metavar="BASELINE",
+                        help="compare the results with a baseline JSON file and fail on regressions")
+    parser.add_argument("--current", metavar="RESULTS",
+                        help="with --compare, compare this JSON file instead of running the suite")
+    parser.add_argument("-t", "--threshold", type=float, default=10.0,
+                        help="the slowdown in percent above which a path regresses (default: 10)")
+    parser.add_argument("-k", "--filter", default="", help="only run the paths whose name contains this text")
+    parser.add_argument("-n", "--number", type=int, default=100_000, help="calls per measure of a Byte path")
+    parser.add_argument("--bulk-number", type=int, default=20, help="calls per measure of a bulk path")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="number of measures, the best one is kept")
+    parser.add_argument("--size", type=int, default=1 << 20, help="bytes of the buffers of the bulk paths")
+    args = parser.parse_args(argv)
+
+    if args.current is not None:
+        if args.compare is None:
+            parser.error("--current requires --compare")
+        current: dict[str, dict] = _load(args.current)
+    else:
+        cases: list[Case] = [case for case in CASES if args.filter in case.name]
+        current: dict[str, dict] = run(cases, args.number, args.bulk_number, args.repeat, args.size)
+
+    if args.output is not None:
+        report: dict[str, object] = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "numpy": bulk.HAS_NUMPY,
+            "bulk_size": args.size,
+            "results": current,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+
+    if args.compare is not None:
+        print()
+        baseline: dict[str, dict] = {name: result for name, result in _load(args.compare).items()
+                                     if args.filter in name}
+        regressions: list[str] = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} path(s) slower by more than {args.threshold}%: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Bit-level comparison of two large files or buffers.
+
+The inputs are compared chunk by chunk, memory mapped for files. Equal chunks, and then equal blocks
+of a differing chunk, are skipped by a plain comparison of their bytes, which runs at memory bandwidth.
+Only the differing blocks are xored as whole integers (or NumPy arrays when NumPy is installed) to
+count the flipped bits at each of the 8 bit positions and to locate the ranges of differing bytes.
+The bit positions are those of Byte: position 0 is the first, least significant, bit.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+import os
+import re
+from typing import Iterator, NamedTuple
+
+from byte import Byte
+from byte_array import as_memoryview
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The default number of bytes compared at once.
+DEFAULT_CHUNK_SIZE: int = 1 << 20
+
+# The number of bytes of the blocks of a differing chunk compared separately.
+_BLOCK_SIZE: int = 1 << 12
+
+# The masks selecting each bit position in every byte of a block.
+_POSITION_MASKS: tuple[int, ...] = tuple(int.from_bytes(bytes((1 << position,)) * _BLOCK_SIZE, "little")
+                                         for position in range(8))
+
+# The runs of differing bytes in the xor of two blocks.
+_DIFFERENT: re.Pattern = re.compile(b"[^\\x00]+")
+
+
+class DiffRange(NamedTuple):
+    """
+    A range of consecutive differing bytes.
+
+    Attributes\\:
+            start: the offset of the first differing byte.\\n
+            end: the offset after the last differing byte.\\n
+            flipped: the number of differing bits, 0 for the bytes past the end of the shorter input.
+    """
+    start: int
+    end: int
+    flipped: int
+
+
+class DiffReport(NamedTuple):
+    """
+    The result of a comparison.
+
+    Attributes\\:
+            size_a: the number of bytes of the first input.\\n
+            size_b: the number of bytes of the second input.\\n
+            ranges: the ranges of differing bytes, by offset, at most the max_ranges first ones.\\n
+            range_count: the number of ranges of differing bytes, including the ones not kept.\\n
+            flips: the number of differing bits at each bit position, the first bit first.
+    """
+    size_a: int
+    size_b: int
+    ranges: tuple[DiffRange, ...]
+    range_count: int
+    flips: tuple[int, ...]
+
+    @property
+    def compared(self) -> int:
+        """
+        The number of bytes compared: the size of the shorter input.
+        """
+        return min(self.size_a, self.size_b)
+
+    @property
+    def flipped_bits(self) -> int:
+        return sum(self.flips)
+
+    @property
+    def bit_error_rate(self) -> float:
+        """
+        The fraction of the compared bits which differ.
+        """
+        return self.flipped_bits / (8 * self.compared) if self.compared else 0.0
+
+    @property
+    def identical(self) -> bool:
+        return self.range_count == 0
+
+
+@contextlib.contextmanager
+def _opened(source) -> Iterator:
+    """
+    Gets the bytes of an input: a memory map for a path or a file, a memoryview otherwise.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file, _opened(file) as data:
+            yield data
+    elif hasattr(source, "fileno"):
+        if os.fstat(source.fileno()).st_size == 0:
+            yield b""
+        else:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+    else:
+        yield as_memoryview(source)
+
+
+def _diff_block(left: bytes, right: bytes, flips: list[int]) -> list[tuple[int, int, int]]:
+    """
+    Compares two differing blocks of the same length.
+    :param flips: the flip counts of the bit positions, updated.
+    :return: the ranges of differing bytes of the block, relative to its start, with their flipped bits.
+    """
+    if numpy is not None:
+        xored = numpy.bitwise_xor(numpy.frombuffer(left, dtype=numpy.uint8), numpy.frombuffer(right, dtype=numpy.uint8))
+        for position, count in enumerate(numpy.unpackbits(xored, bitorder="little").reshape(-1, 8).sum(axis=0).tolist()):
+            flips[position] += count
+        xored_bytes: bytes = xored.tobytes()
+    else:
+        xored: int = int.from_bytes(left, "little") ^ int.from_bytes(right, "little")
+        for position, mask in enumerate(_POSITION_MASKS):
+            flips[position] += (xored & mask).bit_count()
+        xored_bytes: bytes = xored.to_bytes(len(left), "little")
+    return [(found.start(), found.end(), int.from_bytes(found.group(), "little").bit_count())
+            for found in _DIFFERENT.finditer(xored_bytes)]
+
+
+def iter_diff(a, b, chunk_size: int = DEFAULT_CHUNK_SIZE, flips: list[int] | None = None) -> Iterator[DiffRange]:
+    """
+    Compares two inputs and yields the ranges of differing bytes, by offset.
+    :param a: the first input: a path, a file opened in binary mode, a ByteArray or any object
+    supporting the buffer protocol.
+    :param b: the second input.
+    :param chunk_size: the number of bytes compared at once.
+    :param flips: a list of 8 counts, incremented with the differing bits at each bit position.
+    :return: an iterator over the ranges. The bytes past the end of the shorter input make the last range.
+    """
+    flips = [0] * 8 if flips is None else flips
+    chunk_size = max(chunk_size - chunk_size % _BLOCK_SIZE, _BLOCK_SIZE)
+    with _opened(a) as left, _opened(b) as right:
+        common: int = min(len(left), len(right))
+        pending: list[int] | None = None
+        for chunk in range(0, common, chunk_size):
+            chunk_end: int = min(chunk + chunk_size, common)
+            if left[chunk:chunk_end] == right[chunk:chunk_end]:
+                continue
+            for block in range(chunk, chunk_end, _BLOCK_SIZE):
+                block_end: int = min(block + _BLOCK_SIZE, chunk_end)
+                left_block: bytes = bytes(left[block:block_end])
+                right_block: bytes = bytes(right[block:block_end])
+                if left_block == right_block:
+                    continue
+                for start, end, flipped in _diff_block(left_block, right_block, flips):
+                    if pending is not None and pending[1] == block + start:
+                        # a range going on across blocks
+                        pending[1] = block + end
+                        pending[2] += flipped
+                        continue
+                    if pending is not None:
+                        yield DiffRange(*pending)
+                    pending = [block + start, block + end, flipped]
+        if pending is not None:
+            yield DiffRange(*pending)
+        if len(left) != len(right):
+            yield DiffRange(common, max(len(left), len(right)), 0)
+
+
+def diff(a, b, chunk_size: int = DEFAULT_CHUNK_SIZE, max_ranges: int | None = 10_000) -> DiffReport:
+    """
+    Compares two inputs.
+    :param a: the first input: a path, a file opened in binary mode, a ByteArray or any object
+    supporting the buffer protocol.
+    :param b: the second input.
+    :param chunk_size: the number of bytes compared at once.
+    :param max_ranges: the number of ranges kept in the report, all of them if None.
+    The counts always cover the whole inputs.
+    :return: the report of the comparison.
+    """
+    flips: list[int] = [0] * 8
+    ranges: list[DiffRange] = []
+    count: int = 0
+    for found in iter_diff(a, b, chunk_size, flips):
+        if max_ranges is None or count < max_ranges:
+            ranges.append(found)
+        count += 1
+    with _opened(a) as left, _opened(b) as right:
+        size_a, size_b = len(left), len(right)
+    return DiffReport(size_a, size_b, tuple(ranges), count, tuple(flips))
+
+
+def describe_bytes(a, b, diff_range: DiffRange, limit: int = 16) -> Iterator[str]:
+    """
+    Describes the first bytes of a range, with the bits of the bytes written like Byte.__str__
+    and the indexes of the differing bits like Byte.__getitem__.
+    :param a: the first input.
+    :param b: the second input.
+    :param diff_range: the range to describe.
+    :param limit: the number of bytes described.
+    :return: an iterator over the lines, without line breaks.
+    """
+    with _opened(a) as left, _opened(b) as right:
+        end: int = min(diff_range.end, diff_range.start + limit, len(left), len(right))
+        for offset in range(diff_range.start, end):
+            left_byte: Byte = Byte.from_int(left[offset])
+            right_byte: Byte = Byte.from_int(right[offset])
+            if left_byte == right_byte:
+                continue
+            indexes: list[str] = [str(index) for index in range(8) if left_byte[index] != right_byte[index]]
+            yield f"{offset:08x}: {left_byte} -> {right_byte}  bit{'s' if len(indexes) > 1 else ''} {', '.join(indexes)}"
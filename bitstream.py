@@ -0,0 +1,356 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Reading and writing fields of any bit width at any bit offset of a byte stream.
+
+Two bit orders are supported. In the "lsb" order, which is the order of Byte, the bits of each
+byte are used from the first (least significant) bit to the eighth one and the first bit of a field
+is its least significant bit, like in DEFLATE. In the "msb" order, the bits of each byte are used from
+the eighth bit to the first one and the first bit of a field is its most significant bit, like in
+most network protocols.
+
+Both classes keep the pending bits in an integer accumulator filled or drained 64 bits at a time
+and exchange blocks of bytes with their source or sink, so no memory access is made per bit.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import socket
+
+from byte_array import as_memoryview
+
+# The number of bytes read from or written to the underlying stream at once.
+BLOCK_SIZE: int = 1 << 16
+
+_BIT_ORDERS: tuple[str, str] = ("lsb", "msb")
+
+
+def _check_bit_order(bit_order: str) -> None:
+    if bit_order not in _BIT_ORDERS:
+        raise ValueError(f"the bit order must be 'lsb' or 'msb', not {bit_order!r}")
+
+
+def _check_width(width: int) -> None:
+    if width < 0:
+        raise ValueError(f"the width of a field must be 0 or more, not {width}")
+
+
+class BitReader:
+    """
+    Reads fields of bits from a buffer, a file or a socket.
+
+    Attributes\\:
+            __stream: the file object the blocks are read from, None for a buffer.\\n
+            __owned: True if the stream was opened by the reader and must be closed with it.\\n
+            __block: the current block of bytes.\\n
+            __position: the position of the next byte to load from the block.\\n
+            __loaded: the number of bytes loaded into the accumulator since the start.\\n
+            __accumulator: the bits loaded but not read yet.\\n
+            __count: the number of bits in the accumulator.\\n
+            __msb: True for the "msb" bit order, False for the "lsb" bit order.
+    """
+
+    __slots__ = ("__stream", "__owned", "__block", "__position", "__loaded", "__accumulator", "__count", "__msb")
+
+    def __init__(self, source, bit_order: str = "lsb") -> None:
+        """
+        Create a reader.
+        :param source: the bytes to read: a ByteArray or any object supporting the buffer protocol
+        (read in place), a file object opened in binary mode, a path or a connected socket.
+        :param bit_order: "lsb" (the order of Byte) or "msb".
+        """
+        _check_bit_order(bit_order)
+        self.__msb = bit_order == "msb"
+        self.__owned = False
+        self.__stream = None
+        if isinstance(source, (str, os.PathLike)):
+            self.__stream = open(source, "rb", buffering=BLOCK_SIZE)
+            self.__owned = True
+            self.__block = b""
+        elif isinstance(source, socket.socket):
+            self.__stream = source.makefile("rb", buffering=BLOCK_SIZE)
+            self.__owned = True
+            self.__block = b""
+        elif hasattr(source, "read"):
+            self.__stream = source
+            self.__block = b""
+        else:
+            self.__block = as_memoryview(source)
+        self.__position = 0
+        self.__loaded = 0
+        self.__accumulator = 0
+        self.__count = 0
+
+    def __next_bytes(self) -> bytes | memoryview:
+        """
+        Takes up to 8 bytes from the current block, reading the next block when it is exhausted.
+        :return: the bytes taken, empty at the end of the stream.
+        """
+        if self.__position >= len(self.__block):
+            if self.__stream is None:
+                return b""
+            read = getattr(self.__stream, "read1", self.__stream.read)
+            self.__block = read(BLOCK_SIZE)
+            self.__position = 0
+        chunk = self.__block[self.__position:self.__position + 8]
+        self.__position += len(chunk)
+        return chunk
+
+    def __fill(self, width: int) -> None:
+        """
+        Loads bytes into the accumulator until it holds at least width bits.
+        :raises EOFError: if the stream ends before.
+        """
+        while self.__count < width:
+            chunk = self.__next_bytes()
+            if not chunk:
+                raise EOFError(f"{width} bits requested, {self.__count} left in the stream")
+            size: int = len(chunk)
+            if self.__msb:
+                self.__accumulator = (self.__accumulator << (8 * size)) | int.from_bytes(chunk, "big")
+            else:
+                self.__accumulator |= int.from_bytes(chunk, "little") << self.__count
+            self.__count += 8 * size
+            self.__loaded += size
+
+    def read(self, width: int) -> int:
+        """
+        Reads a field.
+        :param width: the number of bits of the field, 0 or more.
+        :return: the unsigned value of the field.
+        :raises EOFError: if the stream holds fewer bits.
+        """
+        _check_width(width)
+        if width > self.__count:
+            self.__fill(width)
+        self.__count -= width
+        if self.__msb:
+            value: int = self.__accumulator >> self.__count
+            self.__accumulator &= (1 << self.__count) - 1
+        else:
+            value: int = self.__accumulator & ((1 << width) - 1)
+            self.__accumulator >>= width
+        return value
+
+    def read_signed(self, width: int) -> int:
+        """
+        Reads a field holding a two's complement signed integer.
+        """
+        value: int = self.read(width)
+        if width and value >> (width - 1):
+            value -= 1 << width
+        return value
+
+    def read_bit(self) -> int:
+        return self.read(1)
+
+    def peek(self, width: int) -> int:
+        """
+        Reads a field without consuming it.
+        """
+        if width > self.__count:
+            self.__fill(width)
+        if self.__msb:
+            return self.__accumulator >> (self.__count - width)
+        return self.__accumulator & ((1 << width) - 1)
+
+    def skip(self, width: int) -> None:
+        """
+        Skips bits.
+        """
+        while width > 64:
+            self.read(64)
+            width -= 64
+        self.read(width)
+
+    def align(self) -> None:
+        """
+        Skips the bits left in the current byte, so the next read starts on a byte boundary.
+        """
+        self.read(self.__count % 8)
+
+    def read_bytes(self, size: int) -> bytes:
+        """
+        Reads whole bytes. The reader must be on a byte boundary.
+        """
+        if self.__count % 8:
+            raise ValueError("the reader is not on a byte boundary, call align() first")
+        return self.read(8 * size).to_bytes(size, "big" if self.__msb else "little")
+
+    def tell(self) -> int:
+        """
+        :return: the number of bits read since the start.
+        """
+        return 8 * self.__loaded - self.__count
+
+    def close(self) -> None:
+        if self.__owned:
+            self.__stream.close()
+
+    def __enter__(self) -> BitReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class BitWriter:
+    """
+    Writes fields of bits to memory, a file or a socket.
+
+    Attributes\\:
+            __stream: the file object the blocks are written to.\\n
+            __owned: True if the stream was opened by the writer and must be closed with it.\\n
+            __block: the bytes completed but not written to the stream yet.\\n
+            __written: the number of bytes completed since the start.\\n
+            __accumulator: the bits written which do not fill 64 bits yet.\\n
+            __count: the number of bits in the accumulator.\\n
+            __msb: True for the "msb" bit order, False for the "lsb" bit order.
+    """
+
+    __slots__ = ("__stream", "__owned", "__block", "__written", "__accumulator", "__count", "__msb")
+
+    def __init__(self, sink=None, bit_order: str = "lsb") -> None:
+        """
+        Create a writer.
+        :param sink: where to write: None to keep the bytes in memory (see getvalue), a file object
+        opened in binary mode, a path or a connected socket.
+        :param bit_order: "lsb" (the order of Byte) or "msb".
+        """
+        _check_bit_order(bit_order)
+        self.__msb = bit_order == "msb"
+        self.__owned = False
+        if sink is None:
+            self.__stream = io.BytesIO()
+        elif isinstance(sink, socket.socket):
+            self.__stream = sink.makefile("wb", buffering=BLOCK_SIZE)
+            self.__owned = True
+        elif isinstance(sink, (str, os.PathLike)):
+            self.__stream = open(sink, "wb", buffering=BLOCK_SIZE)
+            self.__owned = True
+        else:
+            self.__stream = sink
+        self.__block = bytearray()
+        self.__written = 0
+        self.__accumulator = 0
+        self.__count = 0
+
+    def write(self, value: int, width: int) -> None:
+        """
+        Writes a field. Only the width least significant bits of the value are written,
+        so negative values are written in two's complement.
+        :param value: the value of the field.
+        :param width: the number of bits of the field, 0 or more.
+        """
+        _check_width(width)
+        value = int(value) & ((1 << width) - 1)
+        if self.__msb:
+            self.__accumulator = (self.__accumulator << width) | value
+        else:
+            self.__accumulator |= value << self.__count
+        self.__count += width
+        if self.__count >= 64:
+            self.__drain(64)
+
+    def write_bit(self, value) -> None:
+        self.write(1 if value else 0, 1)
+
+    def __drain(self, threshold: int) -> None:
+        """
+        Moves whole groups of 8 bytes, or whole bytes if the threshold is 8,
+        from the accumulator to the block, and writes the block once it is full.
+        All the groups are converted at once, so a wide field is not shifted once per group.
+        """
+        bits: int = self.__count - self.__count % threshold
+        if bits:
+            self.__count -= bits
+            size: int = bits // 8
+            if self.__msb:
+                self.__block += (self.__accumulator >> self.__count).to_bytes(size, "big")
+                self.__accumulator &= (1 << self.__count) - 1
+            else:
+                self.__block += (self.__accumulator & ((1 << bits) - 1)).to_bytes(size, "little")
+                self.__accumulator >>= bits
+            self.__written += size
+        if len(self.__block) >= BLOCK_SIZE:
+            self.__stream.write(self.__block)
+            self.__block = bytearray()
+
+    def align(self) -> None:
+        """
+        Fills the current byte with 0 bits, so the next write starts on a byte boundary.
+        """
+        self.write(0, -self.__count % 8)
+
+    def write_bytes(self, data) -> None:
+        """
+        Writes whole bytes at the current bit position: copied as they are on a byte boundary,
+        written as a single field otherwise.
+        """
+        view: memoryview = as_memoryview(data)
+        if self.__count % 8:
+            self.write(int.from_bytes(view, "big" if self.__msb else "little"), 8 * len(view))
+            return
+        self.__drain(8)
+        self.__block += view
+        self.__written += len(view)
+        self.__drain(8)
+
+    def tell(self) -> int:
+        """
+        :return: the number of bits written since the start.
+        """
+        return 8 * self.__written + self.__count
+
+    def flush(self) -> None:
+        """
+        Writes the completed bytes to the stream. The bits of an incomplete byte are kept.
+        """
+        self.__drain(8)
+        self.__stream.write(self.__block)
+        self.__block = bytearray()
+        if hasattr(self.__stream, "flush"):
+            self.__stream.flush()
+
+    def getvalue(self) -> bytes:
+        """
+        :return: the bytes written so far, the last incomplete byte padded with 0 bits,
+        when the writer keeps them in memory.
+        """
+        if not isinstance(self.__stream, io.BytesIO):
+            raise ValueError("only a writer without sink keeps its bytes in memory")
+        self.flush()
+        pending: bytes = b""
+        if self.__count:
+            bits: int = self.__accumulator << (8 - self.__count) if self.__msb else self.__accumulator
+            pending = bytes((bits & 0xFF,))
+        return self.__stream.getvalue() + pending
+
+    def close(self) -> None:
+        """
+        Pads the last byte with 0 bits, writes everything and closes the stream if the writer opened it.
+        """
+        self.align()
+        self.flush()
+        if self.__owned:
+            self.__stream.close()
+
+    def __enter__(self) -> BitWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,266 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterator
+
+from byte_array import as_memoryview
+from codec import encode, parse_bin
+
+
+class BitVector:
+    """
+    A fixed-length sequence of bits packed eight per byte, with a rank and select index.
+
+    The bits are indexed like the bits of a Byte: the bit i is the bit i % 8 of the byte i // 8,
+    the first bit of a byte being its least significant bit.
+
+    The index splits the bits into blocks of BLOCK_BITS bits and keeps the number of bits set
+    in each block in a Fenwick tree (binary indexed tree). It is built in one pass over the bits
+    and every point mutation updates it in logarithmic time. rank and select then find the block
+    through the tree in logarithmic time and finish inside the block with word-wide bit counts.
+
+    Attributes\\:
+            BLOCK_BITS: the number of bits of a block of the index, a multiple of 8.\\n
+            __length: the number of bits.\\n
+            __data: the packed bits. The unused bits of the last byte are always 0.\\n
+            __tree: the Fenwick tree of the number of bits set per block, 1-based.\\n
+            __ones: the total number of bits set.
+    """
+
+    __slots__ = ("__length", "__data", "__tree", "__ones")
+
+    BLOCK_BITS: int = 2048
+
+    __length: int
+    __data: bytearray
+    __tree: array
+    __ones: int
+
+    def __init__(self, length: int = 0, data=None) -> None:
+        """
+        Create a new bit vector and build its index.
+        :param length: the number of bits. If data is given and length is 0, all the bits of the data.
+        :param data: the packed bits, as a ByteArray, any object supporting the buffer protocol or
+        an iterable of Byte and int. They are copied. By default, all the bits are 0.
+        """
+        if data is None:
+            self.__data = bytearray((length + 7) // 8)
+        else:
+            view: memoryview = as_memoryview(data)
+            if not length:
+                length = 8 * len(view)
+            elif length > 8 * len(view):
+                raise ValueError(f"{len(view)} bytes cannot hold {length} bits")
+            self.__data = bytearray(view[:(length + 7) // 8])
+            if length % 8:
+                self.__data[-1] &= (1 << (length % 8)) - 1
+        self.__length = length
+        self.__build_index()
+
+    @staticmethod
+    def from_bytes(data, length: int = 0) -> BitVector:
+        """
+        Creates a bit vector from packed bits.
+        :param data: the packed bits, the first bit being the least significant bit of the first byte.
+        :param length: the number of bits, all the bits of the data by default.
+        """
+        return BitVector(length, data)
+
+    @staticmethod
+    def from_str(bits: str) -> BitVector:
+        """
+        Creates a bit vector from a string of '0' and '1', the first character being the bit 0,
+        like the string of bits of a Byte. Whitespace is ignored.
+        """
+        data: bytes = parse_bin(bits)
+        length: int = len("".join(bits.split()))
+        return BitVector(length, data)
+
+    def __build_index(self) -> None:
+        """
+        Builds the Fenwick tree of the number of bits set per block in one pass.
+        """
+        block_bytes: int = BitVector.BLOCK_BITS // 8
+        data: bytearray = self.__data
+        counts: list[int] = [int.from_bytes(data[start:start + block_bytes], "little").bit_count()
+                             for start in range(0, len(data), block_bytes)]
+        self.__ones = sum(counts)
+
+        # linear construction: each node adds its partial sum to its parent
+        tree: list[int] = [0] + counts
+        size: int = len(counts)
+        for node in range(1, size + 1):
+            parent: int = node + (node & -node)
+            if parent <= size:
+                tree[parent] += tree[node]
+        self.__tree = array("q", tree)
+
+    def __tree_add(self, block: int, delta: int) -> None:
+        tree: array = self.__tree
+        node: int = block + 1
+        size: int = len(tree) - 1
+        while node <= size:
+            tree[node] += delta
+            node += node & -node
+
+    def __tree_prefix(self, block: int) -> int:
+        """
+        :return: the number of bits set in the blocks before the given block.
+        """
+        tree: array = self.__tree
+        total: int = 0
+        node: int = block
+        while node:
+            total += tree[node]
+            node &= node - 1
+        return total
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def count(self) -> int:
+        """
+        :return: the number of bits set to 1.
+        """
+        return self.__ones
+
+    def __index_of(self, item) -> int:
+        index: int = int(item)
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError("BitVector index out of range")
+        return index
+
+    def __getitem__(self, item) -> int:
+        """
+        Gets a bit, like Byte.__getitem__.
+        :param item: the index of the bit, as an int, a str or a Byte.
+        :return: the bit, 0 or 1.
+        """
+        index: int = self.__index_of(item)
+        return (self.__data[index >> 3] >> (index & 7)) & 1
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Sets a bit and updates the index, like Byte.__setitem__.
+        :param key: the index of the bit, as an int, a str or a Byte.
+        :param value: a bool, an int (0 for False) or a str ("0" for False).
+        """
+        index: int = self.__index_of(key)
+        if isinstance(value, str):
+            bit: bool = value != "0"
+        else:
+            bit: bool = bool(value)
+        mask: int = 1 << (index & 7)
+        current: int = self.__data[index >> 3]
+        if bool(current & mask) == bit:
+            return
+        if bit:
+            self.__data[index >> 3] = current | mask
+            delta: int = 1
+        else:
+            self.__data[index >> 3] = current & ~mask
+            delta: int = -1
+        self.__ones += delta
+        self.__tree_add(index // BitVector.BLOCK_BITS, delta)
+
+    def __iter__(self) -> Iterator[int]:
+        data: bytearray = self.__data
+        for index in range(self.__length):
+            yield (data[index >> 3] >> (index & 7)) & 1
+
+    def rank(self, index: int) -> int:
+        """
+        Counts the bits set to 1 before a position.
+        :param index: the position, between 0 and the length included.
+        :return: the number of bits set to 1 among the bits 0 to index - 1.
+        """
+        index = int(index)
+        if not 0 <= index <= self.__length:
+            raise IndexError("BitVector rank out of range")
+        block: int = index // BitVector.BLOCK_BITS
+        start: int = block * (BitVector.BLOCK_BITS // 8)
+        end: int = index >> 3
+        partial: int = int.from_bytes(self.__data[start:end], "little").bit_count()
+        if index & 7:
+            partial += (self.__data[end] & ((1 << (index & 7)) - 1)).bit_count()
+        return self.__tree_prefix(block) + partial
+
+    def select(self, rank: int) -> int:
+        """
+        Finds the position of a bit set to 1.
+        :param rank: the number of bits set to 1 before the wanted one, 0 for the first bit set.
+        :return: the index of the bit, such that rank(index) == rank and the bit is set.
+        :raises IndexError: if fewer bits are set.
+        """
+        rank = int(rank)
+        if not 0 <= rank < self.__ones:
+            raise IndexError("BitVector select out of range")
+
+        # descend the Fenwick tree to the block holding the bit
+        tree: array = self.__tree
+        size: int = len(tree) - 1
+        node: int = 0
+        step: int = 1 << size.bit_length()
+        while step:
+            child: int = node + step
+            if child <= size and tree[child] <= rank:
+                node = child
+                rank -= tree[child]
+            step >>= 1
+
+        # then halve the block until the byte holding the bit is found
+        block_bytes: int = BitVector.BLOCK_BITS // 8
+        word: int = int.from_bytes(self.__data[node * block_bytes:(node + 1) * block_bytes], "little")
+        offset: int = node * BitVector.BLOCK_BITS
+        width: int = BitVector.BLOCK_BITS
+        while width > 8:
+            half: int = width >> 1
+            low: int = word & ((1 << half) - 1)
+            low_ones: int = low.bit_count()
+            if rank < low_ones:
+                word = low
+            else:
+                rank -= low_ones
+                word >>= half
+                offset += half
+            width = half
+
+        for bit in range(8):
+            if (word >> bit) & 1:
+                if rank == 0:
+                    return offset + bit
+                rank -= 1
+        raise AssertionError("the rank index is inconsistent with the bits")
+
+    def tobytes(self) -> bytes:
+        """
+        :return: the packed bits. The unused bits of the last byte are 0.
+        """
+        return bytes(self.__data)
+
+    def __str__(self) -> str:
+        return encode(self.__data, 2)[:self.__length]
+
+    def __repr__(self) -> str:
+        return f"BitVector({self.__length}, {bytes(self.__data)!r})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BitVector):
+            return self.__length == other.__length and self.__data == other.__data
+        return NotImplemented
@@ -0,0 +1,435 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Bulk operations applying the Byte semantics to whole sequences of bytes in one call.
+
+The operands are either sequences of bytes (ByteArray, bytes, bytearray, mmap, memoryview,
+NumPy arrays, or iterables of Byte and int) or scalars (Byte, int, or a string of bits as
+accepted by Byte.from_str), which are broadcast over the other operand. At least one operand
+must be a sequence and two sequences must have the same length.
+
+When NumPy is installed the operations are vectorized over uint8 arrays and return NumPy
+arrays: uint8 arrays for values and bool arrays for masks. Otherwise a pure Python path
+is used, built on bytes.translate tables and word-wide integer arithmetic, which returns
+bytearrays: the values for arithmetic and 0 or 1 for the masks and the bits.
+
+The bitwise operations accept an out argument, a writable buffer (bytearray, ByteArray, mmap,
+NumPy array...) of the same length receiving the result, which is then returned.
+Passing the left operand as out applies the operation in place.
+"""
+
+from __future__ import annotations
+
+import operator
+
+from byte import POPCOUNT_TABLE, PARITY_TABLE, REVERSED_BITS_TABLE, Byte
+from byte_array import as_memoryview
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+HAS_NUMPY: bool = numpy is not None
+
+# The number of bytes processed at once by the reductions over whole buffers.
+CHUNK_SIZE: int = 1 << 20
+
+
+def _operand(value) -> tuple[bool, object]:
+    """
+    Splits an operand between the scalars, converted to an int, and the sequences,
+    converted to a uint8 NumPy array or to a memoryview of unsigned bytes.
+    :return: a tuple with True and the int for a scalar or False and the sequence.
+    """
+    if isinstance(value, Byte):
+        return True, int(value)
+    elif isinstance(value, int):
+        return True, value
+    elif isinstance(value, str):
+        return True, int(Byte.from_str(value))
+    elif HAS_NUMPY and isinstance(value, numpy.ndarray):
+        return False, value.astype(numpy.uint8, copy=False)
+    elif HAS_NUMPY:
+        return False, numpy.frombuffer(as_memoryview(value), dtype=numpy.uint8)
+    else:
+        return False, as_memoryview(value)
+
+
+def _operands(left, right) -> tuple[object, object, bool, bool]:
+    left_is_scalar, left_value = _operand(left)
+    right_is_scalar, right_value = _operand(right)
+    if left_is_scalar and right_is_scalar:
+        raise TypeError("at least one operand of a bulk operation must be a sequence of bytes")
+    if not left_is_scalar and not right_is_scalar and len(left_value) != len(right_value):
+        raise ValueError(f"operands have different lengths: {len(left_value)} and {len(right_value)}")
+    return left_value, right_value, left_is_scalar, right_is_scalar
+
+
+def _translate(sequence: memoryview, function) -> bytearray:
+    """
+    Maps every byte of the sequence through the function, using a 256-entry translation table.
+    """
+    table: bytes = bytes(function(value) & 0xFF for value in range(256))
+    return bytearray(sequence).translate(table)
+
+
+def _high_bits(length: int) -> int:
+    """
+    The mask selecting the most significant bit of each byte of a word of the given length in bytes.
+    """
+    return int.from_bytes(b"\x80" * length, "little")
+
+
+def _wrapping(left, right, function, numpy_function, word_function=None):
+    """
+    Applies a wrapping arithmetic operation to the operands.
+    :param function: the scalar operation on two ints, the result is reduced modulo 256.
+    :param numpy_function: the NumPy ufunc, which wraps on uint8 arrays.
+    :param word_function: the operation on two sequences of the same length packed into ints, if any.
+    """
+    left, right, left_is_scalar, right_is_scalar = _operands(left, right)
+    if HAS_NUMPY:
+        if left_is_scalar:
+            left = numpy.uint8(left & 0xFF)
+        if right_is_scalar:
+            right = numpy.uint8(right & 0xFF)
+        return numpy_function(left, right, dtype=numpy.uint8)
+
+    if left_is_scalar:
+        return _translate(right, lambda value: function(left, value))
+    if right_is_scalar:
+        return _translate(left, lambda value: function(value, right))
+    length: int = len(left)
+    if word_function is not None:
+        result: int = word_function(int.from_bytes(left, "little"), int.from_bytes(right, "little"),
+                                    _high_bits(length), (1 << (8 * length)) - 1)
+        return bytearray(result.to_bytes(length, "little"))
+    return bytearray(value & 0xFF for value in map(function, left, right))
+
+
+def add(left, right):
+    """
+    Adds the operands byte by byte, modulo 256, like Byte.__add__.
+    """
+    return _wrapping(left, right, operator.add, numpy.add if HAS_NUMPY else None,
+                      # add the seven low bits of each byte, then the eighth bit without carry out
+                      lambda a, b, high, full: ((a & ~high & full) + (b & ~high & full)) ^ ((a ^ b) & high))
+
+
+def subtract(left, right):
+    """
+    Subtracts the right operand from the left one byte by byte, modulo 256, like Byte.__sub__.
+    """
+    return _wrapping(left, right, operator.sub, numpy.subtract if HAS_NUMPY else None,
+                      # set the eighth bit of each byte of a to absorb the borrow, then fix it back
+                      lambda a, b, high, full: ((a | high) - (b & ~high & full)) ^ ((a ^ ~b) & high))
+
+
+def multiply(left, right):
+    """
+    Multiplies the operands byte by byte, modulo 256, like Byte.__mul__.
+    """
+    return _wrapping(left, right, operator.mul, numpy.multiply if HAS_NUMPY else None)
+
+
+def _comparison(left, right, function, numpy_function):
+    """
+    Compares the operands byte by byte.
+    :param function: the comparison of two ints.
+    :param numpy_function: the NumPy ufunc of the comparison.
+    """
+    left, right, left_is_scalar, right_is_scalar = _operands(left, right)
+    if HAS_NUMPY:
+        scalar: int = left if left_is_scalar else right
+        if (left_is_scalar or right_is_scalar) and not 0 <= scalar <= 0xFF:
+            # the scalar cannot be represented as a uint8, so every byte compares the same way
+            sequence = right if left_is_scalar else left
+            outcome: bool = function(scalar, 0) if left_is_scalar else function(0, scalar)
+            return numpy.full(len(sequence), outcome, dtype=bool)
+        return numpy_function(left, right)
+
+    if left_is_scalar:
+        return _translate(right, lambda value: function(left, value))
+    if right_is_scalar:
+        return _translate(left, lambda value: function(value, right))
+    return bytearray(map(function, left, right))
+
+
+def less(left, right):
+    """
+    The mask of the bytes of the left operand lower than the right operand, like Byte.__lt__.
+    """
+    return _comparison(left, right, operator.lt, numpy.less if HAS_NUMPY else None)
+
+
+def less_equal(left, right):
+    """
+    The mask of the bytes of the left operand lower than or equal to the right operand, like Byte.__le__.
+    """
+    return _comparison(left, right, operator.le, numpy.less_equal if HAS_NUMPY else None)
+
+
+def greater(left, right):
+    """
+    The mask of the bytes of the left operand greater than the right operand, like Byte.__gt__.
+    """
+    return _comparison(left, right, operator.gt, numpy.greater if HAS_NUMPY else None)
+
+
+def greater_equal(left, right):
+    """
+    The mask of the bytes of the left operand greater than or equal to the right operand, like Byte.__ge__.
+    """
+    return _comparison(left, right, operator.ge, numpy.greater_equal if HAS_NUMPY else None)
+
+
+def _equality_operand(value):
+    """
+    Byte.__eq__ compares a string with the eight-character string of bits of the byte,
+    so a string which is not such a string is never equal to a byte: it is mapped to -1.
+    """
+    if isinstance(value, str):
+        byte: Byte = Byte.from_str(value)
+        return int(byte) if str(byte) == value else -1
+    return value
+
+
+def equal(left, right):
+    """
+    The mask of the bytes of the left operand equal to the right operand, like Byte.__eq__.
+    """
+    return _comparison(_equality_operand(left), _equality_operand(right),
+                        operator.eq, numpy.equal if HAS_NUMPY else None)
+
+
+def not_equal(left, right):
+    """
+    The mask of the bytes of the left operand different from the right operand, like Byte.__ne__.
+    """
+    return _comparison(_equality_operand(left), _equality_operand(right),
+                        operator.ne, numpy.not_equal if HAS_NUMPY else None)
+
+
+def bit(sequence, index) -> object:
+    """
+    Extracts the bit at the given index of every byte, like Byte.__getitem__.
+    :param sequence: the sequence of bytes.
+    :param index: the index of the bit, from 0 (the first, least significant bit) to 7 (the eighth bit),
+    given as an int, a str or a Byte.
+    :return: the bits, 0 or 1, of every byte.
+    """
+    shift: int = int(index)
+    if not 0 <= shift < 8:
+        raise IndexError("Byte bit index out of range")
+    is_scalar, values = _operand(sequence)
+    if is_scalar:
+        raise TypeError("the operand of a bulk operation must be a sequence of bytes")
+    if HAS_NUMPY:
+        return (values >> numpy.uint8(shift)) & numpy.uint8(1)
+    return _translate(values, lambda value: (value >> shift) & 1)
+
+
+def _store(result, out):
+    """
+    Copies the result of a bitwise operation into out, if given.
+    :return: out if it is given, the result otherwise.
+    """
+    if out is None:
+        return result
+    if HAS_NUMPY and isinstance(out, numpy.ndarray):
+        out[...] = result
+    else:
+        as_memoryview(out)[:] = as_memoryview(result)
+    return out
+
+
+def _bitwise(left, right, function, numpy_function, out):
+    """
+    Applies a bitwise operation to the operands. Two sequences are combined word-wide,
+    as two ints built with int.from_bytes.
+    :param function: the operation on two ints.
+    :param numpy_function: the NumPy ufunc of the operation.
+    """
+    left, right, left_is_scalar, right_is_scalar = _operands(left, right)
+    if HAS_NUMPY:
+        if left_is_scalar:
+            left = numpy.uint8(left & 0xFF)
+        if right_is_scalar:
+            right = numpy.uint8(right & 0xFF)
+        if out is not None and isinstance(out, numpy.ndarray):
+            return numpy_function(left, right, out=out)
+        return _store(numpy_function(left, right), out)
+
+    if left_is_scalar:
+        return _store(_translate(right, lambda value: function(left, value)), out)
+    if right_is_scalar:
+        return _store(_translate(left, lambda value: function(value, right)), out)
+    result: int = function(int.from_bytes(left, "little"), int.from_bytes(right, "little"))
+    return _store(bytearray(result.to_bytes(len(left), "little")), out)
+
+
+def bitwise_and(left, right, out=None):
+    """
+    The bitwise and of the operands, byte by byte, like Byte.__and__.
+    """
+    return _bitwise(left, right, operator.and_, numpy.bitwise_and if HAS_NUMPY else None, out)
+
+
+def bitwise_or(left, right, out=None):
+    """
+    The bitwise or of the operands, byte by byte, like Byte.__or__.
+    """
+    return _bitwise(left, right, operator.or_, numpy.bitwise_or if HAS_NUMPY else None, out)
+
+
+def bitwise_xor(left, right, out=None):
+    """
+    The bitwise exclusive or of the operands, byte by byte, like Byte.__xor__.
+    """
+    return _bitwise(left, right, operator.xor, numpy.bitwise_xor if HAS_NUMPY else None, out)
+
+
+def _per_byte(sequence, function, numpy_function, out):
+    """
+    Applies an operation on single bytes to every byte of the sequence.
+    :param function: the operation on an int between 0 and 255, used to build a translation table.
+    :param numpy_function: the same operation on a uint8 NumPy array.
+    """
+    is_scalar, values = _operand(sequence)
+    if is_scalar:
+        raise TypeError("the operand of a bulk operation must be a sequence of bytes")
+    if HAS_NUMPY:
+        return _store(numpy_function(values).astype(numpy.uint8, copy=False), out)
+    return _store(_translate(values, function), out)
+
+
+def invert(sequence, out=None):
+    """
+    Inverts every bit of every byte, like Byte.__invert__.
+    """
+    return _per_byte(sequence, lambda value: value ^ 0xFF,
+                     lambda values: numpy.invert(values), out)
+
+
+def _count(count) -> int:
+    count = int(count)
+    if count < 0:
+        raise ValueError("negative shift count")
+    return min(count, 8)
+
+
+def shift_left(sequence, count, out=None):
+    """
+    Shifts the bits of every byte towards its eighth bit, like Byte.__lshift__.
+    The bits do not move from one byte to another.
+    """
+    count = _count(count)
+    return _per_byte(sequence, lambda value: value << count,
+                     lambda values: numpy.left_shift(values, numpy.uint8(count)) if count < 8
+                     else numpy.zeros_like(values), out)
+
+
+def shift_right(sequence, count, out=None):
+    """
+    Shifts the bits of every byte towards its first bit, like Byte.__rshift__.
+    The bits do not move from one byte to another.
+    """
+    count = _count(count)
+    return _per_byte(sequence, lambda value: value >> count,
+                     lambda values: numpy.right_shift(values, numpy.uint8(count)) if count < 8
+                     else numpy.zeros_like(values), out)
+
+
+def rotate_left(sequence, count=1, out=None):
+    """
+    Rotates the bits of every byte towards its eighth bit, like Byte.rotate_left.
+    """
+    count = int(count) % 8
+    return _per_byte(sequence, lambda value: (value << count) | (value >> (8 - count)),
+                     lambda values: numpy.left_shift(values, numpy.uint8(count))
+                     | numpy.right_shift(values, numpy.uint8(8 - count)) if count
+                     else values.copy(), out)
+
+
+def rotate_right(sequence, count=1, out=None):
+    """
+    Rotates the bits of every byte towards its first bit, like Byte.rotate_right.
+    """
+    return rotate_left(sequence, 8 - int(count) % 8, out)
+
+
+def reverse_bits(sequence, out=None):
+    """
+    Reverses the order of the bits of every byte, like Byte.reverse_bits.
+    """
+    return _per_byte(sequence, REVERSED_BITS_TABLE.__getitem__,
+                     lambda values: numpy.frombuffer(REVERSED_BITS_TABLE, dtype=numpy.uint8)[values], out)
+
+
+def popcounts(sequence):
+    """
+    The number of bits set to 1 in every byte, like Byte.popcount.
+    """
+    return _per_byte(sequence, POPCOUNT_TABLE.__getitem__,
+                     lambda values: numpy.frombuffer(POPCOUNT_TABLE, dtype=numpy.uint8)[values], None)
+
+
+def parities(sequence):
+    """
+    The parity of every byte, like Byte.parity.
+    """
+    return _per_byte(sequence, PARITY_TABLE.__getitem__,
+                     lambda values: numpy.frombuffer(PARITY_TABLE, dtype=numpy.uint8)[values], None)
+
+
+def _chunks(sequence):
+    """
+    Cuts a sequence of bytes into memoryviews of CHUNK_SIZE bytes.
+    """
+    view: memoryview = as_memoryview(sequence)
+    for start in range(0, len(view), CHUNK_SIZE):
+        yield view[start:start + CHUNK_SIZE]
+
+
+def popcount(sequence) -> int:
+    """
+    Counts the bits set to 1 in a whole sequence of bytes, chunk by chunk.
+    :param sequence: a ByteArray, any object supporting the buffer protocol or an iterable of Byte and int.
+    :return: the total number of bits set to 1.
+    """
+    return sum(int.from_bytes(chunk, "little").bit_count() for chunk in _chunks(sequence))
+
+
+def popcount_histogram(sequence) -> list[int]:
+    """
+    Counts the bytes of a whole sequence by their number of bits set to 1, chunk by chunk.
+    :param sequence: a ByteArray, any object supporting the buffer protocol or an iterable of Byte and int.
+    :return: a list of 9 counts: the number of bytes with no bit set, one bit set... up to eight bits set.
+    """
+    histogram: list[int] = [0] * 9
+    if HAS_NUMPY:
+        table = numpy.frombuffer(POPCOUNT_TABLE, dtype=numpy.uint8)
+        for chunk in _chunks(sequence):
+            counts = numpy.bincount(table[numpy.frombuffer(chunk, dtype=numpy.uint8)], minlength=9)
+            for count, total in enumerate(counts.tolist()):
+                histogram[count] += total
+        return histogram
+
+    for chunk in _chunks(sequence):
+        counts: bytes = chunk.tobytes().translate(POPCOUNT_TABLE)
+        for count in range(9):
+            histogram[count] += counts.count(count)
+    return histogram
@@ -38,78 +38,47 @@
 
 from __future__ import annotations
 
+from typing import NamedTuple
+
+
+class ArithmeticResult(NamedTuple):
+    """
+    The result of an arithmetic operation on bytes or words together with its flags.
+
+    Attributes\:
+            value: the result wrapped around to the width of the operation: the interned Byte holding
+            the result modulo 256 for bytes, a BinaryInt of the same width for words.\n
+            carry: True if the unsigned result did not fit in the width.
+            For a subtraction, this is the borrow.\n
+            overflow: True if the result did not fit in the width when the operands
+            are read as two's complement signed integers.
+    """
+
+    value: Byte
+    carry: bool
+    overflow: bool
+
 
 class Byte:
     """
     An 8-bit byte which represents an unsigned integer value. Uses little endian representation.
 
+    The bits are not stored individually: the unsigned integer value is the only source of truth
+    and each bit is read and written through its mask (1 for the first bit up to 128 for the eighth).
+
     Attributes\:
-            __first_bit: a boolean representing the least significant bit
-            (the eighth most significant bit) in the byte.
-            It represents the 2⁰ (1) value of the byte. True if the bit is 1. False if the bit is 0.\n
-            __second_bit: a boolean representing the second least significant bit
-            (the seventh most significant bit) in the byte.
-            It represents the 2¹ (2) value of the byte. True if the bit is 1. False if the bit is 0.\n
-            __third_bit: a boolean representing the third least significant bit
-            (the sixth most significant bit) in the byte.
-            It represents the 2² (4) value of the byte. True if the bit is 1. False if the bit is 0.\n
-            __forth_bit: a boolean representing the forth least significant bit
-            (the fifth most significant bit) in the byte.
-            It represents the 2³ (8) value of the byte. True if the bit is 1. False if the bit is 0.\n
-            __fifth_bit: a boolean representing the fifth least significant bit
-            (the forth most significant bit) in the byte.
-            It represents the 2⁴ (16) value of the byte. True if the bit is 1. False if the bit is 0.\n
-            __sixth_bit: a boolean representing the sixth least significant bit
-            (the third most significant bit) in the byte.
-            It represents the 2⁵ (32) value of the byte. True if the bit is 1. False if the bit is 0.\n
-            __seventh_bit: a boolean representing the seventh least significant bit
-            (the second most significant bit) in the byte.
-            It represents the 2⁶ (64) value of the byte. True if the bit is 1. False if the bit is 0.\n
-            __eighth_bit: a boolean representing the eighth least significant bit
-            (the most significant bit) in the byte.
-            It represents the 2⁷ (128) value of the byte. True if the bit is 1. False if the bit is 0.
-
-            __byte_value_zero: a Byte representing the integer value 0 (0000 0000).
-            This value is used in methods and may be uninitialized. Use at your own risks.\n
-            __byte_value_one: a Byte representing the integer value 1 (0000 0001)
-            This value is used in methods and may be uninitialized. Use at your own risks.\n
-            __byte_value_two: a Byte representing the integer value 3 (0000 0010)
-            This value is used in methods and may be uninitialized. Use at your own risks.\n
-            __byte_value_three: a Byte representing the integer value 4 (0000 0100)
-            This value is used in methods and may be uninitialized. Use at your own risks.\n
-            __byte_value_four: a Byte representing the integer value 5 (0000 0101)
-            This value is used in methods and may be uninitialized. Use at your own risks.\n
-            __byte_value_five: a Byte representing the integer value 6 (0000 0110)
-            This value is used in methods and may be uninitialized. Use at your own risks.\n
-            __byte_value_six: a Byte representing the integer value 7 (0000 0111)
-            This value is used in methods and may be uninitialized. Use at your own risks.\n
-
-            __value: an unsigned integer representing the current integer value of the byte.\n
-            __char: a string containing the current extended ASCII
-            character represented by the integer the byte is representing.
-            The string contains only this character and no other characters.
+            __value: an unsigned integer between 0 and 255 included representing the current integer
+            value of the byte. Its least significant bit is the first bit of the byte and its most
+            significant bit is the eighth bit of the byte.\n
+            __frozen: a boolean which is True if the byte is immutable. The interned bytes returned by
+            the factory methods (from_int, from_str, from_char) and by the arithmetic operators are
+            shared between all their users and are therefore frozen. Use from_byte to get a mutable copy.
     """
 
-    __first_bit: bool
-    __second_bit: bool
-    __third_bit: bool
-    __forth_bit: bool
-    __fifth_bit: bool
-    __sixth_bit: bool
-    __seventh_bit: bool
-    __eighth_bit: bool
-
-    __byte_value_zero: Byte
-    __byte_value_one: Byte
-    __byte_value_two: Byte
-    __byte_value_three: Byte
-    __byte_value_four: Byte
-    __byte_value_five: Byte
-    __byte_value_six: Byte
-    __byte_value_seven: Byte
+    __slots__ = ("__value", "__frozen")
 
     __value: int
-    __char: str
+    __frozen: bool
 
     def __init__(self, first_bit: bool = False, second_bit: bool = False, third_bit: bool = False,
                  forth_bit: bool = False, fifth_bit: bool = False, sixth_bit: bool = False,
@@ -129,104 +98,128 @@ class Byte:
         :param seventh_bit: True if the value is 1 or False if the value is 0. The default value is 0. In decimal, this value is 64 (2⁶).
         :param eighth_bit: True if the value is 1 or False if the value is 0. The default value is 0. In decimal, this value is 128 (2⁷).
         """
-        # assign the bit values
-        self.__first_bit = first_bit
-        self.__second_bit = second_bit
-        self.__third_bit = third_bit
-        self.__forth_bit = forth_bit
-        self.__fifth_bit = fifth_bit
-        self.__sixth_bit = sixth_bit
-        self.__seventh_bit = seventh_bit
-        self.__eighth_bit = eighth_bit
-
-        # compute the unsigned integer represented by the byte
-        self.__value = self.__compute_int()
-
-        # compute the extended ASCII character represented
-        # by the unsigned integer value represented by the byte.
-        self.__char = chr(self.__value)
-
-    def __compute_int(self) -> int:
+        # compute the unsigned integer represented by the bits
+        value: int = 0
+        if first_bit:
+            value |= 1
+        if second_bit:
+            value |= 2
+        if third_bit:
+            value |= 4
+        if forth_bit:
+            value |= 8
+        if fifth_bit:
+            value |= 16
+        if sixth_bit:
+            value |= 32
+        if seventh_bit:
+            value |= 64
+        if eighth_bit:
+            value |= 128
+        self.__value = value
+
+        # bytes created through the constructor are mutable,
+        # only the interned bytes of the flyweight table are frozen.
+        self.__frozen = False
+
+    @classmethod
+    def __from_value(cls, number: int, frozen: bool) -> Byte:
         """
-        Computes the unsigned integer the byte represents in decimal.
-        :return: The int object which represents the decimal unsigned integer represented by the byte.
+        Creates a byte directly from its unsigned integer value, without going through the bits.
+        :param number: the unsigned integer between 0 and 255 included represented by the byte.
+        :param frozen: True if the new byte must be immutable.
+        :return: a new Byte representing the given value.
         """
-        total: int = 0
-        total += self.__first_bit * 1
-        total += self.__second_bit * 2
-        total += self.__third_bit * 4
-        total += self.__forth_bit * 8
-        total += self.__fifth_bit * 16
-        total += self.__sixth_bit * 32
-        total += self.__seventh_bit * 64
-        total += self.__eighth_bit * 128
+        byte: Byte = object.__new__(cls)
+        byte.__value = number
+        byte.__frozen = frozen
+        return byte
 
-        return total
+    @classmethod
+    def _new_interned(cls, number: int) -> Byte:
+        """
+        Creates the frozen byte stored in the flyweight table for the given value.
+        This is only meant to be used to build the table once, at import.
+        :param number: the unsigned integer between 0 and 255 included represented by the byte.
+        :return: a new frozen Byte representing the given value.
+        """
+        return cls.__from_value(number & 0xFF, True)
 
     @staticmethod
     def from_int(number: int) -> Byte:
-        first_bit: int = number & 1
-        second_bit = (number >> 1) & 1
-        third_bit: int = (number >> 2) & 1
-        forth_bit: int = (number >> 3) & 1
-        fifth_bit: int = (number >> 4) & 1
-        sixth_bit: int = (number >> 5) & 1
-        seventh_bit: int = (number >> 6) & 1
-        eighth_bit: int = (number >> 7) & 1
-
-        first_bit_bool: bool = first_bit == 1
-        second_bit_bool: bool = second_bit == 1
-        third_bit_bool: bool = third_bit == 1
-        forth_bit_bool: bool = forth_bit == 1
-        fifth_bit_bool: bool = fifth_bit == 1
-        sixth_bit_bool: bool = sixth_bit == 1
-        seventh_bit_bool: bool = seventh_bit == 1
-        eighth_bit_bool: bool = eighth_bit == 1
-
-        return Byte(first_bit_bool, second_bit_bool, third_bit_bool, forth_bit_bool,
-                    fifth_bit_bool, sixth_bit_bool, seventh_bit_bool, eighth_bit_bool)
+        """
+        Gets the interned byte representing the given integer.
+        Only the eight least significant bits of the integer are kept.
+        :param number: the integer to represent.
+        :return: the shared, frozen Byte of the flyweight table representing the value.
+        """
+        return _INTERNED_BYTES[number & 0xFF]
 
     @staticmethod
-    def from_str(string: str):
-        str_len: int = len(string)
-        first_bit: bool = False
-        second_bit: bool = False
-        third_bit: bool = False
-        forth_bit: bool = False
-        fifth_bit: bool = False
-        sixth_bit: bool = False
-        seventh_bit: bool = False
-        eighth_bit: bool = False
-
-        if str_len > 0:
-            first_bit = string[0] == "1"
-        if str_len > 1:
-            second_bit = string[1] == "1"
-        if str_len > 2:
-            third_bit = string[2] == "1"
-        if str_len > 3:
-            forth_bit = string[3] == "1"
-        if str_len > 4:
-            fifth_bit = string[4] == "1"
-        if str_len > 5:
-            sixth_bit = string[5] == "1"
-        if str_len > 6:
-            seventh_bit = string[6] == "1"
-        if str_len > 7:
-            eighth_bit = string[7] == "1"
-
-        return Byte(first_bit, second_bit, third_bit, forth_bit,
-                    fifth_bit, sixth_bit, seventh_bit, eighth_bit)
+    def from_str(string: str) -> Byte:
+        """
+        Gets the interned byte represented by the given string of bits. The string uses
+        little endian representation: its first character is the least significant bit.
+        Each '1' character is a set bit, any other character is an unset bit and
+        missing characters are unset bits. Characters after the eighth are ignored.
+        :param string: the string of bits to parse.
+        :return: the shared, frozen Byte of the flyweight table represented by the string.
+        """
+        byte: Byte | None = _INTERNED_BYTES_BY_STR.get(string)
+        if byte is not None:
+            return byte
+
+        number: int = 0
+        for index, char in enumerate(string[:8]):
+            if char == "1":
+                number |= 1 << index
+
+        return _INTERNED_BYTES[number]
 
     @staticmethod
     def from_char(char: str) -> Byte:
-        char_ord: int = ord(char)
-        return Byte.from_int(char_ord)
+        """
+        Gets the interned byte representing the code point of the given character.
+        :param char: a string containing a single extended ASCII character.
+        :return: the shared, frozen Byte of the flyweight table representing the character.
+        """
+        return _INTERNED_BYTES[ord(char) & 0xFF]
 
     @staticmethod
     def from_byte(byte: Byte) -> Byte:
-        return Byte(byte.__first_bit, byte.__second_bit, byte.__third_bit, byte.__forth_bit,
-                    byte.__fifth_bit, byte.__sixth_bit, byte.__seventh_bit, byte.__eighth_bit)
+        """
+        Creates a new mutable copy of the given byte.
+        :param byte: the byte to copy. It may be frozen.
+        :return: a new, mutable Byte with the same bits as the given byte.
+        """
+        return Byte.__from_value(byte.__value, False)
+
+    @property
+    def frozen(self) -> bool:
+        return self.__frozen
+
+    def freeze(self) -> Byte:
+        """
+        Gets the frozen equivalent of the byte, which can be used in sets and as a dictionary key.
+        :return: the byte itself if it is frozen, the interned Byte of the same value otherwise.
+        """
+        return _INTERNED_BYTES[self.__value]
+
+    def __ensure_mutable(self) -> None:
+        if self.__frozen:
+            raise TypeError("an interned Byte is immutable, use Byte.from_byte() to get a mutable copy")
+
+    def __set_bit(self, mask: int, new_value: bool) -> None:
+        """
+        Sets or clears the bit selected by the mask.
+        :param mask: the mask of the bit, a power of two between 1 and 128 included.
+        :param new_value: True to set the bit to 1, False to set it to 0.
+        """
+        self.__ensure_mutable()
+        if new_value:
+            self.__value |= mask
+        else:
+            self.__value &= ~mask & 0xFF
 
     @staticmethod
     def __transform_int_to_bool(number: int) -> bool:
@@ -244,213 +237,206 @@ class Byte:
 
     @property
     def first_bit(self) -> bool:
-        return self.__first_bit
+        return self.__value & 1 != 0
 
     @first_bit.setter
     def first_bit(self, new_value: bool):
-        self.__first_bit = new_value
+        self.__set_bit(1, new_value)
 
     @property
     def first_bit_int(self) -> int:
-        return Byte.__convert_bool_to_int(self.__first_bit)
+        return (self.__value >> 0) & 1
 
     @first_bit_int.setter
     def first_bit_int(self, new_value: int):
-        self.__first_bit = Byte.__transform_int_to_bool(new_value)
+        self.__set_bit(1, Byte.__transform_int_to_bool(new_value))
 
     @property
     def first_bit_str(self) -> str:
-        return Byte.__convert_bool_to_str(self.__first_bit)
+        return _BIT_CHARS[(self.__value >> 0) & 1]
 
     @first_bit_str.setter
     def first_bit_str(self, new_value: str):
-        self.__first_bit = Byte.__transform_str_to_bool(new_value)
+        self.__set_bit(1, Byte.__transform_str_to_bool(new_value))
 
     @property
     def second_bit(self) -> bool:
-        return self.__second_bit
+        return self.__value & 2 != 0
 
     @second_bit.setter
     def second_bit(self, new_value: bool):
-        self.__second_bit = new_value
+        self.__set_bit(2, new_value)
 
     @property
     def second_bit_int(self) -> int:
-        return Byte.__convert_bool_to_int(self.__second_bit)
+        return (self.__value >> 1) & 1
 
     @second_bit_int.setter
     def second_bit_int(self, new_value: int):
-        self.__second_bit = Byte.__transform_int_to_bool(new_value)
+        self.__set_bit(2, Byte.__transform_int_to_bool(new_value))
 
     @property
     def second_bit_str(self) -> str:
-        return Byte.__convert_bool_to_str(self.__second_bit)
+        return _BIT_CHARS[(self.__value >> 1) & 1]
 
     @second_bit_str.setter
     def second_bit_str(self, new_value: str):
-        self.__second_bit = Byte.__transform_str_to_bool(new_value)
+        self.__set_bit(2, Byte.__transform_str_to_bool(new_value))
 
     @property
     def third_bit(self) -> bool:
-        return self.__third_bit
+        return self.__value & 4 != 0
 
     @third_bit.setter
     def third_bit(self, new_value: bool):
-        self.__third_bit = new_value
+        self.__set_bit(4, new_value)
 
     @property
     def third_bit_int(self) -> int:
-        return Byte.__convert_bool_to_int(self.__third_bit)
+        return (self.__value >> 2) & 1
 
     @third_bit_int.setter
     def third_bit_int(self, new_value: int):
-        self.__third_bit = Byte.__transform_int_to_bool(new_value)
+        self.__set_bit(4, Byte.__transform_int_to_bool(new_value))
 
     @property
     def third_bit_str(self) -> str:
-        return Byte.__convert_bool_to_str(self.__third_bit)
+        return _BIT_CHARS[(self.__value >> 2) & 1]
 
     @third_bit_str.setter
     def third_bit_str(self, new_value: str):
-        self.__third_bit = Byte.__transform_str_to_bool(new_value)
+        self.__set_bit(4, Byte.__transform_str_to_bool(new_value))
 
     @property
     def forth_bit(self) -> bool:
-        return Byte.__forth_bit
+        return self.__value & 8 != 0
 
     @forth_bit.setter
     def forth_bit(self, new_value: bool):
-        self.__forth_bit = new_value
+        self.__set_bit(8, new_value)
 
     @property
     def forth_bit_int(self) -> int:
-        return Byte.__convert_bool_to_int(self.__forth_bit)
+        return (self.__value >> 3) & 1
 
     @forth_bit_int.setter
     def forth_bit_int(self, new_value: int):
-        self.__forth_bit = Byte.__transform_int_to_bool(new_value)
+        self.__set_bit(8, Byte.__transform_int_to_bool(new_value))
 
     @property
     def forth_bit_str(self) -> str:
-        return Byte.__convert_bool_to_str(self.__forth_bit)
+        return _BIT_CHARS[(self.__value >> 3) & 1]
 
     @forth_bit_str.setter
     def forth_bit_str(self, new_value: str):
-        self.__forth_bit = Byte.__transform_str_to_bool(new_value)
+        self.__set_bit(8, Byte.__transform_str_to_bool(new_value))
 
     @property
     def fifth_bit(self) -> bool:
-        return Byte.__fifth_bit
+        return self.__value & 16 != 0
 
     @fifth_bit.setter
     def fifth_bit(self, new_value: bool):
-        self.__fifth_bit = new_value
+        self.__set_bit(16, new_value)
 
     @property
     def fifth_bit_int(self) -> int:
-        return Byte.__convert_bool_to_int(self.__fifth_bit)
+        return (self.__value >> 4) & 1
 
     @fifth_bit_int.setter
     def fifth_bit_int(self, new_value: int):
-        self.__fifth_bit = Byte.__transform_int_to_bool(new_value)
+        self.__set_bit(16, Byte.__transform_int_to_bool(new_value))
 
     @property
     def fifth_bit_str(self) -> str:
-        return Byte.__convert_bool_to_str(self.__fifth_bit)
+        return _BIT_CHARS[(self.__value >> 4) & 1]
 
     @fifth_bit_str.setter
     def fifth_bit_str(self, new_value: str):
-        self.__fifth_bit = Byte.__transform_str_to_bool(new_value)
+        self.__set_bit(16, Byte.__transform_str_to_bool(new_value))
 
     @property
     def sixth_bit(self) -> bool:
-        return Byte.__sixth_bit
+        return self.__value & 32 != 0
 
     @sixth_bit.setter
     def sixth_bit(self, new_value: bool):
-        self.__sixth_bit = new_value
+        self.__set_bit(32, new_value)
 
     @property
     def sixth_bit_int(self) -> int:
-        return Byte.__convert_bool_to_int(self.__sixth_bit)
+        return (self.__value >> 5) & 1
 
     @sixth_bit_int.setter
     def sixth_bit_int(self, new_value: int):
-        self.__sixth_bit = Byte.__transform_int_to_bool(new_value)
+        self.__set_bit(32, Byte.__transform_int_to_bool(new_value))
 
     @property
     def sixth_bit_str(self) -> str:
-        return Byte.__convert_bool_to_str(self.__sixth_bit)
+        return _BIT_CHARS[(self.__value >> 5) & 1]
 
     @sixth_bit_str.setter
     def sixth_bit_str(self, new_value: str):
-        self.__sixth_bit = Byte.__transform_str_to_bool(new_value)
+        self.__set_bit(32, Byte.__transform_str_to_bool(new_value))
 
     @property
     def seventh_bit(self) -> bool:
-        return Byte.__seventh_bit
+        return self.__value & 64 != 0
 
     @seventh_bit.setter
     def seventh_bit(self, new_value: bool):
-        self.__seventh_bit = new_value
+        self.__set_bit(64, new_value)
 
     @property
     def seventh_bit_int(self) -> int:
-        return Byte.__convert_bool_to_int(self.__seventh_bit)
+        return (self.__value >> 6) & 1
 
     @seventh_bit_int.setter
     def seventh_bit_int(self, new_value: int):
-        self.__seventh_bit = Byte.__transform_int_to_bool(new_value)
+        self.__set_bit(64, Byte.__transform_int_to_bool(new_value))
 
     @property
     def seventh_bit_str(self) -> str:
-        return Byte.__convert_bool_to_str(self.__seventh_bit)
+        return _BIT_CHARS[(self.__value >> 6) & 1]
 
     @seventh_bit_str.setter
     def seventh_bit_str(self, new_value: str):
-        self.__seventh_bit = Byte.__transform_str_to_bool(new_value)
+        self.__set_bit(64, Byte.__transform_str_to_bool(new_value))
 
     @property
     def eighth_bit(self) -> bool:
-        return Byte.__eighth_bit
+        return self.__value & 128 != 0
 
     @eighth_bit.setter
     def eighth_bit(self, new_value: bool):
-        self.__eighth_bit = new_value
+        self.__set_bit(128, new_value)
 
     @property
     def eighth_bit_int(self) -> int:
-        return Byte.__convert_bool_to_int(self.__eighth_bit)
+        return (self.__value >> 7) & 1
 
     @eighth_bit_int.setter
     def eighth_bit_int(self, new_value: int):
-        self.__eighth_bit = Byte.__transform_int_to_bool(new_value)
+        self.__set_bit(128, Byte.__transform_int_to_bool(new_value))
 
     @property
     def eighth_bit_str(self) -> str:
-        return Byte.__convert_bool_to_str(self.__eighth_bit)
+        return _BIT_CHARS[(self.__value >> 7) & 1]
 
     @eighth_bit_str.setter
     def eighth_bit_str(self, new_value: str):
-        self.__eighth_bit = Byte.__transform_str_to_bool(new_value)
-
-    @staticmethod
-    def __convert_bool_to_str(bool_value: bool) -> str:
-        if bool_value:
-            return "1"
-        else:
-            return "0"
+        self.__set_bit(128, Byte.__transform_str_to_bool(new_value))
 
-    @staticmethod
-    def __convert_bool_to_int(bool_value: bool) -> int:
-        if bool_value:
-            return 1
-        else:
-            return 0
+    @property
+    def char(self) -> str:
+        """
+        The extended ASCII character represented by the unsigned integer value of the byte.
+        It is computed on access.
+        """
+        return chr(self.__value)
 
     def __str__(self) -> str:
-        return f"{self.first_bit_str}{self.second_bit_str}{self.third_bit_str}{self.forth_bit_str}" \
-               f"{self.fifth_bit_str}{self.sixth_bit_str}{self.seventh_bit_str}{self.eighth_bit_str}"
+        return BIT_STRINGS[self.__value]
 
     def __int__(self) -> int:
         return self.__value
@@ -461,97 +447,26 @@ class Byte:
     def __len__(self) -> int:
         return 8
 
-    def __initialize_if_uninitialized_predefined_byte_values(self):
-        if self.__byte_value_zero is None:
-            self.__byte_value_zero = Byte()
-            self.__byte_value_one = Byte(True)
-            self.__byte_value_two = Byte(second_bit=True)
-            self.__byte_value_three = Byte(True, True)
-            self.__byte_value_four = Byte(third_bit=True)
-            self.__byte_value_five = Byte(True, third_bit=True)
-            self.__byte_value_six = Byte(second_bit=True, third_bit=True)
-            self.__byte_value_seven = Byte(True, True, True)
+    @staticmethod
+    def __bit_index(item) -> int:
+        """
+        Converts a bit index given as an int, a str or a Byte into an int
+        between 0 (the first bit) and 7 (the eighth bit) included.
+        """
+        if isinstance(item, Byte):
+            index: int = item.__value
+        else:
+            index: int = int(item)
+        if not 0 <= index < 8:
+            raise IndexError("Byte bit index out of range")
+        return index
 
     def __getitem__(self, item) -> int:
-        self.__initialize_if_uninitialized_predefined_byte_values()
-        if isinstance(item, int):
-            if item == 0:
-                return self.first_bit_int
-            elif item == 1:
-                return self.second_bit_int
-            elif item == 2:
-                return self.third_bit_int
-            elif item == 3:
-                return self.forth_bit_int
-            elif item == 4:
-                return self.fifth_bit_int
-            elif item == 5:
-                return self.sixth_bit_int
-            elif item == 6:
-                return self.seventh_bit_int
-            elif item == 7:
-                return self.eighth_bit_int
-        elif isinstance(item, Byte):
-            if item == self.__byte_value_zero:
-                return self.first_bit_int
-            elif item == self.__byte_value_one:
-                return self.second_bit_int
-            elif item == self.__byte_value_two:
-                return self.third_bit_int
-            elif item == self.__byte_value_three:
-                return self.forth_bit_int
-            elif item == self.__byte_value_four:
-                return self.fifth_bit_int
-            elif item == self.__byte_value_five:
-                return self.sixth_bit_int
-            elif item == self.__byte_value_six:
-                return self.seventh_bit_int
-            elif item == self.__byte_value_seven:
-                return self.eighth_bit_int
-        elif isinstance(item, str):
-            int_value: int = int(item)
-            return self.__getitem__(int_value)
+        return (self.__value >> Byte.__bit_index(item)) & 1
 
     def __setitem__(self, key, value):
         if isinstance(value, bool):
-            self.__initialize_if_uninitialized_predefined_byte_values()
-            if isinstance(key, int):
-                if key == 0:
-                    self.first_bit = value
-                elif key == 1:
-                    self.second_bit = value
-                elif key == 2:
-                    self.third_bit = value
-                elif key == 3:
-                    self.forth_bit = value
-                elif key == 4:
-                    self.fifth_bit = value
-                elif key == 5:
-                    self.sixth_bit = value
-                elif key == 6:
-                    self.seventh_bit = value
-                elif key == 7:
-                    self.eighth_bit = value
-            elif isinstance(key, Byte):
-                if key == self.__byte_value_zero:
-                    self.first_bit = value
-                elif key == self.__byte_value_one:
-                    self.second_bit = value
-                elif key == self.__byte_value_two:
-                    self.third_bit = value
-                elif key == self.__byte_value_three:
-                    self.forth_bit = value
-                elif key == self.__byte_value_four:
-                    self.fifth_bit = value
-                elif key == self.__byte_value_five:
-                    self.sixth_bit = value
-                elif key == self.__byte_value_six:
-                    self.seventh_bit = value
-                elif key == self.__byte_value_seven:
-                    self.eighth_bit = value
-            else:
-                value_int: int = int(value)
-                self.__setitem__(key, value_int)
+            self.__set_bit(1 << Byte.__bit_index(key), value)
         elif isinstance(value, int):
             value_bool: bool = self.__transform_int_to_bool(value)
             self.__setitem__(key, value_bool)
@@ -582,89 +497,284 @@ class Byte:
         to the standard error stream.
         """
         if isinstance(other, Byte):
-            # the current carry, initialized at 0
-            current_carry: int = 0
-            addition_byte: Byte = Byte()
-            for i in range(8):
-                # gather the binary values at the current index
-                # from the current object as well as the passed object
-                self_value_at_position: int = self[i]
-                other_value_at_position: int = other[i]
-                # compute total amount at position
-                sum_value: int = current_carry + self_value_at_position + other_value_at_position
-                # adjust carry depending on sum. The sum can be 0, 1, 2 or 3.
-                # The carry must be 1 for integral values 2 (10) and 3 (11)
-                # and 0 for integral values 0 (00) and 1 (01)
-                if sum_value > 1:
-                    current_carry = 1
-                else:
-                    current_carry = 0
-
-                # the final value to set in place of the old value.
-                # Since the possible values are 0 (00), 1 (01), 2 (10) and 3 (11),
-                # the final value must be 1 if the value is 1 (01) or 3 (11).
-                # The final value must be 0 if the value is 0 (00) or 2 (10).
-                final_value: int
-                if sum_value == 1 or sum_value == 3:
-                    final_value = 1
-                else:
-                    final_value = 0
-
-                # the calculated final value to set in place is set in place.
-                addition_byte[i] = final_value
-
-            return addition_byte
+            return _INTERNED_BYTES[(self.__value + other.__value) & 0xFF]
+        return _INTERNED_BYTES[(self.__value + Byte.__operand_to_int(other)) & 0xFF]
 
-        elif isinstance(other, int):
-            total: int = self.__value + other
-            byte: Byte = Byte.from_int(total)
-            return byte
+    def __radd__(self, other) -> Byte:
+        return _INTERNED_BYTES[(Byte.__operand_to_int(other) + self.__value) & 0xFF]
 
-        elif isinstance(other, str):
-            byte_to_add: Byte = Byte.from_str(other)
-            return byte_to_add + self
+    def __sub__(self, other) -> Byte:
+        """
+        Subtract operator for Byte. The result wraps around modulo 256.
+        Supports the same operand types as the add operator.
+        :param other: the other object to subtract.
+        :return: the interned Byte representing the difference modulo 256.
+        """
+        if isinstance(other, Byte):
+            return _INTERNED_BYTES[(self.__value - other.__value) & 0xFF]
+        return _INTERNED_BYTES[(self.__value - Byte.__operand_to_int(other)) & 0xFF]
+
+    def __rsub__(self, other) -> Byte:
+        return _INTERNED_BYTES[(Byte.__operand_to_int(other) - self.__value) & 0xFF]
+
+    def __mul__(self, other) -> Byte:
+        """
+        Multiply operator for Byte. The result wraps around modulo 256.
+        Supports the same operand types as the add operator.
+        :param other: the other object to multiply by.
+        :return: the interned Byte representing the product modulo 256.
+        """
+        if isinstance(other, Byte):
+            return _INTERNED_BYTES[(self.__value * other.__value) & 0xFF]
+        return _INTERNED_BYTES[(self.__value * Byte.__operand_to_int(other)) & 0xFF]
 
-        elif hasattr(other, '__int__'):
-            int_value: int = int(other)
-            byte_to_add: Byte = Byte.from_int(int_value)
-            return self + byte_to_add
+    def __rmul__(self, other) -> Byte:
+        return _INTERNED_BYTES[(Byte.__operand_to_int(other) * self.__value) & 0xFF]
 
-        elif hasattr(other, '__str__'):
-            str_value: str = str(other)
-            byte_to_add: Byte = Byte.from_str(str_value)
-            return self + byte_to_add
+    def __divmod__(self, other) -> tuple[Byte, Byte]:
+        """
+        Unsigned euclidean division of the byte.
+        Supports the same operand types as the add operator.
+        :param other: the divisor.
+        :return: a tuple of the interned Bytes representing the quotient and the remainder.
+        :raises ZeroDivisionError: if the divisor is zero.
+        """
+        quotient, remainder = divmod(self.__value, Byte.__operand_to_int(other))
+        return _INTERNED_BYTES[quotient & 0xFF], _INTERNED_BYTES[remainder & 0xFF]
 
-    def __sub__(self, other):
-        pass
+    def __floordiv__(self, other) -> Byte:
+        return self.__divmod__(other)[0]
 
-    def __mul__(self, other):
-        pass
+    def __mod__(self, other) -> Byte:
+        return self.__divmod__(other)[1]
 
-    def __divmod__(self, other):
-        pass
+    def add_with_carry(self, other, carry_in: bool = False) -> ArithmeticResult:
+        """
+        Adds the other operand and the incoming carry to the byte, like the ADC instruction of a processor.
+        Supports the same operand types as the add operator.
+        :param other: the other object to add.
+        :param carry_in: True to add one more to the sum.
+        :return: the sum modulo 256, the carry out of the eighth bit and the two's complement overflow.
+        """
+        other_value: int = Byte.__operand_to_int(other) & 0xFF
+        total: int = self.__value + other_value + (1 if carry_in else 0)
+        result: int = total & 0xFF
+        # the signed overflow happens when both operands have the same sign and the result has the other sign
+        overflow: bool = ((self.__value ^ result) & (other_value ^ result) & 0x80) != 0
+        return ArithmeticResult(_INTERNED_BYTES[result], total > 0xFF, overflow)
+
+    def subtract_with_borrow(self, other, borrow_in: bool = False) -> ArithmeticResult:
+        """
+        Subtracts the other operand and the incoming borrow from the byte, like the SBB instruction of a processor.
+        Supports the same operand types as the add operator.
+        :param other: the other object to subtract.
+        :param borrow_in: True to subtract one more from the difference.
+        :return: the difference modulo 256, the borrow into the eighth bit (stored as the carry)
+        and the two's complement overflow.
+        """
+        other_value: int = Byte.__operand_to_int(other) & 0xFF
+        total: int = self.__value - other_value - (1 if borrow_in else 0)
+        result: int = total & 0xFF
+        # the signed overflow happens when the operands have different signs
+        # and the result does not have the sign of the minuend
+        overflow: bool = ((self.__value ^ other_value) & (self.__value ^ result) & 0x80) != 0
+        return ArithmeticResult(_INTERNED_BYTES[result], total < 0, overflow)
+
+    def multiply_with_carry(self, other) -> ArithmeticResult:
+        """
+        Multiplies the byte by the other operand as unsigned integers.
+        Supports the same operand types as the add operator.
+        :param other: the other object to multiply by.
+        :return: the product modulo 256, True as the carry if the product does not fit in eight bits
+        and True as the overflow if the two's complement product does not fit in eight bits.
+        """
+        other_value: int = Byte.__operand_to_int(other) & 0xFF
+        product: int = self.__value * other_value
+        signed_product: int = _SIGNED_VALUES[self.__value] * _SIGNED_VALUES[other_value]
+        return ArithmeticResult(_INTERNED_BYTES[product & 0xFF], product > 0xFF, not -128 <= signed_product <= 127)
 
-    def __le__(self, other):
-        pass
+    def __and__(self, other) -> Byte:
+        return _INTERNED_BYTES[self.__value & Byte.__operand_to_int(other) & 0xFF]
 
-    def __lt__(self, other):
-        pass
+    def __rand__(self, other) -> Byte:
+        return self.__and__(other)
 
-    def __ge__(self, other):
-        pass
+    def __or__(self, other) -> Byte:
+        return _INTERNED_BYTES[(self.__value | Byte.__operand_to_int(other)) & 0xFF]
 
-    def __gt__(self, other):
-        pass
+    def __ror__(self, other) -> Byte:
+        return self.__or__(other)
+
+    def __xor__(self, other) -> Byte:
+        return _INTERNED_BYTES[(self.__value ^ Byte.__operand_to_int(other)) & 0xFF]
+
+    def __rxor__(self, other) -> Byte:
+        return self.__xor__(other)
+
+    def __invert__(self) -> Byte:
+        return _INTERNED_BYTES[self.__value ^ 0xFF]
+
+    def __lshift__(self, other) -> Byte:
+        """
+        Shifts the bits towards the eighth bit. The bits shifted out of the byte are lost.
+        :param other: the number of positions, as an int or any object which has an int() function.
+        """
+        return _INTERNED_BYTES[(self.__value << Byte.__shift_count(other)) & 0xFF]
+
+    def __rshift__(self, other) -> Byte:
+        """
+        Shifts the bits towards the first bit. The bits shifted out of the byte are lost.
+        :param other: the number of positions, as an int or any object which has an int() function.
+        """
+        return _INTERNED_BYTES[self.__value >> Byte.__shift_count(other)]
+
+    @staticmethod
+    def __shift_count(other) -> int:
+        count: int = int(other)
+        if count < 0:
+            raise ValueError("negative shift count")
+        return count if count < 8 else 8
+
+    def __in_place(self, result: Byte) -> Byte:
+        """
+        Stores the result of an in-place operator. A mutable byte is updated and returned,
+        a frozen byte is left untouched and the interned result is returned instead, like for an int.
+        """
+        if self.__frozen:
+            return result
+        self.__value = result.__value
+        return self
+
+    def __iand__(self, other) -> Byte:
+        return self.__in_place(self.__and__(other))
+
+    def __ior__(self, other) -> Byte:
+        return self.__in_place(self.__or__(other))
+
+    def __ixor__(self, other) -> Byte:
+        return self.__in_place(self.__xor__(other))
+
+    def __ilshift__(self, other) -> Byte:
+        return self.__in_place(self.__lshift__(other))
+
+    def __irshift__(self, other) -> Byte:
+        return self.__in_place(self.__rshift__(other))
+
+    def rotate_left(self, count: int = 1) -> Byte:
+        """
+        Rotates the bits towards the eighth bit, the eighth bit going back to the first bit.
+        :param count: the number of positions.
+        :return: the interned rotated Byte.
+        """
+        count = int(count) % 8
+        return _INTERNED_BYTES[((self.__value << count) | (self.__value >> (8 - count))) & 0xFF]
+
+    def rotate_right(self, count: int = 1) -> Byte:
+        """
+        Rotates the bits towards the first bit, the first bit going back to the eighth bit.
+        :param count: the number of positions.
+        :return: the interned rotated Byte.
+        """
+        return self.rotate_left(8 - int(count) % 8)
+
+    def rotate_left_through_carry(self, carry_in: bool = False, count: int = 1) -> tuple[Byte, bool]:
+        """
+        Rotates the nine bits made of the byte and the carry towards the eighth bit, like the RCL
+        instruction of a processor: the carry enters the first bit and the eighth bit leaves into the carry.
+        :param carry_in: the incoming carry.
+        :param count: the number of positions.
+        :return: the interned rotated Byte and the outgoing carry.
+        """
+        count = int(count) % 9
+        nine_bits: int = self.__value | (256 if carry_in else 0)
+        nine_bits = ((nine_bits << count) | (nine_bits >> (9 - count))) & 0x1FF
+        return _INTERNED_BYTES[nine_bits & 0xFF], nine_bits > 0xFF
+
+    def rotate_right_through_carry(self, carry_in: bool = False, count: int = 1) -> tuple[Byte, bool]:
+        """
+        Rotates the nine bits made of the byte and the carry towards the first bit, like the RCR
+        instruction of a processor: the carry enters the eighth bit and the first bit leaves into the carry.
+        :param carry_in: the incoming carry.
+        :param count: the number of positions.
+        :return: the interned rotated Byte and the outgoing carry.
+        """
+        return self.rotate_left_through_carry(carry_in, 9 - int(count) % 9)
+
+    def popcount(self) -> int:
+        """
+        :return: the number of bits set to 1 in the byte.
+        """
+        return POPCOUNT_TABLE[self.__value]
+
+    def parity(self) -> int:
+        """
+        :return: 1 if the number of bits set to 1 is odd, 0 otherwise.
+        """
+        return PARITY_TABLE[self.__value]
+
+    def leading_zeros(self) -> int:
+        """
+        :return: the number of bits set to 0 before the first bit set to 1, starting from the eighth
+        (most significant) bit. 8 for a zero byte.
+        """
+        return LEADING_ZEROS_TABLE[self.__value]
+
+    def trailing_zeros(self) -> int:
+        """
+        :return: the number of bits set to 0 before the first bit set to 1, starting from the first
+        (least significant) bit. 8 for a zero byte.
+        """
+        return TRAILING_ZEROS_TABLE[self.__value]
+
+    def reverse_bits(self) -> Byte:
+        """
+        Reverses the order of the bits: the first bit becomes the eighth one and so on.
+        The string of bits of the result is the reversed string of bits of the byte,
+        so this converts between the little endian order of Byte and the usual big endian order.
+        :return: the interned Byte with the bits in the reverse order.
+        """
+        return _INTERNED_BYTES[REVERSED_BITS_TABLE[self.__value]]
+
+    @property
+    def signed(self) -> int:
+        """
+        The two's complement signed integer between -128 and 127 included represented by the byte.
+        """
+        return _SIGNED_VALUES[self.__value]
+
+    @staticmethod
+    def __operand_to_int(other) -> int:
+        """
+        Converts the operand of an arithmetic or an ordering operator into an integer.
+        Bytes give their value, integers are used as is, strings are parsed as a string of bits
+        (see from_str) and other objects are converted through int() if possible or str() otherwise.
+        """
+        if isinstance(other, Byte):
+            return other.__value
+        elif isinstance(other, int):
+            return other
+        elif isinstance(other, str):
+            return Byte.from_str(other).__value
+        elif hasattr(other, "__int__"):
+            return int(other)
+        else:
+            return Byte.from_str(str(other)).__value
+
+    def __le__(self, other) -> bool:
+        return self.__value <= Byte.__operand_to_int(other)
+
+    def __lt__(self, other) -> bool:
+        return self.__value < Byte.__operand_to_int(other)
+
+    def __ge__(self, other) -> bool:
+        return self.__value >= Byte.__operand_to_int(other)
+
+    def __gt__(self, other) -> bool:
+        return self.__value > Byte.__operand_to_int(other)
 
     def __eq__(self, other):
         if isinstance(other, Byte):
-            return self.__first_bit == other.__first_bit \
-                   and self.__second_bit == other.__second_bit \
-                   and self.__third_bit == other.__third_bit \
-                   and self.__forth_bit == other.__forth_bit \
-                   and self.__fifth_bit == other.__fifth_bit \
-                   and self.__sixth_bit == other.__sixth_bit \
-                   and self.__seventh_bit == other.__seventh_bit \
-                   and self.__eighth_bit == other.__eighth_bit
+            return self.__value == other.__value
         elif isinstance(other, int):
             return self.__value == other
         elif isinstance(other, str):
@@ -678,14 +788,7 @@ class Byte:
 
     def __ne__(self, other):
         if isinstance(other, Byte):
-            return self.__first_bit != other.__first_bit \
-                   or self.__second_bit != other.__second_bit \
-                   or self.__third_bit != other.__third_bit \
-                   or self.__forth_bit != other.__forth_bit \
-                   or self.__fifth_bit != other.__fifth_bit \
-                   or self.__sixth_bit != other.__sixth_bit \
-                   or self.__seventh_bit != other.__seventh_bit \
-                   or self.__eighth_bit != other.__eighth_bit
+            return self.__value != other.__value
         elif isinstance(other, int):
             return self.__value != other
         elif isinstance(other, str):
@@ -697,5 +800,46 @@ class Byte:
             other_str: str = str(other)
             return str(self) != other_str
 
-    def __hash__(self):
-        hash(self.__char)
+    def __hash__(self) -> int:
+        """
+        Hashes the value of a frozen byte, which is the hash of the int it is equal to, so frozen bytes,
+        ints and words of the same value are the same key in sets and dictionaries. Strings of bits
+        compare equal to bytes but keep their own hash, like any string compared to a non-string.
+        Mutable bytes are not hashable: their value could change while they are used as a key.
+        :raises TypeError: if the byte is mutable.
+        """
+        if not self.__frozen:
+            raise TypeError("unhashable type: mutable 'Byte', use freeze() to get a hashable Byte")
+        return hash(self.__value)
+
+
+# The characters of a bit, indexed by the bit value.
+_BIT_CHARS: tuple[str, str] = ("0", "1")
+
+# The number of bits set to 1 in each byte value.
+POPCOUNT_TABLE: bytes = bytes(bin(value).count("1") for value in range(256))
+# The parity, 1 for an odd number of bits set to 1, of each byte value.
+PARITY_TABLE: bytes = bytes(count & 1 for count in POPCOUNT_TABLE)
+# The number of leading zeros, counted from the eighth bit, of each byte value.
+LEADING_ZEROS_TABLE: bytes = bytes(8 - value.bit_length() for value in range(256))
+# The number of trailing zeros, counted from the first bit, of each byte value.
+TRAILING_ZEROS_TABLE: bytes = bytes(((value & -value).bit_length() - 1) if value else 8 for value in range(256))
+# Each byte value with its bits in the reverse order.
+REVERSED_BITS_TABLE: bytes = bytes(int(format(value, "08b")[::-1], 2) for value in range(256))
+
+# The renderings of each byte value: its string of bits in the order of Byte.__str__ (the first bit first),
+# its three octal digits, its three decimal digits, its two hexadecimal digits and its printable ASCII
+# character, or "." for the control and non-ASCII characters.
+BIT_STRINGS: tuple[str, ...] = tuple(format(value, "08b")[::-1] for value in range(256))
+OCTAL_STRINGS: tuple[str, ...] = tuple(format(value, "03o") for value in range(256))
+DECIMAL_STRINGS: tuple[str, ...] = tuple(format(value, "03d") for value in range(256))
+HEX_STRINGS: tuple[str, ...] = tuple(format(value, "02x") for value in range(256))
+CHAR_STRINGS: tuple[str, ...] = tuple(chr(value) if 0x20 <= value < 0x7F else "." for value in range(256))
+
+# The two's complement signed integer represented by each byte value.
+_SIGNED_VALUES: tuple[int, ...] = tuple(value - 256 if value > 127 else value for value in range(256))
+
+# The flyweight table: the 256 frozen bytes shared by the factory methods and the operators.
+_INTERNED_BYTES: tuple[Byte, ...] = tuple(Byte._new_interned(value) for value in range(256))
+# The interned bytes indexed by their canonical eight-character string of bits.
+_INTERNED_BYTES_BY_STR: dict[str, Byte] = dict(zip(BIT_STRINGS, _INTERNED_BYTES))
@@ -0,0 +1,226 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from __future__ import annotations
+
+import mmap
+import os
+from typing import BinaryIO, Iterable, Iterator
+
+from byte import Byte
+
+
+class ByteArray:
+    """
+    A mutable sequence of bytes stored in a contiguous buffer.
+
+    The values are kept as raw unsigned integers in a bytearray (or in the mmap the array was
+    built from) and are only turned into Byte objects on element access. The Bytes handed out
+    are the interned ones of the flyweight table, so reading or iterating allocates no Byte.
+    Slicing does not copy: it returns a memoryview over the underlying buffer.
+
+    Attributes\\:
+            __buffer: the bytearray or the mmap holding the values.\\n
+            __view: a memoryview over the whole buffer, used to hand out zero-copy slices.
+            While a slice is alive, a bytearray buffer cannot be resized.
+    """
+
+    __slots__ = ("__buffer", "__view")
+
+    __buffer: bytearray | mmap.mmap
+    __view: memoryview
+
+    def __init__(self, data: bytes | bytearray | memoryview | Iterable | int = 0) -> None:
+        """
+        Create a new byte array. The data is always copied.
+        :param data: the number of zeroed bytes to allocate, an object supporting the buffer protocol
+        (bytes, bytearray, memoryview, array...) which is copied in one block, or an iterable of Byte,
+        int or any object which has an int() (self.__int__()) function.
+        """
+        if isinstance(data, int):
+            buffer: bytearray = bytearray(data)
+        elif isinstance(data, ByteArray):
+            buffer: bytearray = bytearray(data.__view)
+        else:
+            try:
+                buffer: bytearray = bytearray(memoryview(data).cast("B"))
+            except TypeError:
+                buffer: bytearray = bytearray(map(int, data))
+        self.__buffer = buffer
+        self.__view = memoryview(buffer)
+
+    @classmethod
+    def __wrap(cls, buffer: bytearray | mmap.mmap) -> ByteArray:
+        """
+        Creates a byte array using the given buffer as is, without copying it.
+        """
+        byte_array: ByteArray = object.__new__(cls)
+        byte_array.__buffer = buffer
+        byte_array.__view = memoryview(buffer)
+        return byte_array
+
+    @staticmethod
+    def from_bytes(data: bytes | bytearray | memoryview) -> ByteArray:
+        """
+        Creates a byte array holding a copy of the given bytes-like object, copied in one block.
+        :param data: any object supporting the buffer protocol.
+        :return: a new ByteArray.
+        """
+        return ByteArray(data)
+
+    @staticmethod
+    def from_file(file: str | os.PathLike | BinaryIO) -> ByteArray:
+        """
+        Reads a whole file into a new byte array. The file is read directly into the buffer.
+        :param file: the path of the file or a file object opened in binary mode.
+        :return: a new ByteArray holding the content of the file.
+        """
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with open(file, "rb") as opened_file:
+                return ByteArray.from_file(opened_file)
+
+        try:
+            size: int = os.fstat(file.fileno()).st_size - file.tell()
+        except (AttributeError, OSError):
+            # not a regular file (pipe, socket, in-memory stream...): read until the end
+            return ByteArray.__wrap(bytearray(file.read()))
+
+        buffer: bytearray = bytearray(size)
+        read: int = file.readinto(buffer)
+        if read < size:
+            del buffer[read:]
+        return ByteArray.__wrap(buffer)
+
+    @staticmethod
+    def from_mmap(mapped: mmap.mmap) -> ByteArray:
+        """
+        Creates a byte array backed by the given memory map. Nothing is copied: reading the array
+        reads the mapping and, if the mapping is writable, writing the array writes the mapping.
+        The array cannot be resized.
+        :param mapped: the memory map to use as the buffer.
+        :return: a new ByteArray sharing the memory of the map.
+        """
+        return ByteArray.__wrap(mapped)
+
+    def view(self) -> memoryview:
+        """
+        :return: a zero-copy memoryview of unsigned bytes over the whole array.
+        """
+        return self.__view
+
+    def release(self) -> None:
+        """
+        Releases the view over the buffer, which is needed before closing the memory map
+        a ByteArray was built from. The array must not be used afterwards.
+        """
+        self.__view.release()
+
+    def tobytes(self) -> bytes:
+        return self.__view.tobytes()
+
+    def __bytes__(self) -> bytes:
+        return self.__view.tobytes()
+
+    def __len__(self) -> int:
+        return len(self.__view)
+
+    def __iter__(self) -> Iterator[Byte]:
+        return map(Byte.from_int, self.__view)
+
+    def __getitem__(self, item):
+        """
+        Gets the interned Byte at the given index or, for a slice, a zero-copy memoryview.
+        """
+        if isinstance(item, slice):
+            return self.__view[item]
+        return Byte.from_int(self.__view[int(item)])
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Sets the byte at the given index. The value may be a Byte, an int between 0 and 255 included,
+        a string of bits (see Byte.from_str) or any object which has an int() (self.__int__()) function.
+        A slice is assigned from any object supporting the buffer protocol or an iterable of such values.
+        """
+        if isinstance(key, slice):
+            try:
+                self.__buffer[key] = memoryview(value).cast("B")
+            except TypeError:
+                self.__buffer[key] = bytes(ByteArray.__value_to_int(element) for element in value)
+        else:
+            self.__buffer[int(key)] = ByteArray.__value_to_int(value)
+
+    @staticmethod
+    def __value_to_int(value) -> int:
+        if isinstance(value, str):
+            return int(Byte.from_str(value))
+        return int(value)
+
+    def append(self, value) -> None:
+        """
+        Appends one byte at the end of the array. Only arrays stored in a bytearray can grow.
+        :param value: the value to append, with the same accepted types as an item assignment.
+        """
+        self.__resize(lambda buffer: buffer.append(ByteArray.__value_to_int(value)))
+
+    def extend(self, values) -> None:
+        """
+        Appends bytes at the end of the array. Only arrays stored in a bytearray can grow.
+        :param values: any object supporting the buffer protocol, or an iterable of values.
+        """
+        try:
+            block: memoryview = memoryview(values).cast("B")
+        except TypeError:
+            block: bytes = bytes(ByteArray.__value_to_int(value) for value in values)
+        self.__resize(lambda buffer: buffer.extend(block))
+
+    def __resize(self, operation) -> None:
+        if not isinstance(self.__buffer, bytearray):
+            raise BufferError("a ByteArray backed by a memory map cannot be resized")
+        # the whole array view must be released for the bytearray to accept the resize.
+        # Slices previously handed out still block it and make the operation raise a BufferError.
+        self.__view.release()
+        try:
+            operation(self.__buffer)
+        finally:
+            self.__view = memoryview(self.__buffer)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ByteArray):
+            return self.__view == other.__view
+        try:
+            return self.__view == memoryview(other).cast("B")
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ByteArray({self.__view.tobytes()!r})"
+
+
+def as_memoryview(data) -> memoryview:
+    """
+    Gets a memoryview of unsigned bytes over the given data, without copying it when possible.
+    :param data: a ByteArray, any object supporting the buffer protocol (bytes, bytearray, mmap,
+    memoryview, array, NumPy array...) or an iterable of Byte, int or any object which has
+    an int() (self.__int__()) function, in which case the values are copied into a new bytes object.
+    :return: a one-dimensional memoryview of unsigned bytes.
+    """
+    if isinstance(data, ByteArray):
+        return data.view()
+    try:
+        view: memoryview = memoryview(data)
+    except TypeError:
+        return memoryview(bytes(map(int, data)))
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return view
@@ -0,0 +1,486 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Streaming checksums over bytes: CRCs of any model, Adler-32, Fletcher, XOR and sum checksums.
+
+Every checksum is an object fed by update() with chunks of any size, so it can sit in a streaming
+pipeline, and read with value, digest() or hexdigest() at any time, like the hashlib objects.
+
+The CRCs are table-driven and process 8 bytes per step with slice-by-8 tables, built once per
+polynomial and cached. The models computed by zlib (the CRC-32 polynomial, reflected) and binascii
+(the CRC-16 CCITT polynomial, not reflected) use them instead, whatever their initial and final values.
+Reflected models read the bits of each byte from its first (least significant) bit, the order of Byte.
+"""
+
+from __future__ import annotations
+
+import abc
+import binascii
+import functools
+import itertools
+import os
+import struct
+import zlib
+from typing import BinaryIO, NamedTuple
+
+from byte_array import as_memoryview
+from stream import iter_file_chunks
+
+# The number of bytes processed at once by the loops written in Python, which bounds their temporaries.
+_BLOCK_SIZE: int = 1 << 16
+
+_WORDS_LITTLE: struct.Struct = struct.Struct("<Q")
+_WORDS_BIG: struct.Struct = struct.Struct(">Q")
+
+
+class CrcModel(NamedTuple):
+    """
+    The parameters of a CRC, as in the catalogue of parametrised CRC algorithms.
+
+    Attributes\\:
+            width: the number of bits of the CRC, between 8 and 64.\\n
+            poly: the generator polynomial, without its x^width term, not reflected.\\n
+            init: the initial value of the register, not reflected.\\n
+            reflect_in: True to read the bits of each byte from the least significant one.\\n
+            reflect_out: True to reflect the register before the final xor.\\n
+            xor_out: the value xored with the register to get the CRC.\\n
+            check: the CRC of the ASCII string "123456789".
+    """
+    width: int
+    poly: int
+    init: int
+    reflect_in: bool
+    reflect_out: bool
+    xor_out: int
+    check: int
+
+
+# The named CRC models.
+CRC_MODELS: dict[str, CrcModel] = {
+    "crc8": CrcModel(8, 0x07, 0x00, False, False, 0x00, 0xF4),
+    "crc8-maxim": CrcModel(8, 0x31, 0x00, True, True, 0x00, 0xA1),
+    "crc16-arc": CrcModel(16, 0x8005, 0x0000, True, True, 0x0000, 0xBB3D),
+    "crc16-modbus": CrcModel(16, 0x8005, 0xFFFF, True, True, 0x0000, 0x4B37),
+    "crc16-kermit": CrcModel(16, 0x1021, 0x0000, True, True, 0x0000, 0x2189),
+    "crc16-xmodem": CrcModel(16, 0x1021, 0x0000, False, False, 0x0000, 0x31C3),
+    "crc16-ccitt-false": CrcModel(16, 0x1021, 0xFFFF, False, False, 0x0000, 0x29B1),
+    "crc32": CrcModel(32, 0x04C11DB7, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xCBF43926),
+    "crc32c": CrcModel(32, 0x1EDC6F41, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xE3069283),
+    "crc32-bzip2": CrcModel(32, 0x04C11DB7, 0xFFFFFFFF, False, False, 0xFFFFFFFF, 0xFC891918),
+    "crc32-mpeg2": CrcModel(32, 0x04C11DB7, 0xFFFFFFFF, False, False, 0x00000000, 0x0376E6E7),
+    "crc64-xz": CrcModel(64, 0x42F0E1EBA9EA3693, 0xFFFFFFFFFFFFFFFF, True, True, 0xFFFFFFFFFFFFFFFF,
+                         0x995DC9BBDF1939FA),
+}
+
+
+def _reflect(value: int, width: int) -> int:
+    return int(format(value, f"0{width}b")[::-1], 2)
+
+
+@functools.lru_cache(maxsize=32)
+def _crc_tables(width: int, poly: int, reflected: bool) -> tuple[tuple[int, ...], ...]:
+    """
+    Builds the slice-by-8 tables of a polynomial: table k holds the register, starting from 0,
+    after feeding each byte value followed by k zero bytes.
+    """
+    mask: int = (1 << width) - 1
+    first: list[int] = []
+    if reflected:
+        reflected_poly: int = _reflect(poly, width)
+        for value in range(256):
+            for _ in range(8):
+                value = (value >> 1) ^ reflected_poly if value & 1 else value >> 1
+            first.append(value)
+    else:
+        top: int = 1 << (width - 1)
+        for value in range(256):
+            value <<= width - 8
+            for _ in range(8):
+                value = ((value << 1) ^ poly) & mask if value & top else (value << 1) & mask
+            first.append(value)
+
+    tables: list[tuple[int, ...]] = [tuple(first)]
+    for _ in range(7):
+        previous: tuple[int, ...] = tables[-1]
+        if reflected:
+            tables.append(tuple((value >> 8) ^ first[value & 0xFF] for value in previous))
+        else:
+            tables.append(tuple(((value << 8) & mask) ^ first[value >> (width - 8)] for value in previous))
+    return tuple(tables)
+
+
+class Checksum(abc.ABC):
+    """
+    The interface of the checksums.
+
+    Attributes\\:
+            name: the name of the algorithm.\\n
+            width: the number of bits of the checksum.
+    """
+
+    __slots__ = ()
+
+    name: str
+    width: int
+
+    @abc.abstractmethod
+    def update(self, data) -> None:
+        """
+        Feeds bytes to the checksum.
+        :param data: a ByteArray, any object supporting the buffer protocol or an iterable of Byte and int.
+        """
+        raise NotImplementedError
+
+    @property
+    @abc.abstractmethod
+    def value(self) -> int:
+        """
+        The checksum of the bytes fed so far.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def copy(self) -> Checksum:
+        """
+        :return: an independent checksum in the same state.
+        """
+        raise NotImplementedError
+
+    def digest(self) -> bytes:
+        """
+        :return: the checksum as big endian bytes.
+        """
+        return self.value.to_bytes((self.width + 7) // 8, "big")
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def __repr__(self) -> str:
+        return f"<{self.name} checksum {self.hexdigest()}>"
+
+
+class Crc(Checksum):
+    """
+    A cyclic redundancy check of any model.
+
+    Attributes\\:
+            __model: the parameters of the CRC.\\n
+            __register: the register, reflected for the reflected models.
+    """
+
+    __slots__ = ("name", "width", "__model", "__register")
+
+    def __init__(self, model: CrcModel | str = "crc32", data=None) -> None:
+        """
+        Create a CRC.
+        :param model: the parameters or the name (see CRC_MODELS) of the CRC.
+        :param data: the first bytes to feed, if any.
+        :raises ValueError: if the model is unknown or its width not between 8 and 64.
+        """
+        if isinstance(model, str):
+            try:
+                self.name = model
+                model = CRC_MODELS[model.lower()]
+            except KeyError:
+                raise ValueError(f"unknown CRC model: {model!r}") from None
+        else:
+            self.name = f"crc{model.width}"
+        if not 8 <= model.width <= 64:
+            raise ValueError(f"the width of a CRC must be between 8 and 64, not {model.width}")
+        self.width = model.width
+        self.__model = model
+        self.__register = _reflect(model.init, model.width) if model.reflect_in else model.init
+        if data is not None:
+            self.update(data)
+
+    @property
+    def model(self) -> CrcModel:
+        return self.__model
+
+    def update(self, data) -> None:
+        view: memoryview = as_memoryview(data)
+        model: CrcModel = self.__model
+        if model.width == 32 and model.poly == 0x04C11DB7 and model.reflect_in:
+            # zlib keeps the register inverted between calls
+            self.__register = zlib.crc32(view, self.__register ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+        elif model.width == 16 and model.poly == 0x1021 and not model.reflect_in:
+            self.__register = binascii.crc_hqx(view, self.__register)
+        else:
+            for start in range(0, len(view), _BLOCK_SIZE):
+                self.__register = self.__update_block(view[start:start + _BLOCK_SIZE], self.__register)
+
+    def __update_block(self, block: memoryview, register: int) -> int:
+        """
+        Feeds a block to the register with the slice-by-8 tables, then its last bytes one by one.
+        """
+        width: int = self.__model.width
+        t0, t1, t2, t3, t4, t5, t6, t7 = _crc_tables(width, self.__model.poly, self.__model.reflect_in)
+        cut: int = len(block) - len(block) % 8
+        if self.__model.reflect_in:
+            for (word,) in _WORDS_LITTLE.iter_unpack(block[:cut]):
+                word ^= register
+                register = (t7[word & 0xFF] ^ t6[(word >> 8) & 0xFF] ^ t5[(word >> 16) & 0xFF]
+                            ^ t4[(word >> 24) & 0xFF] ^ t3[(word >> 32) & 0xFF] ^ t2[(word >> 40) & 0xFF]
+                            ^ t1[(word >> 48) & 0xFF] ^ t0[word >> 56])
+            for value in block[cut:]:
+                register = (register >> 8) ^ t0[(register ^ value) & 0xFF]
+        else:
+            mask: int = (1 << width) - 1
+            shift: int = 64 - width
+            for (word,) in _WORDS_BIG.iter_unpack(block[:cut]):
+                word ^= register << shift
+                register = (t0[word & 0xFF] ^ t1[(word >> 8) & 0xFF] ^ t2[(word >> 16) & 0xFF]
+                            ^ t3[(word >> 24) & 0xFF] ^ t4[(word >> 32) & 0xFF] ^ t5[(word >> 40) & 0xFF]
+                            ^ t6[(word >> 48) & 0xFF] ^ t7[word >> 56])
+            for value in block[cut:]:
+                register = ((register << 8) & mask) ^ t0[((register >> (width - 8)) ^ value) & 0xFF]
+        return register
+
+    @property
+    def value(self) -> int:
+        model: CrcModel = self.__model
+        register: int = self.__register
+        if model.reflect_in != model.reflect_out:
+            register = _reflect(register, model.width)
+        return register ^ model.xor_out
+
+    def copy(self) -> Crc:
+        other: Crc = Crc.__new__(Crc)
+        other.name = self.name
+        other.width = self.width
+        other.__model = self.__model
+        other.__register = self.__register
+        return other
+
+
+class Adler32(Checksum):
+    """
+    The Adler-32 checksum, computed by zlib.
+
+    Attributes\\:
+            __value: the checksum of the bytes fed so far.
+    """
+
+    __slots__ = ("__value",)
+
+    name: str = "adler32"
+    width: int = 32
+
+    def __init__(self, data=None) -> None:
+        self.__value = 1
+        if data is not None:
+            self.update(data)
+
+    def update(self, data) -> None:
+        self.__value = zlib.adler32(as_memoryview(data), self.__value)
+
+    @property
+    def value(self) -> int:
+        return self.__value
+
+    def copy(self) -> Adler32:
+        other: Adler32 = Adler32()
+        other.__value = self.__value
+        return other
+
+
+class Fletcher(Checksum):
+    """
+    The Fletcher checksums: Fletcher-16 over bytes, Fletcher-32 over 16-bit words and Fletcher-64
+    over 32-bit words, the words read in little endian. An odd tail of bytes is padded with zeros.
+    The two sums are computed block by block: the second one grows by the sum of the running sums
+    of the block, which itertools.accumulate computes without a Python loop.
+
+    Attributes\\:
+            __first: the sum of the words.\\n
+            __second: the sum of the running first sums.\\n
+            __pending: the bytes fed which do not make a whole word yet.
+    """
+
+    __slots__ = ("name", "width", "__first", "__second", "__pending")
+
+    def __init__(self, width: int = 16, data=None) -> None:
+        """
+        Create a Fletcher checksum.
+        :param width: the number of bits of the checksum: 16, 32 or 64.
+        :param data: the first bytes to feed, if any.
+        """
+        if width not in (16, 32, 64):
+            raise ValueError(f"the width of a Fletcher checksum must be 16, 32 or 64, not {width}")
+        self.name = f"fletcher{width}"
+        self.width = width
+        self.__first = 0
+        self.__second = 0
+        self.__pending = b""
+        if data is not None:
+            self.update(data)
+
+    def update(self, data) -> None:
+        view: memoryview = as_memoryview(data)
+        word_size: int = self.width // 16
+        modulus: int = (1 << (self.width // 2)) - 1
+        if self.__pending:
+            missing: int = word_size - len(self.__pending)
+            self.__pending += bytes(view[:missing])
+            view = view[missing:]
+            if len(self.__pending) < word_size:
+                return
+            self.__add(self.__words(self.__pending), modulus)
+            self.__pending = b""
+        cut: int = len(view) - len(view) % word_size
+        for start in range(0, cut, _BLOCK_SIZE):
+            self.__add(self.__words(view[start:min(start + _BLOCK_SIZE, cut)]), modulus)
+        self.__pending = bytes(view[cut:])
+
+    def __words(self, block) -> memoryview | tuple[int, ...]:
+        if self.width == 16:
+            return block
+        code: str = "<H" if self.width == 32 else "<I"
+        return tuple(word for (word,) in struct.iter_unpack(code, block))
+
+    def __add(self, words, modulus: int) -> None:
+        self.__second = (self.__second + len(words) * self.__first + sum(itertools.accumulate(words))) % modulus
+        self.__first = (self.__first + sum(words)) % modulus
+
+    @property
+    def value(self) -> int:
+        first: int = self.__first
+        second: int = self.__second
+        if self.__pending:
+            # the tail padded with zeros
+            modulus: int = (1 << (self.width // 2)) - 1
+            word: int = int.from_bytes(self.__pending, "little")
+            first = (first + word) % modulus
+            second = (second + first) % modulus
+        return (second << (self.width // 2)) | first
+
+    def copy(self) -> Fletcher:
+        other: Fletcher = Fletcher(self.width)
+        other.__first = self.__first
+        other.__second = self.__second
+        other.__pending = self.__pending
+        return other
+
+
+class XorChecksum(Checksum):
+    """
+    The xor of all the bytes (the longitudinal redundancy check of many serial protocols).
+    Each block is read as one integer whose halves are xored together until a byte is left.
+
+    Attributes\\:
+            __value: the xor of the bytes fed so far.
+    """
+
+    __slots__ = ("__value",)
+
+    name: str = "xor8"
+    width: int = 8
+
+    def __init__(self, data=None) -> None:
+        self.__value = 0
+        if data is not None:
+            self.update(data)
+
+    def update(self, data) -> None:
+        view: memoryview = as_memoryview(data)
+        for start in range(0, len(view), _BLOCK_SIZE):
+            block: memoryview = view[start:start + _BLOCK_SIZE]
+            value: int = int.from_bytes(block, "little")
+            size: int = len(block)
+            while size > 1:
+                half: int = (size + 1) // 2
+                value = (value & ((1 << (8 * half)) - 1)) ^ (value >> (8 * half))
+                size = half
+            self.__value ^= value
+
+    @property
+    def value(self) -> int:
+        return self.__value
+
+    def copy(self) -> XorChecksum:
+        other: XorChecksum = XorChecksum()
+        other.__value = self.__value
+        return other
+
+
+class SumChecksum(Checksum):
+    """
+    The sum of all the bytes modulo 2 to the power of the width.
+
+    Attributes\\:
+            __value: the sum of the bytes fed so far.
+    """
+
+    __slots__ = ("name", "width", "__value")
+
+    def __init__(self, width: int = 8, data=None) -> None:
+        """
+        Create a sum checksum.
+        :param width: the number of bits of the checksum: 8, 16, 32 or 64.
+        :param data: the first bytes to feed, if any.
+        """
+        if width not in (8, 16, 32, 64):
+            raise ValueError(f"the width of a sum checksum must be 8, 16, 32 or 64, not {width}")
+        self.name = f"sum{width}"
+        self.width = width
+        self.__value = 0
+        if data is not None:
+            self.update(data)
+
+    def update(self, data) -> None:
+        self.__value = (self.__value + sum(as_memoryview(data))) & ((1 << self.width) - 1)
+
+    @property
+    def value(self) -> int:
+        return self.__value
+
+    def copy(self) -> SumChecksum:
+        other: SumChecksum = SumChecksum(self.width)
+        other.__value = self.__value
+        return other
+
+
+def new(name: str, data=None) -> Checksum:
+    """
+    Creates a checksum by name, like hashlib.new.
+    :param name: a CRC model of CRC_MODELS, "adler32", "fletcher16", "fletcher32", "fletcher64",
+    "xor8", "sum8", "sum16", "sum32" or "sum64".
+    :param data: the first bytes to feed, if any.
+    :raises ValueError: if the name is unknown.
+    """
+    key: str = name.lower()
+    if key in CRC_MODELS:
+        return Crc(key, data)
+    if key == "adler32":
+        return Adler32(data)
+    if key == "xor8":
+        return XorChecksum(data)
+    for prefix, kind in (("fletcher", Fletcher), ("sum", SumChecksum)):
+        if key.startswith(prefix) and key[len(prefix):].isdigit():
+            return kind(int(key[len(prefix):]), data)
+    raise ValueError(f"unknown checksum: {name!r}")
+
+
+def checksum_file(file: str | os.PathLike | BinaryIO, name: str, chunk_size: int = 1 << 20) -> Checksum:
+    """
+    Computes a checksum of a file, chunk by chunk.
+    :param file: the path of the file or a file object opened in binary mode.
+    :param name: the name of the checksum, see new.
+    :return: the checksum fed with the whole file.
+    """
+    result: Checksum = new(name)
+    for chunk in iter_file_chunks(file, chunk_size):
+        result.update(chunk)
+    return result
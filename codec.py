@@ -0,0 +1,426 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Conversion of byte buffers to and from text in binary, octal, decimal, hexadecimal,
+base 32, base 64 and any radix between 2 and 62.
+
+Every byte is written with the same number of digits in its base (8 in binary, 3 in octal
+and decimal, 2 in hexadecimal...) using a table of the 256 renderings computed once per base.
+Binary uses the little endian representation of Byte.__str__: the first digit of each byte
+is its least significant bit. Base 32 and base 64 follow RFC 4648 and encode groups of
+5 and 3 bytes. Where the standard library has a primitive for a base (bytes.hex,
+bytes.fromhex, the base64 module), it is used instead of the tables.
+"""
+
+from __future__ import annotations
+
+import abc
+import base64
+import binascii
+import functools
+
+from byte import Byte
+from byte_array import as_memoryview
+
+# The digits of the radices up to 62, in order.
+DIGITS: str = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# The names accepted in place of the radix of the usual bases.
+BASE_NAMES: dict[str, int] = {
+    "bin": 2,
+    "binary": 2,
+    "oct": 8,
+    "octal": 8,
+    "dec": 10,
+    "decimal": 10,
+    "hex": 16,
+    "hexadecimal": 16,
+    "base32": 32,
+    "base64": 64,
+}
+
+# The characters ignored when decoding text.
+_WHITESPACE: dict[int, None] = dict.fromkeys(map(ord, " \t\n\r\f\v"))
+
+# The number of digits parsed at once by the bulk parsers, a multiple of 8 and of 3.
+_PARSE_CHUNK: int = 3 << 20
+
+
+class Codec(abc.ABC):
+    """
+    Converts buffers to text in one base and back.
+
+    The text is made of groups of char_group characters, each one encoding a group
+    of byte_group bytes, which lets streams be cut into independent chunks.
+
+    Attributes\\:
+            name: the name of the base.\\n
+            radix: the number of digits of the base.\\n
+            byte_group: the number of bytes encoded by one group of characters.\\n
+            char_group: the number of characters of one group.
+    """
+
+    __slots__ = ()
+
+    name: str
+    radix: int
+    byte_group: int
+    char_group: int
+
+    @abc.abstractmethod
+    def encode(self, data, separator: str = "") -> str:
+        """
+        Encodes the bytes into text.
+        :param data: a ByteArray, any object supporting the buffer protocol or an iterable of Byte and int.
+        :param separator: a string inserted between the groups of characters.
+        :return: the text representing the bytes.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def decode(self, text: str) -> bytes:
+        """
+        Decodes text into bytes. Whitespace is ignored.
+        :param text: the text to decode.
+        :return: the decoded bytes.
+        :raises ValueError: if the text is not valid in the base.
+        """
+        raise NotImplementedError
+
+
+class TableCodec(Codec):
+    """
+    A codec writing each byte with a fixed number of digits, using a table of the 256 renderings.
+
+    Attributes\\:
+            __digits: the rendering of each of the 256 byte values.\\n
+            __values: the byte value of each rendering, used to decode.
+    """
+
+    __digits: tuple[str, ...]
+    __values: dict[str, int]
+
+    def __init__(self, radix: int) -> None:
+        """
+        Create a codec writing every byte with the digits of the radix.
+        :param radix: the radix, between 2 and 62 included.
+        """
+        if not 2 <= radix <= len(DIGITS):
+            raise ValueError(f"the radix must be between 2 and {len(DIGITS)}, not {radix}")
+        self.name = {2: "bin", 8: "oct", 10: "dec"}.get(radix, f"base{radix}")
+        self.radix = radix
+        self.byte_group = 1
+
+        if radix == 2:
+            # little endian: the least significant bit first, like Byte.__str__
+            self.__digits = tuple(str(Byte.from_int(value)) for value in range(256))
+        else:
+            width: int = 1
+            while radix ** width < 256:
+                width += 1
+            self.__digits = tuple(TableCodec.__render(value, radix, width) for value in range(256))
+        self.char_group = len(self.__digits[0])
+        self.__values = {digits: value for value, digits in enumerate(self.__digits)}
+
+    @staticmethod
+    def __render(value: int, radix: int, width: int) -> str:
+        digits: list[str] = []
+        for _ in range(width):
+            value, digit = divmod(value, radix)
+            digits.append(DIGITS[digit])
+        return "".join(reversed(digits))
+
+    @property
+    def digits(self) -> tuple[str, ...]:
+        """
+        The rendering of each of the 256 byte values.
+        """
+        return self.__digits
+
+    def encode(self, data, separator: str = "") -> str:
+        return separator.join(map(self.__digits.__getitem__, as_memoryview(data)))
+
+    def decode(self, text: str) -> bytes:
+        text = text.translate(_WHITESPACE)
+        if self.radix <= 36:
+            text = text.lower()
+        width: int = self.char_group
+        if len(text) % width != 0:
+            raise ValueError(f"{self.name} text must be made of groups of {width} digits")
+        try:
+            return bytes(map(self.__values.__getitem__, (text[index:index + width]
+                                                         for index in range(0, len(text), width))))
+        except KeyError as error:
+            raise ValueError(f"invalid {self.name} byte: {error.args[0]!r}") from None
+
+
+class BinaryCodec(TableCodec):
+    """
+    The binary codec, decoding through the bulk parser parse_bin.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(2)
+
+    def decode(self, text: str) -> bytes:
+        return parse_bin(text)
+
+
+class OctalCodec(TableCodec):
+    """
+    The octal codec, decoding through the bulk parser parse_oct.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(8)
+
+    def decode(self, text: str) -> bytes:
+        return parse_oct(text)
+
+
+class HexCodec(TableCodec):
+    """
+    The hexadecimal codec, relying on bytes.hex and bytes.fromhex.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(16)
+        self.name = "hex"
+
+    def encode(self, data, separator: str = "") -> str:
+        view: memoryview = as_memoryview(data)
+        if not separator:
+            return view.hex()
+        if len(separator) == 1 and separator.isascii():
+            return view.hex(separator)
+        return super().encode(view, separator)
+
+    def decode(self, text: str) -> bytes:
+        return parse_hex(text)
+
+
+class Base32Codec(Codec):
+    """
+    The base 32 codec of RFC 4648, relying on the base64 module.
+    """
+
+    def __init__(self) -> None:
+        self.name = "base32"
+        self.radix = 32
+        self.byte_group = 5
+        self.char_group = 8
+
+    def encode(self, data, separator: str = "") -> str:
+        text: str = base64.b32encode(as_memoryview(data)).decode("ascii")
+        return _join_groups(text, self.char_group, separator)
+
+    def decode(self, text: str) -> bytes:
+        try:
+            return base64.b32decode(text.translate(_WHITESPACE), casefold=True)
+        except binascii.Error as error:
+            raise ValueError(f"invalid base32 text: {error}") from None
+
+
+class Base64Codec(Codec):
+    """
+    The base 64 codec of RFC 4648, relying on the base64 module.
+    """
+
+    def __init__(self) -> None:
+        self.name = "base64"
+        self.radix = 64
+        self.byte_group = 3
+        self.char_group = 4
+
+    def encode(self, data, separator: str = "") -> str:
+        text: str = base64.b64encode(as_memoryview(data)).decode("ascii")
+        return _join_groups(text, self.char_group, separator)
+
+    def decode(self, text: str) -> bytes:
+        try:
+            return base64.b64decode(text.translate(_WHITESPACE), validate=True)
+        except binascii.Error as error:
+            raise ValueError(f"invalid base64 text: {error}") from None
+
+
+def _join_groups(text: str, width: int, separator: str) -> str:
+    if not separator:
+        return text
+    return separator.join(text[index:index + width] for index in range(0, len(text), width))
+
+
+def radix_of(base: int | str) -> int:
+    """
+    Gets the radix of a base given by its radix or by its name (see BASE_NAMES).
+    """
+    if isinstance(base, str):
+        try:
+            return BASE_NAMES[base.lower()]
+        except KeyError:
+            if base.isdigit():
+                return int(base)
+            raise ValueError(f"unknown base: {base!r}") from None
+    return int(base)
+
+
+@functools.lru_cache(maxsize=None)
+def _codec_of_radix(radix: int) -> Codec:
+    if radix == 2:
+        return BinaryCodec()
+    elif radix == 8:
+        return OctalCodec()
+    elif radix == 16:
+        return HexCodec()
+    elif radix == 32:
+        return Base32Codec()
+    elif radix == 64:
+        return Base64Codec()
+    return TableCodec(radix)
+
+
+def get_codec(base: int | str) -> Codec:
+    """
+    Gets the codec of a base. Codecs are built once and shared.
+    :param base: the radix (2 to 62) or the name (see BASE_NAMES) of the base.
+    :return: the codec of the base.
+    """
+    return _codec_of_radix(radix_of(base))
+
+
+def encode(data, base: int | str, separator: str = "") -> str:
+    """
+    Encodes bytes into text in the given base.
+    :param data: a ByteArray, any object supporting the buffer protocol or an iterable of Byte and int.
+    :param base: the radix (2 to 62) or the name (see BASE_NAMES) of the base.
+    :param separator: a string inserted between the groups of characters.
+    :return: the text representing the bytes.
+    """
+    return get_codec(base).encode(data, separator)
+
+
+def decode(text: str, base: int | str) -> bytes:
+    """
+    Decodes text in the given base into bytes. Whitespace is ignored.
+    :param text: the text to decode.
+    :param base: the radix (2 to 62) or the name (see BASE_NAMES) of the base.
+    :return: the decoded bytes.
+    :raises ValueError: if the text is not valid in the base.
+    """
+    return get_codec(base).decode(text)
+
+
+@functools.lru_cache(maxsize=32)
+def _ignored(separators: str) -> dict[int, None]:
+    """
+    The translation table deleting the whitespace and the given separators.
+    """
+    return {**_WHITESPACE, **dict.fromkeys(map(ord, separators))}
+
+
+@functools.lru_cache(maxsize=None)
+def _deleted(characters: str) -> dict[int, None]:
+    return dict.fromkeys(map(ord, characters))
+
+
+def _check_digits(digits: str, valid: str, name: str, offset: int = 0) -> None:
+    """
+    Checks that the digits are only made of the valid characters.
+    :raises ValueError: naming the first invalid character and its position.
+    """
+    invalid: str = digits.translate(_deleted(valid))
+    if invalid:
+        position: int = digits.index(invalid[0])
+        raise ValueError(f"invalid {name} digit {invalid[0]!r} at position {offset + position}")
+
+
+def parse_bin(text: str, separators: str = "") -> bytes:
+    """
+    Parses a text of '0' and '1' digits into bytes, eight digits per byte, each byte using the
+    little endian representation of Byte.from_str: its first digit is its least significant bit.
+    The digits of the last byte may be incomplete, its missing bits are then 0.
+    The text is parsed by chunks with int(), without going through Byte objects.
+    :param text: the digits to parse.
+    :param separators: characters ignored between the digits, in addition to the whitespace.
+    :return: the parsed bytes.
+    :raises ValueError: if the text contains any other character.
+    """
+    digits: str = text.translate(_ignored(separators))
+    result: bytearray = bytearray()
+    for start in range(0, len(digits), _PARSE_CHUNK):
+        chunk: str = digits[start:start + _PARSE_CHUNK]
+        _check_digits(chunk, "01", "binary", start)
+        if len(chunk) % 8:
+            chunk += "0" * (8 - len(chunk) % 8)
+        # reversing the whole chunk puts the bytes in big endian order and the bits of each byte
+        # with the most significant first, so int() reads the chunk as a little endian number
+        result += int(chunk[::-1], 2).to_bytes(len(chunk) // 8, "little")
+    return bytes(result)
+
+
+# The contribution of each octal digit to the value of a byte, depending on its position.
+_OCTAL_PLANES: tuple[bytes, ...] = tuple(
+    bytes((int(chr(char), 8) << shift) & 0xFF if chr(char) in "01234567" else 0 for char in range(256))
+    for shift in (6, 3, 0))
+
+
+def parse_oct(text: str, separators: str = "") -> bytes:
+    """
+    Parses a text of octal digits into bytes, three digits per byte from 000 to 377.
+    The first, second and third digits of every byte are gathered with strided slices and
+    turned into their contribution to the bytes with bytes.translate, then combined as integers.
+    :param text: the digits to parse.
+    :param separators: characters ignored between the digits, in addition to the whitespace.
+    :return: the parsed bytes.
+    :raises ValueError: if the text contains any other character or a byte above 377.
+    """
+    digits: str = text.translate(_ignored(separators))
+    if len(digits) % 3:
+        raise ValueError("octal text must be made of groups of 3 digits")
+    result: bytearray = bytearray()
+    for start in range(0, len(digits), _PARSE_CHUNK):
+        chunk: str = digits[start:start + _PARSE_CHUNK]
+        _check_digits(chunk, "01234567", "octal", start)
+        leading: str = chunk[0::3]
+        if leading.translate(_deleted("0123")):
+            position: int = 3 * next(index for index, digit in enumerate(leading) if digit not in "0123")
+            raise ValueError(f"invalid octal byte {chunk[position:position + 3]!r} at position {start + position}")
+        length: int = len(chunk) // 3
+        value: int = 0
+        for position, plane in enumerate(_OCTAL_PLANES):
+            value |= int.from_bytes(chunk[position::3].encode("ascii").translate(plane), "little")
+        result += value.to_bytes(length, "little")
+    return bytes(result)
+
+
+def parse_hex(text: str, separators: str = "") -> bytes:
+    """
+    Parses a text of hexadecimal digits into bytes, two digits per byte, using bytes.fromhex by chunks.
+    :param text: the digits to parse, in upper or lower case.
+    :param separators: characters ignored between the digits, in addition to the whitespace.
+    :return: the parsed bytes.
+    :raises ValueError: if the text contains any other character or an odd number of digits.
+    """
+    digits: str = text.translate(_ignored(separators))
+    if len(digits) % 2:
+        raise ValueError("hexadecimal text must be made of groups of 2 digits")
+    result: bytearray = bytearray()
+    for start in range(0, len(digits), _PARSE_CHUNK):
+        chunk: str = digits[start:start + _PARSE_CHUNK]
+        try:
+            result += bytes.fromhex(chunk)
+        except ValueError:
+            _check_digits(chunk, "0123456789abcdefABCDEF", "hexadecimal", start)
+            raise
+    return bytes(result)
@@ -0,0 +1,266 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+The BinaryConsole command line.
+
+Usage: python console.py <command> [options], see python console.py --help.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+
+import bitdiff
+import expr
+import hexdump
+import parallel
+import server
+import stream
+from byte import BIT_STRINGS, HEX_STRINGS, OCTAL_STRINGS
+
+
+def _open_output(path: str | None, binary: bool):
+    """
+    Opens the output of a command: the given file or the standard output.
+    """
+    if path is None or path == "-":
+        return open(sys.stdout.fileno(), "wb" if binary else "w", closefd=False)
+    return open(path, "wb" if binary else "w")
+
+
+def _input(path: str | None):
+    """
+    Gets the input of a command: the given path or the standard input.
+    """
+    if path is None or path == "-":
+        return sys.stdin.buffer
+    return path
+
+
+def convert(args: argparse.Namespace) -> int:
+    binary: bool = args.to == stream.RAW
+    if args.jobs == 1:
+        chunks = stream.convert_file(_input(args.input), args.source, args.to,
+                                     args.separator, args.chunk_size)
+    else:
+        chunks = parallel.convert_file(_input(args.input), args.source, args.to,
+                                       args.separator, args.chunk_size, args.jobs)
+    with _open_output(args.output, binary) as output:
+        for chunk in chunks:
+            output.write(chunk)
+        if not binary:
+            output.write("\n")
+    return 0
+
+
+def dump(args: argparse.Namespace) -> int:
+    source = _input(args.input)
+    with _open_output(args.output, False) as output:
+        if isinstance(source, str):
+            with hexdump.HexDump(source, args.cols, args.group, args.base, not args.no_chars) as dumped:
+                for line in dumped.lines(args.seek, args.length):
+                    output.write(line + "\n")
+        else:
+            if args.seek < 0:
+                raise ValueError("the standard input cannot be read from its end")
+            for line in hexdump.iter_dump(source, args.seek, args.length, args.cols, args.group,
+                                          args.base, not args.no_chars):
+                output.write(line + "\n")
+    return 0
+
+
+def diff(args: argparse.Namespace) -> int:
+    report: bitdiff.DiffReport = bitdiff.diff(args.first, args.second, args.chunk_size, args.max_ranges)
+    with _open_output(args.output, False) as output:
+        output.write(f"{args.first}: {report.size_a} bytes, {args.second}: {report.size_b} bytes\n")
+        for diff_range in report.ranges:
+            size: int = diff_range.end - diff_range.start
+            if diff_range.flipped:
+                output.write(f"{diff_range.start:08x}-{diff_range.end:08x}: {size} bytes, "
+                             f"{diff_range.flipped} bits flipped\n")
+            else:
+                output.write(f"{diff_range.start:08x}-{diff_range.end:08x}: {size} bytes past the end of the shorter input\n")
+            for line in bitdiff.describe_bytes(args.first, args.second, diff_range, args.detail):
+                output.write(f"    {line}\n")
+        if report.range_count > len(report.ranges):
+            output.write(f"... {report.range_count - len(report.ranges)} more ranges\n")
+        output.write("bit flips:" + "".join(f" [{index}] {count}" for index, count in enumerate(report.flips)) + "\n")
+        output.write(f"{report.flipped_bits} of {8 * report.compared} bits flipped, "
+                     f"bit error rate {report.bit_error_rate:.3e}\n")
+    return 0 if report.identical else 1
+
+
+# The renderings of the results of eval, by base.
+_RESULT_STRINGS: dict[str, tuple[str, ...]] = {
+    "dec": tuple(map(str, range(256))),
+    "hex": HEX_STRINGS,
+    "oct": OCTAL_STRINGS,
+    "bin": BIT_STRINGS,
+}
+
+
+def _read_text(path: str | None) -> str:
+    source = _input(path)
+    if isinstance(source, str):
+        with open(source, newline="") as file:
+            return file.read()
+    return io.TextIOWrapper(source, newline="").read()
+
+
+def evaluate(args: argparse.Namespace) -> int:
+    expression: expr.Expression = expr.compile_expression(args.expression)
+    try:
+        if not expression.variables:
+            results = bytes((expression(),))
+        elif args.csv:
+            columns = expr.read_csv_columns(_read_text(args.input).splitlines(), expression.variables)
+            results = expression.evaluate(**columns)
+        else:
+            if len(expression.variables) > 1:
+                raise ValueError(f"an expression of several variables needs a CSV input: {', '.join(expression.variables)}")
+            if args.raw:
+                source = _input(args.input)
+                if isinstance(source, str):
+                    with open(source, "rb") as file:
+                        column = file.read()
+                else:
+                    column = source.read()
+            else:
+                column = expr.read_column(_read_text(args.input).splitlines())
+            results = expression.evaluate(column)
+    except (ZeroDivisionError, IndexError) as error:
+        raise ValueError(error) from None
+
+    binary: bool = args.base == stream.RAW
+    with _open_output(args.output, binary) as output:
+        if binary:
+            output.write(bytes(results))
+        else:
+            strings: tuple[str, ...] = _RESULT_STRINGS[args.base]
+            for start in range(0, len(results), stream.DEFAULT_CHUNK_SIZE):
+                output.write("\n".join(map(strings.__getitem__, results[start:start + stream.DEFAULT_CHUNK_SIZE])))
+                output.write("\n")
+    return 0
+
+
+def serve(args: argparse.Namespace) -> int:
+    try:
+        server.serve(args.host, args.port, args.unix)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="console.py",
+        description="A simple python console for easy binary, octal, decimal, hexadecimal, "
+                    "base 32, base 64 and base N operations on the fly.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert_parser = commands.add_parser(
+        "convert", help="stream-convert a file or the standard input between representations",
+        description="Converts a file of any size chunk by chunk. A representation is 'raw' (bytes), "
+                    "a base name (bin, oct, dec, hex, base32, base64) or a radix between 2 and 62. "
+                    "Binary text uses the bit order of Byte: the least significant bit first.")
+    convert_parser.add_argument("input", nargs="?", help="the input file, the standard input if omitted or '-'")
+    convert_parser.add_argument("-f", "--from", dest="source", default=stream.RAW,
+                                help="the representation of the input (default: raw)")
+    convert_parser.add_argument("-t", "--to", default="hex", help="the representation of the output (default: hex)")
+    convert_parser.add_argument("-o", "--output", help="the output file, the standard output if omitted or '-'")
+    convert_parser.add_argument("-s", "--separator", default="",
+                                help="a string written between the groups of characters of a text output")
+    convert_parser.add_argument("--chunk-size", type=int, default=stream.DEFAULT_CHUNK_SIZE,
+                                help="the number of bytes read at once (default: 1 MiB)")
+    convert_parser.add_argument("-j", "--jobs", type=int, default=1,
+                                help="the number of processes converting the chunks, 0 for one per core (default: 1)")
+    convert_parser.set_defaults(handler=convert)
+
+    dump_parser = commands.add_parser(
+        "dump", help="show a file or the standard input like xxd",
+        description="Shows the offset, the bytes and the ASCII characters of each line of the input. "
+                    "Files are memory mapped, so seeking anywhere in a large file is immediate. "
+                    "Binary uses the bit order of Byte: the least significant bit first.")
+    dump_parser.add_argument("input", nargs="?", help="the input file, the standard input if omitted or '-'")
+    dump_parser.add_argument("-s", "--seek", type=lambda text: int(text, 0), default=0,
+                             help="the offset of the first byte shown, from the end if negative (default: 0)")
+    dump_parser.add_argument("-l", "--length", type=lambda text: int(text, 0),
+                             help="the number of bytes shown (default: up to the end)")
+    dump_parser.add_argument("-c", "--cols", type=int, default=16, help="the number of bytes of a line (default: 16)")
+    dump_parser.add_argument("-g", "--group", type=int, default=2,
+                             help="the number of bytes of a group, 0 for no grouping (default: 2)")
+    dump_parser.add_argument("-b", "--base", default="hex", choices=tuple(hexdump.DUMP_BASES),
+                             help="the base of the bytes (default: hex)")
+    dump_parser.add_argument("--no-chars", action="store_true", help="do not show the ASCII characters")
+    dump_parser.add_argument("-o", "--output", help="the output file, the standard output if omitted or '-'")
+    dump_parser.set_defaults(handler=dump)
+
+    diff_parser = commands.add_parser(
+        "diff", help="compare two files bit by bit",
+        description="Reports the ranges of differing bytes, the number of flipped bits at each bit position "
+                    "(0 is the first, least significant bit, like Byte indexes) and the bit error rate. "
+                    "The exit status is 0 if the files are identical, 1 otherwise.")
+    diff_parser.add_argument("first", help="the first file")
+    diff_parser.add_argument("second", help="the second file")
+    diff_parser.add_argument("-d", "--detail", type=int, default=4,
+                             help="the number of bytes of each range shown bit by bit (default: 4)")
+    diff_parser.add_argument("-m", "--max-ranges", type=int, default=100,
+                             help="the number of ranges listed (default: 100)")
+    diff_parser.add_argument("--chunk-size", type=int, default=bitdiff.DEFAULT_CHUNK_SIZE,
+                             help="the number of bytes compared at once (default: 1 MiB)")
+    diff_parser.add_argument("-o", "--output", help="the output file, the standard output if omitted or '-'")
+    diff_parser.set_defaults(handler=diff)
+
+    eval_parser = commands.add_parser(
+        "eval", help="evaluate a byte expression over a column of values",
+        description="Compiles an expression following the Byte semantics, such as '(x + 0b101)[3]', and "
+                    "evaluates it over every value of the input, see the expr module. The input holds one "
+                    "value per line (decimal, 0b, 0o or 0x), or is a CSV file with a header naming the "
+                    "variables, or raw bytes.")
+    eval_parser.add_argument("expression", help="the expression")
+    eval_parser.add_argument("input", nargs="?", help="the input file, the standard input if omitted or '-'")
+    eval_input = eval_parser.add_mutually_exclusive_group()
+    eval_input.add_argument("--csv", action="store_true", help="read the variables from the columns of a CSV file")
+    eval_input.add_argument("--raw", action="store_true", help="read the values as raw bytes")
+    eval_parser.add_argument("-b", "--base", default="dec", choices=(*_RESULT_STRINGS, stream.RAW),
+                             help="the representation of the results, one per line except raw (default: dec)")
+    eval_parser.add_argument("-o", "--output", help="the output file, the standard output if omitted or '-'")
+    eval_parser.set_defaults(handler=evaluate)
+
+    serve_parser = commands.add_parser(
+        "serve", help="serve conversions and byte arithmetic over TCP or a Unix socket",
+        description="Runs a service answering JSON lines requests, see the server module.")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="the address to listen to (default: 127.0.0.1)")
+    serve_parser.add_argument("-p", "--port", type=int, default=server.DEFAULT_PORT,
+                              help=f"the TCP port to listen to (default: {server.DEFAULT_PORT})")
+    serve_parser.add_argument("--unix", metavar="PATH", help="listen to a Unix socket at this path instead of TCP")
+    serve_parser.set_defaults(handler=serve)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args: argparse.Namespace = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (ValueError, OSError) as error:
+        print(f"{args.command}: {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
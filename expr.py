@@ -0,0 +1,427 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+An expression language over bytes, compiled once and evaluated over whole columns of values.
+
+The expressions follow the Byte semantics: every value is a byte and the arithmetic wraps modulo 256.
+
+    (x + 0b101)[3]              the fourth bit of x + 5, like (Byte.from_int(x) + 5)[3]
+    rotl(x, 3) ^ '1000 0000'    a rotation, xored with the byte of the bits '10000000' (1)
+    popcount(a & b) > 2         compare the number of common bits of two columns
+
+The operators, by increasing priority: the comparisons (< <= > >= == !=, giving 0 or 1), |, ^, &,
+<< and >>, + and -, * // and %, the unary ~ and -, and the bit index [i] (0 is the first bit).
+The operands are numbers (decimal, 0b, 0o or 0x), strings of bits in quotes as accepted by
+Byte.from_str, variables, parentheses, and the functions popcount, parity, reverse (the bits),
+rotl and rotr (the number of positions as second argument).
+
+An expression is parsed once into Python source code, compiled into a function of its variables.
+Over a column, an expression of one variable is evaluated on the 256 byte values once, and the column
+is translated through this table. An expression of several variables is mapped over the columns,
+or evaluated on NumPy arrays when NumPy is installed. The compiled expressions are kept in an LRU
+cache keyed by their text.
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import re
+from typing import Iterable, Iterator
+
+from byte import POPCOUNT_TABLE, PARITY_TABLE, REVERSED_BITS_TABLE, Byte
+from byte_array import as_memoryview
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+HAS_NUMPY: bool = numpy is not None
+
+_TOKEN: re.Pattern = re.compile(r"""\s*(?:
+    (?P<number>0[bB][01_]+|0[oO][0-7_]+|0[xX][0-9a-fA-F_]+|\d[\d_]*)
+    |(?P<bits>'[^']*'|"[^"]*")
+    |(?P<name>[A-Za-z_]\w*)
+    |(?P<operator><<|>>|<=|>=|==|!=|//|[-+*%&|^~<>()\[\],])
+    )""", re.VERBOSE)
+
+# The binary operators of each level of priority, from the lowest, and their Python code on bytes.
+_LEVELS: tuple[dict[str, str], ...] = (
+    {"<": "({} < {})", "<=": "({} <= {})", ">": "({} > {})", ">=": "({} >= {})", "==": "({} == {})",
+     "!=": "({} != {})"},
+    {"|": "({} | {})"},
+    {"^": "({} ^ {})"},
+    {"&": "({} & {})"},
+    {"<<": "(({} << {}) & 255)", ">>": "({} >> {})"},
+    {"+": "(({} + {}) & 255)", "-": "(({} - {}) & 255)"},
+    {"*": "(({} * {}) & 255)", "//": "({} // {})", "%": "({} % {})"},
+)
+
+# The same operators on NumPy arrays of int64, where a shift by 64 bits or more is undefined
+# and the comparisons give bool arrays, which would index the tables as masks instead of by value.
+_NUMPY_CODE: dict[str, str] = {
+    "<<": "_shift_left({}, {})",
+    ">>": "_shift_right({}, {})",
+    **{operator: f"numpy.asarray({template}).astype(numpy.int64)" for operator, template in _LEVELS[0].items()},
+}
+
+# The functions: their number of arguments and their code.
+_FUNCTIONS: dict[str, tuple[int, str]] = {
+    "popcount": (1, "_POPCOUNT[{}]"),
+    "parity": (1, "_PARITY[{}]"),
+    "reverse": (1, "_REVERSED[{}]"),
+    "rotl": (2, "_rotate_left({}, {})"),
+    "rotr": (2, "_rotate_right({}, {})"),
+}
+
+
+def _rotate_left(value, count):
+    count = count % 8
+    return ((value << count) | (value >> (8 - count))) & 255
+
+
+def _rotate_right(value, count):
+    return _rotate_left(value, 8 - count % 8)
+
+
+def _bit(value, index):
+    if not 0 <= index < 8:
+        raise IndexError("Byte bit index out of range")
+    return (value >> index) & 1
+
+
+def _numpy_bit(value, index):
+    if numpy.any(index >= 8):
+        raise IndexError("Byte bit index out of range")
+    return (value >> index) & 1
+
+
+def _shift_left(value, count):
+    return numpy.where(count < 8, (value << numpy.minimum(count, 8)) & 255, 0)
+
+
+def _shift_right(value, count):
+    return numpy.where(count < 8, value >> numpy.minimum(count, 8), 0)
+
+
+# The names available to the compiled code, pure Python then NumPy.
+_PYTHON_GLOBALS: dict[str, object] = {
+    "_POPCOUNT": POPCOUNT_TABLE, "_PARITY": PARITY_TABLE, "_REVERSED": REVERSED_BITS_TABLE,
+    "_rotate_left": _rotate_left, "_rotate_right": _rotate_right, "_bit": _bit,
+}
+_NUMPY_GLOBALS: dict[str, object] = {} if numpy is None else {
+    "_POPCOUNT": numpy.frombuffer(POPCOUNT_TABLE, dtype=numpy.uint8).astype(numpy.int64),
+    "_PARITY": numpy.frombuffer(PARITY_TABLE, dtype=numpy.uint8).astype(numpy.int64),
+    "_REVERSED": numpy.frombuffer(REVERSED_BITS_TABLE, dtype=numpy.uint8).astype(numpy.int64),
+    "_rotate_left": _rotate_left, "_rotate_right": _rotate_right, "_bit": _numpy_bit,
+    "_shift_left": _shift_left, "_shift_right": _shift_right, "numpy": numpy,
+}
+
+
+class _Parser:
+    """
+    A recursive descent parser writing the Python code of an expression, for ints or for NumPy arrays.
+
+    Attributes\\:
+            __tokens: the tokens, as (kind, text, position).\\n
+            __index: the index of the next token.\\n
+            __arrays: True to write the code for NumPy arrays.\\n
+            variables: the names of the variables, in order of first appearance.
+    """
+
+    __slots__ = ("__tokens", "__index", "__arrays", "variables")
+
+    def __init__(self, text: str, arrays: bool) -> None:
+        self.__tokens = []
+        position: int = 0
+        text = text.rstrip()
+        while position < len(text):
+            token = _TOKEN.match(text, position)
+            if token is None:
+                position = len(text) - len(text[position:].lstrip())
+                raise ValueError(f"invalid character {text[position]!r} at position {position}")
+            self.__tokens.append((token.lastgroup, token.group(token.lastgroup), token.start(token.lastgroup)))
+            position = token.end()
+        self.__index = 0
+        self.__arrays = arrays
+        self.variables = []
+
+    def __peek(self) -> str | None:
+        return self.__tokens[self.__index][1] if self.__index < len(self.__tokens) else None
+
+    def __next(self) -> tuple[str, str, int]:
+        if self.__index >= len(self.__tokens):
+            raise ValueError("unexpected end of the expression")
+        token = self.__tokens[self.__index]
+        self.__index += 1
+        return token
+
+    def __expect(self, text: str) -> None:
+        kind, found, position = self.__next()
+        if found != text:
+            raise ValueError(f"expected {text!r} at position {position}, found {found!r}")
+
+    def parse(self) -> str:
+        code: str = self.__binary(0)
+        if self.__index < len(self.__tokens):
+            _, found, position = self.__tokens[self.__index]
+            raise ValueError(f"unexpected {found!r} at position {position}")
+        return code
+
+    def __binary(self, level: int) -> str:
+        if level == len(_LEVELS):
+            return self.__unary()
+        code: str = self.__binary(level + 1)
+        operators: dict[str, str] = _LEVELS[level]
+        while self.__peek() in operators and self.__tokens[self.__index][0] == "operator":
+            operator: str = self.__next()[1]
+            right: str = self.__binary(level + 1)
+            template: str = _NUMPY_CODE.get(operator, operators[operator]) if self.__arrays else operators[operator]
+            code = template.format(code, right)
+            if level == 0 and self.__peek() in operators:
+                raise ValueError("comparisons cannot be chained")
+        return code
+
+    def __unary(self) -> str:
+        if self.__peek() == "~":
+            self.__next()
+            return f"({self.__unary()} ^ 255)"
+        if self.__peek() == "-":
+            self.__next()
+            return f"((-{self.__unary()}) & 255)"
+        return self.__postfix()
+
+    def __postfix(self) -> str:
+        code: str = self.__atom()
+        while self.__peek() == "[":
+            _, _, position = self.__next()
+            if self.__literal_index():
+                # checked before the number is reduced to a byte, so x[256] is not x[0]
+                index: str = str(int(self.__next()[1], 0))
+            else:
+                index: str = self.__binary(0)
+            self.__expect("]")
+            if index.isdigit():
+                if not 0 <= int(index) < 8:
+                    raise ValueError(f"Byte bit index out of range at position {position}")
+                code = f"(({code} >> {index}) & 1)"
+            else:
+                code = f"_bit({code}, {index})"
+        return code
+
+    def __literal_index(self) -> bool:
+        """
+        :return: True if the bit index which follows is a number alone.
+        """
+        return (self.__index + 1 < len(self.__tokens) and self.__tokens[self.__index][0] == "number"
+                and self.__tokens[self.__index + 1][1] == "]")
+
+    def __atom(self) -> str:
+        kind, text, position = self.__next()
+        if kind == "number":
+            return str(int(text, 0) & 0xFF)
+        if kind == "bits":
+            return str(int(Byte.from_str(text[1:-1].replace(" ", "").replace("_", ""))))
+        if kind == "name":
+            if self.__peek() == "(":
+                return self.__call(text, position)
+            if text not in self.variables:
+                self.variables.append(text)
+            return f"_{self.variables.index(text)}"
+        if text == "(":
+            code: str = self.__binary(0)
+            self.__expect(")")
+            return code
+        raise ValueError(f"unexpected {text!r} at position {position}")
+
+    def __call(self, name: str, position: int) -> str:
+        try:
+            count, template = _FUNCTIONS[name]
+        except KeyError:
+            raise ValueError(f"unknown function {name!r} at position {position}") from None
+        self.__expect("(")
+        arguments: list[str] = [self.__binary(0)]
+        while self.__peek() == ",":
+            self.__next()
+            arguments.append(self.__binary(0))
+        self.__expect(")")
+        if len(arguments) != count:
+            raise ValueError(f"{name} takes {count} argument{'s' if count > 1 else ''}, not {len(arguments)}")
+        return template.format(*arguments)
+
+
+class Expression:
+    """
+    A compiled expression.
+
+    Attributes\\:
+            __text: the text of the expression.\\n
+            __variables: the names of the variables, in order of first appearance.\\n
+            __function: the compiled function, taking the values of the variables in order.\\n
+            __array_function: the same function on NumPy arrays, None without NumPy.\\n
+            __table: for an expression of one variable, its result for each of the 256 byte values.\\n
+            __failures: for an expression of one variable, the values whose evaluation raises an error.
+    """
+
+    __slots__ = ("__text", "__variables", "__function", "__array_function", "__table", "__failures")
+
+    def __init__(self, text: str) -> None:
+        """
+        Compile an expression.
+        :param text: the text of the expression.
+        :raises ValueError: if the expression is not valid.
+        """
+        parser: _Parser = _Parser(text, False)
+        code: str = parser.parse()
+        self.__text = text
+        self.__variables = tuple(parser.variables)
+        parameters: str = ", ".join(f"_{index}" for index in range(len(self.__variables)))
+        self.__function = eval(f"lambda {parameters}: {code}", dict(_PYTHON_GLOBALS))
+        self.__array_function = None
+        if HAS_NUMPY:
+            array_code: str = _Parser(text, True).parse()
+            self.__array_function = eval(f"lambda {parameters}: {array_code}", dict(_NUMPY_GLOBALS))
+        self.__table = None
+        self.__failures = b""
+        if len(self.__variables) == 1:
+            table: bytearray = bytearray(256)
+            failures: bytearray = bytearray()
+            for value in range(256):
+                try:
+                    table[value] = self.__function(value)
+                except (ZeroDivisionError, IndexError):
+                    # reported only if a column holds the value
+                    failures.append(value)
+            self.__table = bytes(table)
+            self.__failures = bytes(failures)
+
+    @property
+    def text(self) -> str:
+        return self.__text
+
+    @property
+    def variables(self) -> tuple[str, ...]:
+        return self.__variables
+
+    def __call__(self, *values, **named_values) -> int:
+        """
+        Evaluates the expression on single values.
+        :param values: the values of the variables, in order of first appearance, as int or Byte.
+        :param named_values: the values of the variables by name.
+        :return: the result, between 0 and 255.
+        :raises ValueError: if a variable is missing.
+        :raises ZeroDivisionError: on a division by zero.
+        """
+        return int(self.__function(*self.__arguments(values, named_values, lambda value: int(value) & 0xFF)))
+
+    def __arguments(self, values: tuple, named_values: dict, convert) -> list:
+        arguments: list = list(values) + [None] * (len(self.__variables) - len(values))
+        for name, value in named_values.items():
+            if name not in self.__variables:
+                raise ValueError(f"unknown variable {name!r}")
+            arguments[self.__variables.index(name)] = value
+        if len(arguments) != len(self.__variables) or any(argument is None for argument in arguments):
+            raise ValueError(f"the expression takes the variables {', '.join(self.__variables) or 'none'}")
+        return [convert(argument) for argument in arguments]
+
+    def evaluate(self, *columns, **named_columns):
+        """
+        Evaluates the expression over whole columns of values, in one pass.
+        :param columns: the values of each variable, in order of first appearance: ByteArrays,
+        objects supporting the buffer protocol or iterables of Byte and int. All the columns must have
+        the same length.
+        :param named_columns: the columns of the variables by name.
+        :return: the results: a bytearray, or a NumPy uint8 array when NumPy is installed
+        and the expression has several variables. An expression without variables has no column
+        to follow and gives its single value, as an int.
+        :raises ValueError: if a column is missing or the columns have different lengths.
+        :raises ZeroDivisionError: on a division by zero.
+        """
+        arguments: list[memoryview] = self.__arguments(columns, named_columns, as_memoryview)
+        if len({len(argument) for argument in arguments}) > 1:
+            raise ValueError("the columns must have the same length")
+        if self.__table is not None:
+            column: bytes = arguments[0].tobytes()
+            for value in self.__failures:
+                if value in column:
+                    self.__function(value)
+            return bytearray(column.translate(self.__table))
+        if not arguments:
+            return self.__function()
+        if self.__array_function is not None:
+            with numpy.errstate(divide="raise"):
+                try:
+                    result = self.__array_function(*(numpy.frombuffer(argument, dtype=numpy.uint8).astype(numpy.int64)
+                                                     for argument in arguments))
+                except FloatingPointError:
+                    raise ZeroDivisionError("integer division or modulo by zero") from None
+            return numpy.asarray(result).astype(numpy.uint8)
+        return bytearray(map(self.__function, *arguments))
+
+    def __repr__(self) -> str:
+        return f"Expression({self.__text!r})"
+
+
+@functools.lru_cache(maxsize=256)
+def compile_expression(text: str) -> Expression:
+    """
+    Compiles an expression, or gets it from the cache of the expressions compiled before.
+    :param text: the text of the expression.
+    :return: the compiled expression.
+    :raises ValueError: if the expression is not valid.
+    """
+    return Expression(text)
+
+
+def parse_value(text: str) -> int:
+    """
+    Parses a value of a column: a number (decimal, 0b, 0o or 0x) of which the eight least
+    significant bits are kept, like Byte.from_int.
+    :raises ValueError: if the text is not a number.
+    """
+    return int(text, 0) & 0xFF
+
+
+def read_column(lines: Iterable[str]) -> bytearray:
+    """
+    Reads a column of values, one per line. Empty lines are skipped.
+    """
+    return bytearray(map(parse_value, filter(None, map(str.strip, lines))))
+
+
+def read_csv_columns(lines: Iterable[str], names: Iterable[str] | None = None) -> dict[str, bytearray]:
+    """
+    Reads the columns of a CSV file with a header line.
+    :param lines: the lines of the file.
+    :param names: the names of the columns to read, all of them if None.
+    :return: the columns by name.
+    :raises ValueError: if a column is missing or a value is not a number.
+    """
+    reader: Iterator[list[str]] = csv.reader(lines)
+    header: list[str] = [name.strip() for name in next(reader, [])]
+    names = header if names is None else list(names)
+    try:
+        indexes: list[int] = [header.index(name) for name in names]
+    except ValueError:
+        missing = [name for name in names if name not in header]
+        raise ValueError(f"missing CSV column: {missing[0]!r}") from None
+    columns: list[bytearray] = [bytearray() for _ in names]
+    for row in reader:
+        if not row:
+            continue
+        for column, index in zip(columns, indexes):
+            column.append(parse_value(row[index].strip()))
+    return dict(zip(names, columns))
@@ -0,0 +1,239 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+An xxd-like dump of bytes, rendered with the precomputed tables of byte.py.
+
+A line shows the offset of its first byte, the bytes in groups written in a base
+(hex, bin, oct or dec) and the bytes as printable ASCII characters:
+
+    00000000: 4865 6c6c 6f2c 2077 6f72 6c64 210a       Hello, world!.
+
+HexDump memory maps a file and renders its lines on demand: the line holding any offset
+is found by a division, so showing a page anywhere in a file of any size costs the same.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from typing import BinaryIO, Iterator
+
+from byte import BIT_STRINGS, CHAR_STRINGS, DECIMAL_STRINGS, HEX_STRINGS, OCTAL_STRINGS
+from byte_array import as_memoryview
+
+# The rendering tables of the bases of a dump. Binary uses the bit order of Byte: the first bit first.
+DUMP_BASES: dict[str, tuple[str, ...]] = {
+    "hex": HEX_STRINGS,
+    "bin": BIT_STRINGS,
+    "oct": OCTAL_STRINGS,
+    "dec": DECIMAL_STRINGS,
+}
+
+# The translation of bytes to the characters of the ASCII column.
+_CHAR_TRANSLATION: bytes = "".join(CHAR_STRINGS).encode("latin-1")
+
+
+def _table(base: str) -> tuple[str, ...]:
+    try:
+        return DUMP_BASES[base]
+    except KeyError:
+        raise ValueError(f"the base of a dump must be one of {', '.join(DUMP_BASES)}, not {base!r}") from None
+
+
+def _check_layout(width: int, group: int) -> None:
+    if width < 1:
+        raise ValueError("a dump line must hold at least one byte")
+    if group < 0:
+        raise ValueError("the group size cannot be negative")
+
+
+def render_line(row, offset: int, width: int = 16, group: int = 2, base: str = "hex", chars: bool = True) -> str:
+    """
+    Renders one line of a dump.
+    :param row: the bytes of the line, at most width bytes.
+    :param offset: the offset of the first byte of the line.
+    :param width: the number of bytes of a full line, to align the character column of a shorter one.
+    :param group: the number of bytes written together between spaces, 0 for a single group.
+    :param base: the base of the bytes, one of DUMP_BASES.
+    :param chars: True to add the column of ASCII characters.
+    :return: the line, without line break.
+    """
+    row = bytes(row)
+    table: tuple[str, ...] = _table(base)
+    group = group or width
+    if base == "hex":
+        cells: str = row.hex(" ", -group) if len(row) > group else row.hex()
+    else:
+        rendered: list[str] = list(map(table.__getitem__, row))
+        cells: str = " ".join("".join(rendered[start:start + group]) for start in range(0, len(rendered), group))
+    line: str = f"{offset:08x}: {cells}"
+    if not chars:
+        return line
+    # the width of a full line of cells, to align the character column
+    full: int = width * len(table[0]) + (width - 1) // group
+    return f"{line}{' ' * (full - len(cells))}  {row.translate(_CHAR_TRANSLATION).decode('latin-1')}"
+
+
+def dump_lines(data, offset: int = 0, width: int = 16, group: int = 2, base: str = "hex",
+               chars: bool = True) -> Iterator[str]:
+    """
+    Renders bytes as the lines of a dump.
+    :param data: a ByteArray or any object supporting the buffer protocol.
+    :param offset: the offset shown for the first byte of the data.
+    :return: an iterator over the lines, without line breaks.
+    See render_line for the other parameters.
+    """
+    _check_layout(width, group)
+    _table(base)
+    view: memoryview = as_memoryview(data)
+    for start in range(0, len(view), width):
+        yield render_line(view[start:start + width], offset + start, width, group, base, chars)
+
+
+def iter_dump(file: BinaryIO, offset: int = 0, length: int | None = None, width: int = 16, group: int = 2,
+              base: str = "hex", chars: bool = True, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """
+    Renders a sequential stream (a pipe, the standard input...) as the lines of a dump, chunk by chunk.
+    :param file: a file object opened in binary mode.
+    :param offset: the number of bytes skipped before the first byte shown.
+    :param length: the number of bytes to show, up to the end of the stream if None.
+    See render_line for the other parameters.
+    """
+    _check_layout(width, group)
+    _table(base)
+    read = getattr(file, "read1", file.read)
+    chunk_size = max(chunk_size - chunk_size % width, width)
+    skipped: int = 0
+    while skipped < offset and (chunk := read(min(chunk_size, offset - skipped))):
+        skipped += len(chunk)
+    left: float = float("inf") if length is None else length
+    pending: bytes = b""
+    while left > 0 and (chunk := read(int(min(chunk_size, left)))):
+        left -= len(chunk)
+        pending += chunk
+        cut: int = len(pending) - len(pending) % width
+        yield from dump_lines(pending[:cut], skipped, width, group, base, chars)
+        skipped += cut
+        pending = pending[cut:]
+    yield from dump_lines(pending, skipped, width, group, base, chars)
+
+
+class HexDump:
+    """
+    The dump of a memory mapped file, a sequence of lines rendered on demand.
+
+    Attributes\\:
+            __mapped: the memory map of the file, None for an empty file.\\n
+            __size: the number of bytes of the file.\\n
+            __width: the number of bytes of a line.\\n
+            __group: the number of bytes of a group.\\n
+            __base: the base of the bytes.\\n
+            __chars: True to add the column of ASCII characters.
+    """
+
+    __slots__ = ("__mapped", "__size", "__width", "__group", "__base", "__chars")
+
+    def __init__(self, file: str | os.PathLike | BinaryIO, width: int = 16, group: int = 2,
+                 base: str = "hex", chars: bool = True) -> None:
+        """
+        Create the dump of a file. Nothing is read until lines are rendered.
+        :param file: the path of a regular file, or a regular file opened in binary mode.
+        See render_line for the other parameters.
+        """
+        _check_layout(width, group)
+        _table(base)
+        self.__width = width
+        self.__group = group
+        self.__base = base
+        self.__chars = chars
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with open(file, "rb") as opened_file:
+                self.__map(opened_file)
+        else:
+            self.__map(file)
+
+    def __map(self, file: BinaryIO) -> None:
+        self.__size = os.fstat(file.fileno()).st_size
+        self.__mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if self.__size else None
+
+    @property
+    def size(self) -> int:
+        """
+        The number of bytes of the file.
+        """
+        return self.__size
+
+    def __len__(self) -> int:
+        """
+        The number of lines of the dump.
+        """
+        return -(-self.__size // self.__width)
+
+    def line_of(self, offset: int) -> int:
+        """
+        :return: the index of the line holding the byte at the given offset.
+        """
+        return offset // self.__width
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """
+        Renders a line, or the lines of a slice.
+        :raises IndexError: if the line does not exist.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return list(self.lines(start * self.__width, max(stop - start, 0) * self.__width))
+            return [self[line] for line in range(start, stop, step)]
+        count: int = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("dump line out of range")
+        start: int = index * self.__width
+        return render_line(self.__mapped[start:start + self.__width], start, self.__width,
+                           self.__group, self.__base, self.__chars)
+
+    def lines(self, offset: int = 0, length: int | None = None) -> Iterator[str]:
+        """
+        Renders the lines of a range of the file, lazily.
+        :param offset: the offset of the first byte to show.
+        :param length: the number of bytes to show, up to the end of the file if None.
+        :return: an iterator over the lines, without line breaks.
+        """
+        if offset < 0:
+            offset = max(self.__size + offset, 0)
+        stop: int = self.__size if length is None else min(self.__size, offset + max(length, 0))
+        page: int = max(self.__width, (1 << 16) - (1 << 16) % self.__width)
+        for start in range(offset, stop, page):
+            yield from dump_lines(self.__mapped[start:min(start + page, stop)], start, self.__width,
+                                  self.__group, self.__base, self.__chars)
+
+    def page(self, offset: int, count: int) -> list[str]:
+        """
+        Renders a page of the dump: count lines from the line holding the given offset.
+        """
+        start: int = self.line_of(offset)
+        return self[start:start + count]
+
+    def close(self) -> None:
+        if self.__mapped is not None:
+            self.__mapped.close()
+
+    def __enter__(self) -> HexDump:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
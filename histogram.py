@@ -0,0 +1,203 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Streaming byte-value histograms and the summaries built on them: counting sort,
+Shannon entropy and chi-square against the uniform distribution.
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+import math
+import os
+from typing import BinaryIO, Iterator
+
+from byte import Byte
+from byte_array import ByteArray
+from stream import DEFAULT_CHUNK_SIZE, iter_file_chunks
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Without NumPy, the number of bytes at the start of a chunk whose values are counted with bytes.count,
+# and the greatest number of distinct values for which it is faster than collections.Counter.
+_SAMPLE_SIZE: int = 4096
+_COUNTED_VALUES: int = 32
+
+
+class ByteHistogram:
+    """
+    The number of occurrences of each of the 256 byte values over any amount of data.
+
+    The data is counted chunk by chunk, with NumPy bincount when NumPy is installed, so the memory
+    used does not depend on the size of the data and no Byte is compared with another. Without NumPy,
+    the values seen at the start of a chunk are counted with bytes.count when they are few, which
+    scans memory at full speed but once per value, and the other values with collections.Counter.
+
+    Attributes\\:
+            __counts: the number of occurrences of each byte value.\\n
+            __total: the number of bytes counted.
+    """
+
+    __slots__ = ("__counts", "__total")
+
+    __counts: list[int]
+    __total: int
+
+    def __init__(self, data=None) -> None:
+        """
+        Create a new histogram.
+        :param data: the data to count first, if any (see update).
+        """
+        self.__counts = [0] * 256
+        self.__total = 0
+        if data is not None:
+            self.update(data)
+
+    @staticmethod
+    def from_file(file: str | os.PathLike | BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ByteHistogram:
+        """
+        Counts the bytes of a file, read chunk by chunk (through mmap for regular files).
+        :param file: the path of the file or a file object opened in binary mode.
+        :param chunk_size: the number of bytes read at once.
+        """
+        histogram: ByteHistogram = ByteHistogram()
+        for chunk in iter_file_chunks(file, chunk_size):
+            histogram.__count_chunk(chunk)
+        return histogram
+
+    def update(self, data, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ByteHistogram:
+        """
+        Counts more data.
+        :param data: a ByteArray, any object supporting the buffer protocol (bytes, bytearray, mmap...)
+        or an iterable of Byte and int, which is consumed chunk by chunk.
+        :param chunk_size: the number of bytes counted at once.
+        :return: the histogram itself.
+        """
+        if isinstance(data, ByteArray):
+            data = data.view()
+        try:
+            view: memoryview = memoryview(data).cast("B")
+        except TypeError:
+            iterator: Iterator = iter(data)
+            while chunk := bytes(map(int, itertools.islice(iterator, chunk_size))):
+                self.__count_chunk(chunk)
+            return self
+
+        for start in range(0, len(view), chunk_size):
+            self.__count_chunk(view[start:start + chunk_size])
+        return self
+
+    def __count_chunk(self, chunk) -> None:
+        counts: list[int] = self.__counts
+        if numpy is not None:
+            for value, count in enumerate(numpy.bincount(numpy.frombuffer(chunk, dtype=numpy.uint8),
+                                                         minlength=256).tolist()):
+                counts[value] += count
+        else:
+            rest: bytes = bytes(chunk)
+            values: bytes = bytes(set(rest[:_SAMPLE_SIZE]))
+            if len(values) <= _COUNTED_VALUES:
+                found: int = 0
+                for value in values:
+                    count: int = rest.count(value)
+                    counts[value] += count
+                    found += count
+                rest = rest.translate(None, values) if found < len(rest) else b""
+            for value, count in collections.Counter(rest).items():
+                counts[value] += count
+        self.__total += len(chunk)
+
+    def merge(self, other: ByteHistogram) -> ByteHistogram:
+        """
+        Adds the counts of another histogram, for example one built on another part of the data.
+        :return: the histogram itself.
+        """
+        for value, count in enumerate(other.__counts):
+            self.__counts[value] += count
+        self.__total += other.__total
+        return self
+
+    @property
+    def counts(self) -> tuple[int, ...]:
+        """
+        The number of occurrences of each byte value, indexed by the value.
+        """
+        return tuple(self.__counts)
+
+    @property
+    def total(self) -> int:
+        return self.__total
+
+    def __getitem__(self, item) -> int:
+        """
+        Gets the number of occurrences of a byte value.
+        :param item: the value, as a Byte, an int or a string of bits (see Byte.from_str).
+        """
+        if isinstance(item, str):
+            item = Byte.from_str(item)
+        return self.__counts[int(item)]
+
+    def iter_sorted(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Counting sort: writes the counted bytes in increasing order, without comparing them.
+        :param chunk_size: the largest number of bytes of a chunk.
+        :return: an iterator over chunks of the sorted bytes.
+        """
+        for value, count in enumerate(self.__counts):
+            run: bytes = bytes((value,)) * min(count, chunk_size)
+            while count >= chunk_size:
+                yield run
+                count -= chunk_size
+            if count:
+                yield run[:count]
+
+    def sorted_bytes(self) -> bytes:
+        """
+        Counting sort: the counted bytes in increasing order, in linear time.
+        """
+        return b"".join(bytes((value,)) * count for value, count in enumerate(self.__counts))
+
+    def entropy(self) -> float:
+        """
+        The Shannon entropy of the byte values, in bits per byte: 0 for a constant input,
+        8 for a uniformly distributed one.
+        """
+        total: int = self.__total
+        if not total:
+            return 0.0
+        return sum(count / total * math.log2(total / count) for count in self.__counts if count)
+
+    def chi_square(self) -> float:
+        """
+        The chi-square statistic of the counts against the uniform distribution of the 256 values.
+        With 255 degrees of freedom, values far from 255 reveal non-random data.
+        """
+        expected: float = self.__total / 256
+        if not expected:
+            return 0.0
+        return sum((count - expected) ** 2 for count in self.__counts) / expected
+
+
+def counting_sort(data) -> bytes:
+    """
+    Sorts bytes in linear time by counting them.
+    :param data: a ByteArray, any object supporting the buffer protocol or an iterable of Byte and int.
+    :return: the sorted bytes.
+    """
+    return ByteHistogram(data).sorted_bytes()
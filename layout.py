@@ -0,0 +1,232 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Compiled layouts of fixed-size binary records, decoded straight from buffers.
+
+A layout is declared once as a list of (name, type) fields and compiled into a struct.Struct.
+The types are u8, u16, u32, u64 and i8, i16, i32, i64 (unsigned and signed integers),
+f32 and f64 (floats), byte (an interned Byte), bytesN (N raw bytes), padN (N ignored bytes,
+the name is not used) and bitsN (a bitfield of N bits).
+
+Consecutive bitfields share one unsigned integer of 8, 16, 32 or 64 bits, which their widths
+must add up to. The first bitfield holds the least significant bits, like the first bit of a Byte.
+"""
+
+from __future__ import annotations
+
+import collections
+import re
+import struct
+from typing import Iterator, NamedTuple
+
+from byte import Byte
+from byte_array import as_memoryview
+
+# The struct codes of the fixed-size types.
+_CODES: dict[str, str] = {
+    "u8": "B", "u16": "H", "u32": "I", "u64": "Q",
+    "i8": "b", "i16": "h", "i32": "i", "i64": "q",
+    "f32": "f", "f64": "d", "byte": "B",
+}
+
+# The struct codes of the integers holding the bitfields, by width.
+_BITFIELD_CODES: dict[int, str] = {8: "B", 16: "H", 32: "I", 64: "Q"}
+
+# The prefixes of the struct formats, by byte order. No alignment padding is ever added.
+_BYTE_ORDERS: dict[str, str] = {"little": "<", "big": ">", "native": "="}
+
+_SIZED_TYPE = re.compile(r"(bytes|pad|bits)(\d+)")
+
+
+class Layout:
+    """
+    The compiled layout of a fixed-size record.
+
+    Attributes\\:
+            names: the names of the fields of the records, in order, without the padding.\\n
+            record: the named tuple class of the decoded records.\\n
+            __struct: the compiled struct.Struct reading the whole record.\\n
+            __convert: the function turning the values read by the struct into a record.\\n
+            __flatten: the function turning a record into the values written by the struct.
+    """
+
+    names: tuple[str, ...]
+    record: type
+
+    __struct: struct.Struct
+
+    def __init__(self, fields: list[tuple[str, str]], byteorder: str = "little", name: str = "Record") -> None:
+        """
+        Compile a layout.
+        :param fields: the (name, type) pairs of the fields, in order.
+        :param byteorder: "little", "big" or "native": the byte order of the multi-byte fields.
+        :param name: the name of the named tuple class of the records.
+        :raises ValueError: if a type is unknown or if bitfields do not fill a whole integer.
+        """
+        if byteorder not in _BYTE_ORDERS:
+            raise ValueError(f"unknown byte order: {byteorder!r}")
+
+        codes: list[str] = []
+        names: list[str] = []
+        # for each value read by the struct, how it becomes fields of the record:
+        # ("value", None), ("byte", None) or ("bits", [(shift, mask), ...]) for a bitfield group
+        slots: list[tuple[str, list[tuple[int, int]] | None]] = []
+        group: list[tuple[str, int]] = []
+
+        def close_group() -> None:
+            width: int = sum(bits for _, bits in group)
+            if width not in _BITFIELD_CODES:
+                raise ValueError(f"the bitfields {[name for name, _ in group]} must fill 8, 16, 32 or 64 bits, "
+                                 f"not {width}")
+            codes.append(_BITFIELD_CODES[width])
+            shift: int = 0
+            extractions: list[tuple[int, int]] = []
+            for field_name, bits in group:
+                names.append(field_name)
+                extractions.append((shift, (1 << bits) - 1))
+                shift += bits
+            slots.append(("bits", extractions))
+            group.clear()
+
+        for field_name, field_type in fields:
+            sized = _SIZED_TYPE.fullmatch(field_type)
+            if sized is not None and sized.group(1) == "bits":
+                group.append((field_name, int(sized.group(2))))
+                continue
+            if group:
+                close_group()
+            if field_type in _CODES:
+                codes.append(_CODES[field_type])
+                names.append(field_name)
+                slots.append(("byte" if field_type == "byte" else "value", None))
+            elif sized is not None and sized.group(1) == "bytes":
+                codes.append(f"{sized.group(2)}s")
+                names.append(field_name)
+                slots.append(("value", None))
+            elif sized is not None and sized.group(1) == "pad":
+                codes.append(f"{sized.group(2)}x")
+            else:
+                raise ValueError(f"unknown field type {field_type!r} for the field {field_name!r}")
+        if group:
+            close_group()
+
+        self.__struct = struct.Struct(_BYTE_ORDERS[byteorder] + "".join(codes))
+        self.names = tuple(names)
+        self.record = collections.namedtuple(name, names)
+        self.__convert = self.__compile_convert(slots)
+        self.__flatten = self.__compile_flatten(slots)
+
+    def __compile_convert(self, slots):
+        make = self.record._make
+        if all(kind == "value" for kind, _ in slots):
+            # nothing to post-process: the values read are the fields
+            return make
+
+        def convert(values: tuple) -> tuple:
+            fields: list = []
+            for value, (kind, extractions) in zip(values, slots):
+                if kind == "value":
+                    fields.append(value)
+                elif kind == "byte":
+                    fields.append(Byte.from_int(value))
+                else:
+                    fields.extend((value >> shift) & mask for shift, mask in extractions)
+            return make(fields)
+
+        return convert
+
+    @staticmethod
+    def __compile_flatten(slots):
+        if all(kind == "value" for kind, _ in slots):
+            return tuple
+
+        def flatten(record: tuple) -> list:
+            values: list = []
+            fields = iter(record)
+            for kind, extractions in slots:
+                if kind == "value":
+                    values.append(next(fields))
+                elif kind == "byte":
+                    values.append(int(next(fields)))
+                else:
+                    packed: int = 0
+                    for shift, mask in extractions:
+                        packed |= (int(next(fields)) & mask) << shift
+                    values.append(packed)
+            return values
+
+        return flatten
+
+    @property
+    def size(self) -> int:
+        """
+        The number of bytes of a record.
+        """
+        return self.__struct.size
+
+    @property
+    def format(self) -> str:
+        """
+        The format of the compiled struct.Struct.
+        """
+        return self.__struct.format
+
+    def unpack(self, buffer, offset: int = 0) -> NamedTuple:
+        """
+        Decodes one record from a buffer, without copying it.
+        :param buffer: any object supporting the buffer protocol, or a ByteArray.
+        :param offset: the position of the record in the buffer.
+        :return: the record, a named tuple.
+        """
+        return self.__convert(self.__struct.unpack_from(as_memoryview(buffer), offset))
+
+    def iter_unpack(self, buffer, offset: int = 0, count: int | None = None) -> Iterator[NamedTuple]:
+        """
+        Decodes consecutive records from a buffer lazily, without copying it.
+        :param buffer: any object supporting the buffer protocol (including an mmap), or a ByteArray.
+        :param offset: the position of the first record in the buffer.
+        :param count: the number of records, by default as many whole records as the buffer holds.
+        :return: an iterator over the records.
+        """
+        if self.size == 0:
+            return iter(())
+        view: memoryview = as_memoryview(buffer)
+        available: int = (len(view) - offset) // self.size
+        if count is None:
+            count = available
+        elif count > available:
+            raise ValueError(f"the buffer holds {available} records after the offset, not {count}")
+        records: memoryview = view[offset:offset + count * self.size]
+        return map(self.__convert, self.__struct.iter_unpack(records))
+
+    def pack(self, *values, **fields) -> bytes:
+        """
+        Encodes one record.
+        :param values: the record (a named tuple of this layout) or the values of the fields in order.
+        :param fields: the values of the fields by name, instead of the positional values.
+        :return: the bytes of the record.
+        """
+        return self.__struct.pack(*self.__flatten(self.__record_of(values, fields)))
+
+    def pack_into(self, buffer, offset: int, *values, **fields) -> None:
+        """
+        Encodes one record directly into a writable buffer.
+        """
+        self.__struct.pack_into(as_memoryview(buffer), offset, *self.__flatten(self.__record_of(values, fields)))
+
+    def __record_of(self, values: tuple, fields: dict) -> tuple:
+        if len(values) == 1 and isinstance(values[0], self.record):
+            return values[0]
+        return self.record(*values, **fields)
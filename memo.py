@@ -0,0 +1,59 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Memoization of pure functions over bytes, words and conversions.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from byte import Byte
+
+
+def _freeze(value):
+    """
+    Replaces a mutable Byte by its interned equivalent, so it can be part of a cache key.
+    """
+    if isinstance(value, Byte) and not value.frozen:
+        return value.freeze()
+    return value
+
+
+def memoize(maxsize: int | None = 4096):
+    """
+    Decorates a pure function with a least recently used cache of its results.
+
+    The arguments are the keys of the cache, so they must be hashable: interned Bytes, words,
+    ints, strs, bytes... Mutable Bytes are replaced by their frozen equivalent before the call,
+    which is why the function must not modify its arguments. Arguments of different types are
+    cached separately, so f(3) and f(Byte.from_int(3)) do not share a result.
+
+    :param maxsize: the number of results kept, None for no limit.
+    :return: the decorator. The decorated function has the cache_info and cache_clear
+    functions of functools.lru_cache.
+    """
+    def decorator(function):
+        cached = functools.lru_cache(maxsize=maxsize, typed=True)(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return cached(*map(_freeze, args), **{name: _freeze(value) for name, value in kwargs.items()})
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
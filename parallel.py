@@ -0,0 +1,312 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Conversion and bitwise transforms of very large inputs on a pool of processes.
+
+The input is cut into pieces aligned on the groups of the codecs (3 bytes for base 64, 5 bytes
+for base 32, 4 characters of base 64 text...), so every piece converts independently of its
+neighbours. The pieces are converted by a concurrent.futures process pool and the results are
+yielded in the order of the input, with a bounded number of pieces in flight, so the memory used
+only depends on the piece size and on the number of workers.
+
+When the input is the path of a regular file, the workers memory map it and read their own pieces,
+so only the offsets and the results travel between the processes.
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+import math
+import mmap
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import BinaryIO, Iterable, Iterator, Union
+
+import bulk
+import stream
+from byte_array import as_memoryview
+from codec import Codec, get_codec
+
+# The default number of bytes (or characters of text) of a piece.
+DEFAULT_CHUNK_SIZE: int = 16 << 20
+
+# The bulk operations accepted by transform, and whether they take an operand.
+TRANSFORMS: dict[str, bool] = {
+    "invert": False,
+    "reverse_bits": False,
+    "shift_left": True,
+    "shift_right": True,
+    "rotate_left": True,
+    "rotate_right": True,
+    "bitwise_and": True,
+    "bitwise_or": True,
+    "bitwise_xor": True,
+}
+
+# A piece of raw input: its bytes, or the path, offset and size of a range of a file.
+Piece = Union[bytes, str, tuple[str, int, int]]
+
+
+def _load(piece: Piece) -> bytes | str:
+    """
+    Gets the content of a piece, reading it from its file for a range.
+    """
+    if not isinstance(piece, tuple):
+        return piece
+    path, offset, size = piece
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return mapped[offset:offset + size]
+
+
+def _convert_piece(piece: Piece, source_radix: int | None, target_radix: int | None, separator: str) -> bytes | str:
+    """
+    Converts a piece in a worker. A radix of None stands for raw bytes.
+    """
+    data = _load(piece)
+    if source_radix is not None:
+        data = get_codec(source_radix).decode(data)
+    if target_radix is not None:
+        data = get_codec(target_radix).encode(data, separator)
+    return data
+
+
+def _transform_piece(piece: Piece, operation: str, operand) -> bytes:
+    """
+    Applies a bulk operation to a piece in a worker, with a scalar operand if any.
+    """
+    function = getattr(bulk, operation)
+    result = function(_load(piece)) if operand is None else function(_load(piece), operand)
+    return bytes(result)
+
+
+def _workers(workers: int | None) -> int:
+    if workers is None or workers == 0:
+        return os.cpu_count() or 1
+    if workers < 0:
+        raise ValueError("the number of workers must be positive")
+    return workers
+
+
+def _ordered(function, pieces: Iterable, workers: int | None, *args) -> Iterator:
+    """
+    Applies a function to the pieces on a pool of processes and yields the results in order.
+    Inputs of a single piece, or a single worker, are processed in the current process.
+    :param function: a function of the module taking a piece and the extra arguments.
+    :param pieces: the pieces, produced lazily.
+    :param workers: the number of processes, all the cores if None or 0.
+    """
+    workers = _workers(workers)
+    pieces = iter(pieces)
+    first: list = [piece for _, piece in zip(range(2), pieces)]
+    if workers == 1 or len(first) < 2:
+        for piece in first:
+            yield function(piece, *args)
+        for piece in pieces:
+            yield function(piece, *args)
+        return
+
+    # two pieces per worker in flight: one being processed, one waiting
+    window: int = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: collections.deque[Future] = collections.deque()
+        for piece in itertools.chain(first, pieces):
+            pending.append(executor.submit(function, piece, *args))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _raw_pieces(data, size: int) -> Iterator[Piece]:
+    """
+    Cuts raw input into pieces of the given size: file ranges for a path, bytes otherwise.
+    """
+    if isinstance(data, (str, os.PathLike)):
+        path: str = os.fspath(data)
+        length: int = os.path.getsize(path)
+        for offset in range(0, length, size):
+            yield path, offset, min(size, length - offset)
+    elif hasattr(data, "read"):
+        # pipes and sockets return short reads, which would not end on whole groups
+        yield from stream.regroup(stream.iter_file_chunks(data, size), size)
+    else:
+        view: memoryview = as_memoryview(data)
+        for start in range(0, len(view), size):
+            yield bytes(view[start:start + size])
+
+
+def _text_pieces(text: str | Iterable[str], size: int) -> Iterator[str]:
+    """
+    Cuts text, without its whitespace, into pieces of the given size.
+    """
+    chunks: Iterable[str] = (text,) if isinstance(text, str) else text
+    stripped: Iterator[str] = (chunk.translate(stream.WHITESPACE) for chunk in chunks)
+    for chunk in stream.regroup(stripped, size):
+        for start in range(0, len(chunk), size):
+            yield chunk[start:start + size]
+
+
+def _piece_size(chunk_size: int, group: int) -> int:
+    return max(chunk_size - chunk_size % group, group)
+
+
+def _codec(base: int | str) -> Codec | None:
+    return None if base == stream.RAW else get_codec(base)
+
+
+def iter_convert(data, source_base: int | str, target_base: int | str, separator: str = "",
+                 workers: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes | str]:
+    """
+    Converts an input from one representation to another on a pool of processes.
+    :param data: raw input: a path (read by the workers through mmap), a file object opened in binary mode,
+    a ByteArray or any object supporting the buffer protocol. Text input: a str, or an iterable of str
+    such as stream.iter_text_chunks. Whitespace in the text is ignored.
+    :param source_base: the representation of the input: "raw" for bytes, or a base of the codecs.
+    :param target_base: the representation to convert to: "raw" for bytes, or a base of the codecs.
+    :param separator: for a text target, a string inserted between the groups of characters.
+    :param workers: the number of processes, all the cores if None or 0.
+    :param chunk_size: the number of bytes, or of characters for a text input, of a piece.
+    :return: an iterator over the converted pieces, in order: bytes for a raw target, str otherwise.
+    """
+    source: Codec | None = _codec(source_base)
+    target: Codec | None = _codec(target_base)
+    byte_group: int = 1 if target is None else target.byte_group
+    if source is None:
+        pieces: Iterator[Piece] = _raw_pieces(data, _piece_size(chunk_size, byte_group))
+    else:
+        # enough character groups to decode into whole groups of the target
+        group: int = source.char_group * (byte_group // math.gcd(byte_group, source.byte_group))
+        pieces: Iterator[Piece] = _text_pieces(data, _piece_size(chunk_size, group))
+
+    results: Iterator[bytes | str] = _ordered(_convert_piece, pieces, workers,
+                                              source and source.radix, target and target.radix, separator)
+    if target is None or not separator:
+        yield from results
+        return
+    first: bool = True
+    for result in results:
+        if not first:
+            yield separator
+        first = False
+        yield result
+
+
+def encode(data, base: int | str, separator: str = "", workers: int | None = None,
+           chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Encodes bytes into text in the given base on a pool of processes, like codec.encode.
+    :param data: a path, a file object opened in binary mode, a ByteArray or any object supporting the buffer protocol.
+    """
+    return "".join(iter_convert(data, stream.RAW, base, separator, workers, chunk_size))
+
+
+def decode(text: str | Iterable[str], base: int | str, workers: int | None = None,
+           chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+    """
+    Decodes text in the given base into bytes on a pool of processes, like codec.decode.
+    :param text: a str, or an iterable of str such as stream.iter_text_chunks.
+    :raises ValueError: if the text is not valid in the base.
+    """
+    return b"".join(iter_convert(text, base, stream.RAW, "", workers, chunk_size))
+
+
+def render_bits(data, separator: str = "", workers: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Renders bytes as text of bits in the order of Byte.__str__ (the first bit first) on a pool of processes.
+    """
+    return encode(data, 2, separator, workers, chunk_size)
+
+
+def transform(data, operation: str, operand=None, out=None, workers: int | None = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Applies a bitwise operation of the bulk module to every byte of an input on a pool of processes.
+    :param data: a path, a file object opened in binary mode, a ByteArray or any object supporting the buffer protocol.
+    :param operation: the name of the operation, one of TRANSFORMS.
+    :param operand: the count of the shifts and rotations, or the right operand of the bitwise
+    operations: a scalar or a sequence of the same length as the input.
+    :param out: a writable buffer of the same length receiving the result, which is then returned.
+    :param workers: the number of processes, all the cores if None or 0.
+    :param chunk_size: the number of bytes of a piece.
+    :return: the result as a bytearray, or out.
+    :raises ValueError: if the operation is unknown, or an operand is missing or of a different length.
+    """
+    try:
+        binary: bool = TRANSFORMS[operation]
+    except KeyError:
+        raise ValueError(f"unknown operation: {operation!r}") from None
+    if binary and operand is None:
+        raise ValueError(f"{operation} requires an operand")
+
+    pieces: Iterator[Piece] = _raw_pieces(data, chunk_size)
+    if binary and not isinstance(operand, (int, str, bulk.Byte)):
+        # a sequence operand is cut into the same pieces as the input
+        operand_pieces: Iterator[Piece] = _raw_pieces(operand, chunk_size)
+        results: Iterator[bytes] = _ordered(_transform_pair, _paired(pieces, operand_pieces), workers, operation)
+    else:
+        if isinstance(operand, bulk.Byte):
+            operand = int(operand)
+        results: Iterator[bytes] = _ordered(_transform_piece, pieces, workers, operation, operand)
+
+    if out is None:
+        result: bytearray = bytearray()
+        for piece in results:
+            result += piece
+        return result
+    view: memoryview = as_memoryview(out)
+    position: int = 0
+    for piece in results:
+        view[position:position + len(piece)] = piece
+        position += len(piece)
+    if position != len(view):
+        raise ValueError("out must have the same length as the input")
+    return out
+
+
+def _paired(pieces: Iterator[Piece], operand_pieces: Iterator[Piece]) -> Iterator[tuple[Piece, Piece]]:
+    """
+    Pairs the pieces of the input with those of the operand.
+    :raises ValueError: if one of them has more pieces than the other.
+    """
+    for pair in itertools.zip_longest(pieces, operand_pieces):
+        if pair[0] is None or pair[1] is None:
+            raise ValueError("the operands must have the same length")
+        yield pair
+
+
+def _transform_pair(pair: tuple[Piece, Piece], operation: str) -> bytes:
+    """
+    Applies a bulk operation to a piece of the input and the matching piece of the operand in a worker.
+    """
+    piece, operand = pair
+    operand = _load(operand)
+    left = _load(piece)
+    if len(left) != len(operand):
+        raise ValueError("the operands must have the same length")
+    return bytes(getattr(bulk, operation)(left, operand))
+
+
+def convert_file(source: str | os.PathLike | BinaryIO, source_base: int | str,
+                 target_base: int | str, separator: str = "", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 workers: int | None = None) -> Iterator[bytes | str]:
+    """
+    Converts a file from one representation to another on a pool of processes, like stream.convert_file.
+    :param source: the path of the file or a file object opened in binary mode.
+    :return: an iterator over the converted pieces, in order: bytes for a raw target, str otherwise.
+    """
+    if source_base != stream.RAW:
+        source = stream.iter_text_chunks(source, chunk_size)
+    return iter_convert(source, source_base, target_base, separator, workers, chunk_size)
@@ -0,0 +1,266 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Conversion of huge integers and buffers to and from any radix between 2 and 62.
+
+The naive conversion divides the number by the radix once per digit, which is quadratic in
+the size of the number. This module splits the number recursively around precomputed powers
+of the radix instead: the high and the low halves are converted independently and joined.
+The arithmetic of the splits is done with the decimal module, whose multiplication and division
+of huge integers are subquadratic (number theoretic transform and Newton division), which the
+int type of CPython does not offer. The radices 2, 8, 10 and 16 use the linear conversions of
+the int and Decimal types and never split.
+
+The numbers are written with the most significant digit first. Buffers are read as big endian
+unsigned integers by default, so leading zero bytes are not represented in the text.
+"""
+
+from __future__ import annotations
+
+import decimal
+import math
+
+from byte_array import as_memoryview
+from codec import DIGITS
+
+# The number of digits below which the naive conversion is faster than a split.
+_LEAF_DIGITS: int = 512
+
+# The number of bits below which an int is converted to a Decimal directly.
+_LEAF_BITS: int = 2048
+
+# An exact context for integers of any size, any rounding raising an exception.
+_CONTEXT: decimal.Context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX,
+                                            Emin=decimal.MIN_EMIN, traps=[decimal.Inexact])
+
+
+def _alphabet_of(radix: int, alphabet: str) -> str:
+    if not 2 <= radix <= len(alphabet):
+        raise ValueError(f"the radix must be between 2 and {len(alphabet)}, not {radix}")
+    return alphabet[:radix]
+
+
+class _Powers(dict):
+    """
+    A cache of the powers of a base as Decimals, computed on first use.
+    """
+
+    def __init__(self, base: int) -> None:
+        super().__init__()
+        self.__base: decimal.Decimal = _CONTEXT.create_decimal(base)
+
+    def __missing__(self, exponent: int) -> decimal.Decimal:
+        power: decimal.Decimal = _CONTEXT.power(self.__base, exponent)
+        self[exponent] = power
+        return power
+
+
+def _int_to_decimal(number: int) -> decimal.Decimal:
+    """
+    Converts a non-negative int to a Decimal by splitting it around powers of two.
+    """
+    powers: _Powers = _Powers(2)
+
+    def convert(value: int, bits: int) -> decimal.Decimal:
+        if bits <= _LEAF_BITS:
+            return _CONTEXT.create_decimal(value)
+        low_bits: int = bits >> 1
+        high: int = value >> low_bits
+        low: int = value - (high << low_bits)
+        return _CONTEXT.add(_CONTEXT.multiply(convert(high, bits - low_bits), powers[low_bits]),
+                            convert(low, low_bits))
+
+    return convert(number, number.bit_length())
+
+
+def _decimal_to_int(number: decimal.Decimal, bits: int) -> int:
+    """
+    Converts a non-negative integral Decimal lower than 2 to the power of bits to an int
+    by splitting it around powers of two.
+    """
+    powers: _Powers = _Powers(2)
+
+    def convert(value: decimal.Decimal, width: int) -> int:
+        if width <= _LEAF_BITS:
+            return int(value)
+        low_bits: int = width >> 1
+        high, low = _CONTEXT.divmod(value, powers[low_bits])
+        return (convert(high, width - low_bits) << low_bits) | convert(low, low_bits)
+
+    return convert(number, bits)
+
+
+def _render_naive(number: int, radix: int, alphabet: str, width: int = 0) -> str:
+    """
+    Writes a non-negative int in the radix by repeated division,
+    padded with zeros to the given number of digits.
+    """
+    digits: list[str] = []
+    while number:
+        number, digit = divmod(number, radix)
+        digits.append(alphabet[digit])
+    if len(digits) < width:
+        digits.extend(alphabet[0] * (width - len(digits)))
+    digits.reverse()
+    return "".join(digits) or alphabet[0]
+
+
+def _parse_naive(text: str, radix: int, alphabet: str) -> int:
+    """
+    Reads a non-negative int written in the radix by multiplying digit after digit.
+    """
+    values: dict[str, int] = {digit: value for value, digit in enumerate(alphabet)}
+    number: int = 0
+    try:
+        for digit in text:
+            number = number * radix + values[digit]
+    except KeyError as error:
+        raise ValueError(f"invalid digit in base {radix}: {error.args[0]!r}") from None
+    return number
+
+
+def int_to_str_naive(number: int, radix: int, alphabet: str = DIGITS) -> str:
+    """
+    Writes an int in the radix by dividing it once per digit. This conversion is quadratic
+    and only meant for small numbers or as a reference.
+    """
+    alphabet = _alphabet_of(radix, alphabet)
+    if number < 0:
+        return "-" + _render_naive(-number, radix, alphabet)
+    return _render_naive(number, radix, alphabet)
+
+
+def str_to_int_naive(text: str, radix: int, alphabet: str = DIGITS) -> int:
+    """
+    Reads an int written in the radix by multiplying it once per digit. This conversion is quadratic
+    and only meant for small numbers or as a reference.
+    """
+    alphabet = _alphabet_of(radix, alphabet)
+    if text.startswith("-"):
+        return -_parse_naive(text[1:], radix, alphabet)
+    return _parse_naive(text, radix, alphabet)
+
+
+def int_to_str(number: int, radix: int, alphabet: str = DIGITS) -> str:
+    """
+    Writes an int in the radix, most significant digit first, in subquadratic time.
+    :param number: the int to write. Negative numbers are prefixed with '-'.
+    :param radix: the radix, between 2 and the length of the alphabet included.
+    :param alphabet: the digits, in order. Only the first radix digits are used.
+    :return: the digits of the number.
+    """
+    alphabet = _alphabet_of(radix, alphabet)
+    if number < 0:
+        return "-" + int_to_str(-number, radix, alphabet)
+
+    if alphabet == DIGITS[:radix] and radix in (2, 8, 16):
+        return format(number, {2: "b", 8: "o", 16: "x"}[radix])
+    if radix == 10 and alphabet == DIGITS[:10]:
+        return str(_int_to_decimal(number))
+    if number.bit_length() <= _LEAF_BITS:
+        return _render_naive(number, radix, alphabet)
+
+    powers: _Powers = _Powers(radix)
+    parts: list[str] = []
+
+    def render(value: decimal.Decimal, width: int) -> None:
+        # value is lower than radix ** width and is written with exactly width digits
+        if width <= _LEAF_DIGITS:
+            parts.append(_render_naive(int(value), radix, alphabet, width))
+            return
+        low_width: int = width >> 1
+        high, low = _CONTEXT.divmod(value, powers[low_width])
+        render(high, width - low_width)
+        render(low, low_width)
+
+    width: int = math.ceil(number.bit_length() / math.log2(radix)) + 1
+    render(_int_to_decimal(number), width)
+    return "".join(parts).lstrip(alphabet[0]) or alphabet[0]
+
+
+def str_to_int(text: str, radix: int, alphabet: str = DIGITS) -> int:
+    """
+    Reads an int written in the radix, most significant digit first, in subquadratic time.
+    :param text: the digits of the number, optionally prefixed with '-'.
+    :param radix: the radix, between 2 and the length of the alphabet included.
+    :param alphabet: the digits, in order. Only the first radix digits are used.
+    :return: the int read.
+    :raises ValueError: if the text contains a character which is not a digit of the radix.
+    """
+    alphabet = _alphabet_of(radix, alphabet)
+    if text.startswith("-") and not text.startswith("--"):
+        return -str_to_int(text[1:], radix, alphabet)
+    if not text:
+        raise ValueError(f"empty number in base {radix}")
+
+    standard: bool = alphabet == DIGITS[:radix]
+    if standard and radix in (2, 4, 8, 16, 32):
+        # the int type reads the power of two radices in linear time, but also accepts prefixes,
+        # underscores, signs, spaces and upper case digits, so the digits are checked first
+        invalid: str = text.lstrip(alphabet)
+        if invalid:
+            raise ValueError(f"invalid digit in base {radix}: {invalid[0]!r}")
+        return int(text, radix)
+    if len(text) <= _LEAF_DIGITS:
+        return _parse_naive(text, radix, alphabet)
+
+    if standard and radix == 10:
+        if not text.isascii() or not text.isdigit():
+            raise ValueError(f"invalid digit in base 10 in {text[:20]!r}...")
+        number: decimal.Decimal = _CONTEXT.create_decimal(text)
+    else:
+        powers: _Powers = _Powers(radix)
+
+        def parse(start: int, end: int) -> decimal.Decimal:
+            if end - start <= _LEAF_DIGITS:
+                return _CONTEXT.create_decimal(_parse_naive(text[start:end], radix, alphabet))
+            middle: int = (start + end) >> 1
+            return _CONTEXT.add(_CONTEXT.multiply(parse(start, middle), powers[end - middle]),
+                                parse(middle, end))
+
+        number: decimal.Decimal = parse(0, len(text))
+
+    return _decimal_to_int(number, math.ceil(len(text) * math.log2(radix)) + 1)
+
+
+def encode(data, radix: int, alphabet: str = DIGITS, byteorder: str = "big") -> str:
+    """
+    Writes a buffer, read as one unsigned integer, in the radix.
+    :param data: a ByteArray, any object supporting the buffer protocol or an iterable of Byte and int.
+    :param radix: the radix, between 2 and the length of the alphabet included.
+    :param alphabet: the digits, in order.
+    :param byteorder: "big" if the first byte is the most significant, "little" otherwise.
+    :return: the digits of the integer, without leading zeros.
+    """
+    return int_to_str(int.from_bytes(as_memoryview(data), byteorder), radix, alphabet)
+
+
+def decode(text: str, radix: int, alphabet: str = DIGITS, length: int | None = None,
+           byteorder: str = "big") -> bytes:
+    """
+    Reads an unsigned integer written in the radix into a buffer.
+    :param text: the digits of the integer.
+    :param radix: the radix, between 2 and the length of the alphabet included.
+    :param alphabet: the digits, in order.
+    :param length: the number of bytes of the buffer. By default, the fewest bytes holding the integer.
+    :param byteorder: "big" if the first byte is the most significant, "little" otherwise.
+    :return: the bytes of the integer.
+    """
+    number: int = str_to_int(text, radix, alphabet)
+    if number < 0:
+        raise ValueError("a buffer holds an unsigned integer")
+    if length is None:
+        length = (number.bit_length() + 7) // 8
+    return number.to_bytes(length, byteorder)
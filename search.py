@@ -0,0 +1,272 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Search of bit patterns at any bit offset of large buffers and files.
+
+The bit offsets follow the order of Byte: bit offset 8 * i + j is the bit j (the first bit being
+the least significant one) of the byte i. A pattern is written like the strings of Byte.from_str,
+its first character being the bit at the lowest offset, with '.' or '?' matching any bit:
+
+    >>> list(BitSearcher(["1.11"]).finditer(bytes([0b10100000, 0b1])))
+    [BitMatch(offset=5, pattern=0)]
+
+Each pattern is compiled into its eight variants shifted by 0 to 7 bits, each one a pattern of whole
+bytes where some bytes are fully known. The longest run of known bytes of a variant is its anchor,
+written as a regular expression made of the first byte of the anchor followed by a lookahead on the
+rest, so overlapping occurrences are found too. The variants without any fully known byte (short
+patterns, or patterns full of wildcards) are anchored on the classes of all their bytes. The distinct
+anchors of all the variants of all the patterns are joined into a single alternation, which the re
+engine only tries at the bytes starting one of them, so a buffer or a memory mapped file is scanned
+in place, once, whatever the number of patterns. At each candidate, the anchors starting with its
+byte are checked and the whole variants of the matching ones are compared, as single integers.
+"""
+
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import re
+from typing import BinaryIO, Iterable, Iterator, NamedTuple
+
+from byte_array import as_memoryview
+
+# The characters of a pattern matching any bit.
+WILDCARDS: str = ".?"
+
+# The characters of a pattern ignored, to write its bits in groups.
+_IGNORED: dict[int, None] = dict.fromkeys(map(ord, " _\t\n"))
+
+
+class BitMatch(NamedTuple):
+    """
+    An occurrence of a pattern.
+
+    Attributes\\:
+            offset: the bit offset of the first bit of the occurrence.\\n
+            pattern: the index of the pattern found in the patterns of the searcher.
+    """
+    offset: int
+    pattern: int
+
+
+class BitPattern(NamedTuple):
+    """
+    A pattern of bits.
+
+    Attributes\\:
+            value: the bits of the pattern, the first one as the least significant bit.\\n
+            mask: 1 for the bits of the pattern which must match, 0 for the wildcards.\\n
+            length: the number of bits of the pattern.
+    """
+    value: int
+    mask: int
+    length: int
+
+    @staticmethod
+    def from_str(text: str) -> BitPattern:
+        """
+        Parses a pattern: '0' and '1' for the bits, '.' or '?' for any bit. Spaces and '_' are ignored.
+        :raises ValueError: if the pattern is empty or holds another character.
+        """
+        text = text.translate(_IGNORED)
+        if not text:
+            raise ValueError("empty bit pattern")
+        value: int = 0
+        mask: int = 0
+        for index, char in enumerate(text):
+            if char == "1":
+                value |= 1 << index
+                mask |= 1 << index
+            elif char == "0":
+                mask |= 1 << index
+            elif char not in WILDCARDS:
+                raise ValueError(f"invalid character {char!r} at position {index} of a bit pattern")
+        return BitPattern(value, mask, len(text))
+
+    def __str__(self) -> str:
+        return "".join("." if not (self.mask >> index) & 1 else "01"[(self.value >> index) & 1]
+                       for index in range(self.length))
+
+
+class _Variant(NamedTuple):
+    """
+    A pattern shifted by some bits, on whole bytes, with the regular expression of its anchor
+    and the values of the first byte of its anchor.
+    """
+    pattern: int
+    shift: int
+    size: int
+    value: int
+    mask: int
+    anchor: int
+    regex: re.Pattern
+    first: bytes
+
+
+def _byte_regex(value: int, mask: int) -> bytes:
+    """
+    The regular expression of a byte whose bits of the mask are those of the value.
+    """
+    if mask == 0xFF:
+        return re.escape(bytes((value,)))
+    if mask == 0:
+        return b"."
+    return b"[" + b"".join(map(re.escape, _byte_values(value, mask))) + b"]"
+
+
+def _byte_values(value: int, mask: int) -> list[bytes]:
+    """
+    The bytes whose bits of the mask are those of the value.
+    """
+    return [bytes((byte,)) for byte in range(256) if byte & mask == value & mask]
+
+
+def _variant(index: int, pattern: BitPattern, shift: int) -> _Variant:
+    """
+    Compiles a pattern shifted by some bits.
+    """
+    size: int = (shift + pattern.length + 7) // 8
+    value: int = pattern.value << shift
+    mask: int = pattern.mask << shift
+    masks: list[int] = [(mask >> (8 * byte)) & 0xFF for byte in range(size)]
+    regexes: list[bytes] = [_byte_regex((value >> (8 * byte)) & 0xFF, masks[byte]) for byte in range(size)]
+
+    # the longest run of fully known bytes
+    anchor: int = 0
+    anchor_size: int = 0
+    run: int = 0
+    for byte, byte_mask in enumerate(masks):
+        run = run + 1 if byte_mask == 0xFF else 0
+        if run > anchor_size:
+            anchor, anchor_size = byte - run + 1, run
+    if anchor_size:
+        regexes = regexes[anchor:anchor + anchor_size]
+    # the first byte is consumed so the next search starts on the next byte: overlaps are found
+    regex: re.Pattern = re.compile(regexes[0] + b"(?=" + b"".join(regexes[1:]) + b")", re.DOTALL)
+    first: bytes = b"".join(_byte_values((value >> (8 * anchor)) & 0xFF, masks[anchor]))
+    return _Variant(index, shift, size, value, mask, anchor, regex, first)
+
+
+class BitSearcher:
+    """
+    A set of bit patterns compiled for searching.
+
+    Attributes\\:
+            __patterns: the patterns.\\n
+            __regex: the alternation of the distinct anchors of all the variants.\\n
+            __candidates: for each byte value, the anchors starting with it and their variants.\\n
+            __lag: the greatest number of bits a variant starts before the first byte of its anchor.
+    """
+
+    __slots__ = ("__patterns", "__regex", "__candidates", "__lag")
+
+    def __init__(self, patterns: Iterable[str | BitPattern]) -> None:
+        """
+        Compile patterns.
+        :param patterns: the patterns, as strings (see BitPattern.from_str) or BitPatterns.
+        :raises ValueError: if there is no pattern or a pattern is invalid.
+        """
+        self.__patterns = tuple(pattern if isinstance(pattern, BitPattern) else BitPattern.from_str(pattern)
+                                for pattern in patterns)
+        if not self.__patterns:
+            raise ValueError("no pattern to search")
+        anchors: dict[bytes, list[_Variant]] = {}
+        for index, pattern in enumerate(self.__patterns):
+            for shift in range(8):
+                variant: _Variant = _variant(index, pattern, shift)
+                anchors.setdefault(variant.regex.pattern, []).append(variant)
+        self.__regex = re.compile(b"|".join(anchors), re.DOTALL)
+        self.__candidates = tuple(tuple((variants[0].regex, tuple(variants)) for variants in anchors.values()
+                                        if byte in variants[0].first)
+                                  for byte in range(256))
+        self.__lag = 8 * max(variant.anchor for variants in anchors.values() for variant in variants)
+
+    @property
+    def patterns(self) -> tuple[BitPattern, ...]:
+        return self.__patterns
+
+    def finditer(self, data, start: int = 0, end: int | None = None) -> Iterator[BitMatch]:
+        """
+        Finds all the occurrences of the patterns, overlapping ones included.
+        :param data: a ByteArray, any object supporting the buffer protocol (an mmap is searched in place)
+        or an iterable of Byte and int.
+        :param start: the bit offset where the search starts.
+        :param end: the bit offset where the search ends, the end of the data if None.
+        :return: an iterator over the matches, by increasing bit offset, then by pattern.
+        """
+        view = data if isinstance(data, (bytes, bytearray, mmap.mmap)) else as_memoryview(data)
+        start = max(start, 0)
+        length: int = 8 * len(view) if end is None else min(end, 8 * len(view))
+        first_byte: int = start // 8
+        last_byte: int = (length + 7) // 8
+        pending: list[tuple[int, int]] = []
+        for found in self.__regex.finditer(view, first_byte, last_byte):
+            byte: int = found.start()
+            for regex, variants in self.__candidates[view[byte]]:
+                if not regex.match(view, byte, last_byte):
+                    continue
+                for variant in variants:
+                    position: int = byte - variant.anchor
+                    offset: int = 8 * position + variant.shift
+                    if offset < start or offset + self.__patterns[variant.pattern].length > length:
+                        continue
+                    word: int = int.from_bytes(view[position:position + variant.size], "little")
+                    if word & variant.mask == variant.value:
+                        heapq.heappush(pending, (offset, variant.pattern))
+            # the matches are yielded in order, once no variant found later can start before them
+            while pending and pending[0][0] < 8 * byte - self.__lag:
+                yield BitMatch(*heapq.heappop(pending))
+        while pending:
+            yield BitMatch(*heapq.heappop(pending))
+
+    def findall(self, data, start: int = 0, end: int | None = None) -> list[BitMatch]:
+        return list(self.finditer(data, start, end))
+
+    def count(self, data, start: int = 0, end: int | None = None) -> int:
+        return sum(1 for _ in self.finditer(data, start, end))
+
+
+def search(data, patterns: str | BitPattern | Iterable[str | BitPattern]) -> Iterator[BitMatch]:
+    """
+    Finds all the occurrences of one or several bit patterns in a buffer.
+    :param data: a ByteArray, any object supporting the buffer protocol or an iterable of Byte and int.
+    :param patterns: a pattern or several patterns, see BitPattern.from_str.
+    :return: an iterator over the matches, by increasing bit offset, then by pattern.
+    """
+    if isinstance(patterns, (str, BitPattern)):
+        patterns = (patterns,)
+    return BitSearcher(patterns).finditer(data)
+
+
+def search_file(file: str | os.PathLike | BinaryIO, patterns: str | BitPattern | Iterable[str | BitPattern]
+                ) -> Iterator[BitMatch]:
+    """
+    Finds all the occurrences of one or several bit patterns in a file, memory mapped and searched in place.
+    :param file: the path of a regular file, or a regular file opened in binary mode.
+    :param patterns: a pattern or several patterns, see BitPattern.from_str.
+    :return: an iterator over the matches, by increasing bit offset, then by pattern.
+    """
+    if isinstance(patterns, (str, BitPattern)):
+        patterns = (patterns,)
+    searcher: BitSearcher = BitSearcher(patterns)
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with open(file, "rb") as opened_file:
+            yield from search_file(opened_file, searcher.patterns)
+        return
+    if os.fstat(file.fileno()).st_size == 0:
+        return
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield from searcher.finditer(mapped)
@@ -0,0 +1,335 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+A local conversion and arithmetic service over TCP or a Unix socket, so other processes
+do not pay the start-up of a Python interpreter for every conversion.
+
+The protocol is made of JSON lines. Each request is an object with an "op" and an optional
+"id" which is echoed in its response. The responses are written in the order of the requests,
+so clients may pipeline as many requests as they want on a connection.
+
+    {"id": 1, "op": "convert", "data": "48656c6c6f", "from": "hex", "to": "base64"}
+    {"id": 1, "result": "SGVsbG8="}
+    {"id": 2, "op": "add", "left": 200, "right": "1001"}
+    {"id": 2, "result": 209}
+    {"id": 3, "op": "rotate_left", "left": 1, "count": 3}
+    {"id": 3, "result": 8}
+    {"id": 4, "op": "nope"}
+    {"id": 4, "error": "unknown operation: 'nope'"}
+
+The operands of the arithmetic requests are ints or strings of bits, as accepted by Byte.from_int and
+Byte.from_str, and the results follow the Byte operators. The arithmetic requests waiting on a connection
+are batched: consecutive requests of the same operation are answered by a single call of the bulk module.
+The results of large conversions are streamed, waiting for the client to read them as they are written.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+from typing import Iterable, Iterator
+
+import bulk
+from byte import Byte
+from codec import Codec, get_codec
+from stream import WHITESPACE, decode_stream, encode_stream
+
+# The default TCP port of the service.
+DEFAULT_PORT: int = 8642
+
+# The maximum length of a request line.
+MAX_LINE: int = 256 << 20
+
+# The maximum number of requests processed together.
+BATCH_SIZE: int = 4096
+
+# The number of characters above which the result of a conversion is streamed, and the size of its pieces.
+STREAM_CHUNK_SIZE: int = 1 << 20
+
+# The arithmetic operations: the bulk function and whether it takes a second operand or a count.
+_BINARY: dict[str, object] = {
+    "add": bulk.add,
+    "subtract": bulk.subtract,
+    "multiply": bulk.multiply,
+    "and": bulk.bitwise_and,
+    "or": bulk.bitwise_or,
+    "xor": bulk.bitwise_xor,
+    "less": bulk.less,
+    "less_equal": bulk.less_equal,
+    "greater": bulk.greater,
+    "greater_equal": bulk.greater_equal,
+    "equal": bulk.equal,
+    "not_equal": bulk.not_equal,
+}
+_UNARY: dict[str, object] = {
+    "invert": bulk.invert,
+    "reverse_bits": bulk.reverse_bits,
+}
+_COUNTED: dict[str, object] = {
+    "shift_left": bulk.shift_left,
+    "shift_right": bulk.shift_right,
+    "rotate_left": bulk.rotate_left,
+    "rotate_right": bulk.rotate_right,
+}
+_COMPARISONS: frozenset[str] = frozenset(("less", "less_equal", "greater", "greater_equal", "equal", "not_equal"))
+
+
+def _operand(value) -> int:
+    """
+    Parses an operand of an arithmetic request.
+    """
+    if isinstance(value, str):
+        return int(Byte.from_str(value))
+    if isinstance(value, int):
+        return int(Byte.from_int(value))
+    raise ValueError(f"an operand must be an int or a string of bits, not {value!r}")
+
+
+def _batch_key(request: dict) -> tuple | None:
+    """
+    Gets the key grouping the arithmetic requests answered by the same bulk call,
+    None for the requests answered one by one.
+    """
+    op = request.get("op")
+    if not isinstance(op, str):
+        return None
+    if op in _BINARY or op in _UNARY:
+        return op,
+    if op in _COUNTED:
+        return op, request.get("count", 1)
+    return None
+
+
+def _compute(requests: list[dict]) -> list[dict]:
+    """
+    Answers arithmetic requests of the same batch key with a single bulk call.
+    :return: one response per request, in order: its result or its error.
+    """
+    op: str = requests[0]["op"]
+    try:
+        left: bytearray = bytearray(_operand(request.get("left")) for request in requests)
+        if op in _BINARY:
+            results = _BINARY[op](left, bytearray(_operand(request.get("right")) for request in requests))
+        elif op in _UNARY:
+            results = _UNARY[op](left)
+        else:
+            results = _COUNTED[op](left, requests[0].get("count", 1))
+    except (ValueError, TypeError) as error:
+        if len(requests) == 1:
+            return [_error(requests[0].get("id"), error)]
+        # answer the requests one by one, so only the invalid ones get an error
+        return [response for request in requests for response in _compute([request])]
+    convert = bool if op in _COMPARISONS else int
+    return [{"id": request.get("id"), "result": convert(result)} for request, result in zip(requests, results)]
+
+
+def _convert_chunks(request: dict) -> Iterator[str]:
+    """
+    Converts the text of a conversion request, piece by piece.
+    """
+    text = request.get("data")
+    if not isinstance(text, str):
+        raise ValueError("the data of a conversion must be a string")
+    source: Codec = get_codec(request.get("from", "hex"))
+    target: Codec = get_codec(request.get("to", "hex"))
+    separator = request.get("separator", "")
+    if not isinstance(separator, str):
+        raise ValueError("the separator of a conversion must be a string")
+    text = text.translate(WHITESPACE)
+    pieces: Iterable[str] = (text[start:start + STREAM_CHUNK_SIZE] for start in range(0, len(text), STREAM_CHUNK_SIZE))
+    return encode_stream(decode_stream(pieces, source), target, separator)
+
+
+def _error(request_id, error: Exception) -> dict:
+    message: str = str(error) if not isinstance(error, KeyError) else f"missing {error}"
+    return {"id": request_id, "error": message}
+
+
+def _line(response: dict) -> bytes:
+    return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+
+async def _answer_convert(request: dict, writer: asyncio.StreamWriter) -> None:
+    """
+    Answers a conversion request, streaming the result of a large conversion with backpressure.
+    """
+    chunks: Iterator[str] = _convert_chunks(request)
+    first: str = next(chunks, "")
+    second: str | None = next(chunks, None)
+    if second is None:
+        writer.write(_line({"id": request.get("id"), "result": first}))
+        return
+
+    # the response is written piece by piece: the string of the result is opened, filled
+    # with the escaped pieces and closed, followed by an error if a later piece is invalid
+    writer.write(_line({"id": request.get("id"), "result": ""})[:-3])
+    end: bytes = b'"}\n'
+    try:
+        for chunk in itertools.chain((first, second), chunks):
+            writer.write(json.dumps(chunk)[1:-1].encode())
+            await writer.drain()
+    except (ValueError, TypeError) as error:
+        end = b'",' + _line({"error": str(error)})[1:]
+    finally:
+        writer.write(end)
+
+
+async def _answer(batch: list[bytes], writer: asyncio.StreamWriter) -> None:
+    """
+    Answers a batch of request lines, in order.
+    """
+    requests: list[dict | Exception] = []
+    for line in batch:
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request must be a JSON object")
+            requests.append(request)
+        except ValueError as error:
+            requests.append(ValueError(f"invalid request: {error}"))
+
+    index: int = 0
+    while index < len(requests):
+        request = requests[index]
+        if isinstance(request, Exception):
+            writer.write(_line(_error(None, request)))
+            index += 1
+            continue
+
+        key: tuple | None = _batch_key(request)
+        if key is not None:
+            end: int = index + 1
+            while end < len(requests) and isinstance(requests[end], dict) and _batch_key(requests[end]) == key:
+                end += 1
+            writer.write(b"".join(map(_line, _compute(requests[index:end]))))
+            index = end
+            continue
+
+        try:
+            if request.get("op") != "convert":
+                raise ValueError(f"unknown operation: {request.get('op')!r}")
+            await _answer_convert(request, writer)
+        except (ValueError, TypeError, KeyError) as error:
+            writer.write(_line(_error(request.get("id"), error)))
+        index += 1
+    await writer.drain()
+
+
+async def _serve_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    Serves a connection: one task reads the request lines, this one answers them in batches.
+    The queue between them is bounded, so a client which does not read its responses
+    is not read either.
+    """
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=BATCH_SIZE)
+
+    async def read() -> None:
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    await queue.put(line)
+        except (ValueError, ConnectionError):
+            # a line longer than MAX_LINE, or a reset connection
+            pass
+        finally:
+            await queue.put(None)
+
+    reading: asyncio.Task = asyncio.create_task(read())
+    try:
+        done: bool = False
+        while not done:
+            batch: list[bytes] = []
+            line: bytes | None = await queue.get()
+            while line is not None:
+                batch.append(line)
+                if len(batch) >= BATCH_SIZE or queue.empty():
+                    break
+                line = queue.get_nowait()
+            done = line is None
+            if batch:
+                await _answer(batch, writer)
+    except ConnectionError:
+        pass
+    finally:
+        reading.cancel()
+        writer.close()
+
+
+async def start_server(host: str = "127.0.0.1", port: int = DEFAULT_PORT, path: str | None = None) -> asyncio.Server:
+    """
+    Starts the service.
+    :param host: the address to listen to over TCP.
+    :param port: the TCP port, 0 for any free port.
+    :param path: the path of a Unix socket to listen to instead of TCP.
+    :return: the started server.
+    """
+    if path is not None:
+        return await asyncio.start_unix_server(_serve_connection, path, limit=MAX_LINE)
+    return await asyncio.start_server(_serve_connection, host, port, limit=MAX_LINE)
+
+
+def serve(host: str = "127.0.0.1", port: int = DEFAULT_PORT, path: str | None = None) -> None:
+    """
+    Runs the service until interrupted.
+    """
+    async def run() -> None:
+        server: asyncio.Server = await start_server(host, port, path)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
+
+
+async def send_requests(requests: Iterable[dict], host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                        path: str | None = None) -> list[dict]:
+    """
+    Sends requests on a single connection, all before reading the responses, and reads their responses.
+    :param requests: the requests.
+    :param host: the address of the service over TCP.
+    :param port: the TCP port of the service.
+    :param path: the path of the Unix socket of the service, instead of TCP.
+    :return: the responses, in the order of the requests.
+    """
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE)
+    else:
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+    async def write() -> None:
+        for request in requests:
+            writer.write(_line(request))
+            await writer.drain()
+        if writer.can_write_eof():
+            writer.write_eof()
+
+    # the responses are read while the requests are written, so neither side blocks the other
+    writing: asyncio.Task = asyncio.create_task(write())
+    try:
+        responses: list[dict] = []
+        while line := await reader.readline():
+            responses.append(json.loads(line))
+        await writing
+        return responses
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def request(requests: Iterable[dict], host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+            path: str | None = None) -> list[dict]:
+    """
+    A blocking client for tests and scripts, see send_requests.
+    """
+    return asyncio.run(send_requests(requests, host, port, path))
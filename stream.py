@@ -0,0 +1,164 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Streaming conversion of inputs of any size between raw bytes and the text of the codec bases.
+
+The inputs are read in fixed-size chunks (through mmap for regular files) and flow through
+generators which regroup them on the group boundaries of the codecs, so the memory used only
+depends on the chunk size, never on the size of the input.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+from typing import BinaryIO, Iterable, Iterator
+
+from codec import Codec, get_codec
+
+# The default number of bytes read at once.
+DEFAULT_CHUNK_SIZE: int = 1 << 20
+
+# The name of the raw bytes representation.
+RAW: str = "raw"
+
+# The characters ignored when reading text, as a table of str.translate deleting them.
+WHITESPACE: dict[int, None] = dict.fromkeys(map(ord, " \t\n\r\f\v"))
+
+
+def iter_file_chunks(file: str | os.PathLike | BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Reads a file chunk by chunk. Regular files are memory mapped, other files
+    (pipes, sockets, terminals, in-memory streams...) are read sequentially.
+    :param file: the path of the file or a file object opened in binary mode.
+    :param chunk_size: the maximum number of bytes of a chunk. The chunks of a regular file all have
+    this size but the last one, the chunks of other files may be shorter, as their reads return.
+    :return: an iterator over the chunks.
+    """
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with open(file, "rb") as opened_file:
+            yield from iter_file_chunks(opened_file, chunk_size)
+        return
+
+    try:
+        mapped: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        # not a regular file, or an empty one
+        read = getattr(file, "read1", file.read)
+        while chunk := read(chunk_size):
+            yield chunk
+        return
+
+    with mapped:
+        for offset in range(file.tell(), len(mapped), chunk_size):
+            yield mapped[offset:offset + chunk_size]
+
+
+def iter_text_chunks(file: str | os.PathLike | BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Reads an ASCII text file chunk by chunk, without its whitespace.
+    :param file: the path of the file or a file object opened in binary mode.
+    :param chunk_size: the number of bytes read at once.
+    :return: an iterator over the chunks of text.
+    """
+    for chunk in iter_file_chunks(file, chunk_size):
+        text: str = chunk.decode("ascii").translate(WHITESPACE)
+        if text:
+            yield text
+
+
+def regroup(chunks: Iterable, group: int) -> Iterator:
+    """
+    Cuts chunks of bytes or of text on the multiples of the group size. Only the last chunk
+    yielded may not be a whole number of groups.
+    :param chunks: the chunks, of bytes or of str.
+    :param group: the size of a group.
+    :return: an iterator over the regrouped chunks.
+    """
+    pending = None
+    for chunk in chunks:
+        if pending:
+            chunk = pending + chunk
+        cut: int = len(chunk) - len(chunk) % group
+        if cut:
+            yield chunk[:cut]
+        pending = chunk[cut:]
+    if pending:
+        yield pending
+
+
+def encode_stream(chunks: Iterable[bytes], base: int | str | Codec, separator: str = "") -> Iterator[str]:
+    """
+    Encodes a stream of bytes into a stream of text.
+    :param chunks: the chunks of bytes.
+    :param base: the radix, the name or the codec of the base.
+    :param separator: a string inserted between the groups of characters, also across the chunks.
+    :return: an iterator over the chunks of text.
+    """
+    codec: Codec = base if isinstance(base, Codec) else get_codec(base)
+    first: bool = True
+    for chunk in regroup(chunks, codec.byte_group):
+        if separator and not first:
+            yield separator
+        first = False
+        yield codec.encode(chunk, separator)
+
+
+def decode_stream(text_chunks: Iterable[str], base: int | str | Codec) -> Iterator[bytes]:
+    """
+    Decodes a stream of text into a stream of bytes. Whitespace is ignored.
+    :param text_chunks: the chunks of text.
+    :param base: the radix, the name or the codec of the base.
+    :return: an iterator over the chunks of bytes.
+    :raises ValueError: if the text is not valid in the base.
+    """
+    codec: Codec = base if isinstance(base, Codec) else get_codec(base)
+    stripped: Iterator[str] = (chunk.translate(WHITESPACE) for chunk in text_chunks)
+    for chunk in regroup(stripped, codec.char_group):
+        yield codec.decode(chunk)
+
+
+def convert_file(source: str | os.PathLike | BinaryIO, source_base: int | str,
+                 target_base: int | str, separator: str = "",
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes | str]:
+    """
+    Converts a file from one representation to another, chunk by chunk.
+    :param source: the path of the file or a file object opened in binary mode.
+    :param source_base: the representation of the file: "raw" for bytes, or a base of the codecs.
+    :param target_base: the representation to convert to: "raw" for bytes, or a base of the codecs.
+    :param separator: for a text target, a string inserted between the groups of characters.
+    :param chunk_size: the number of bytes read at once.
+    :return: an iterator over the converted chunks: bytes for a raw target, str otherwise.
+    """
+    if source_base == RAW:
+        data: Iterator[bytes] = iter_file_chunks(source, _aligned(chunk_size, target_base))
+    else:
+        codec: Codec = get_codec(source_base)
+        data: Iterator[bytes] = decode_stream(iter_text_chunks(source, chunk_size), codec)
+
+    if target_base == RAW:
+        return data
+    return encode_stream(data, target_base, separator)
+
+
+def _aligned(chunk_size: int, base: int | str) -> int:
+    """
+    Rounds the chunk size down to a whole number of groups of the codec of the base, if any.
+    """
+    if base == RAW:
+        return chunk_size
+    group: int = get_codec(base).byte_group
+    return max(chunk_size - chunk_size % group, group)
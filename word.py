@@ -0,0 +1,314 @@
+#  Copyright [2022] [Jascha MERLE]
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from byte import ArithmeticResult, Byte
+from byte_array import as_memoryview
+
+
+class BinaryInt:
+    """
+    An unsigned integer of a fixed number of bits, any positive number. Uses little endian representation:
+    the bit 0 is the least significant bit and the byte 0 is the least significant byte.
+
+    The value is stored as a single Python integer and every operation works on it directly,
+    then wraps the result around modulo 2 to the power of the width. When the two operands of
+    an operation have different widths, the result has the width of the left operand.
+    Values are immutable, so they can be used as keys of dictionaries and in sets.
+
+    Attributes\\:
+            WIDTH: the number of bits of the subclasses with a fixed width, None for BinaryInt itself.\\n
+            __value: the unsigned integer represented, between 0 and 2^width - 1 included.\\n
+            __width: the number of bits of the integer, positive.
+    """
+
+    __slots__ = ("__value", "__width")
+
+    WIDTH: ClassVar[int | None] = None
+
+    __value: int
+    __width: int
+
+    def __init__(self, value=0, width: int | None = None) -> None:
+        """
+        Create a new unsigned integer of the given width.
+        :param value: the value to represent, as anything accepted as an operand (see __operand_to_int).
+        Only the bits fitting in the width are kept.
+        :param width: the number of bits, positive. It does not have to be a multiple of 8.
+        It defaults to the width of the class and is mandatory for BinaryInt.
+        """
+        class_width: int | None = type(self).WIDTH
+        if width is None:
+            if class_width is None:
+                raise TypeError("the width of a BinaryInt must be given")
+            width = class_width
+        elif class_width is not None and width != class_width:
+            raise ValueError(f"{type(self).__name__} is {class_width} bits wide, not {width}")
+        if width <= 0:
+            raise ValueError(f"the width must be positive, not {width}")
+        self.__width = width
+        self.__value = BinaryInt.__operand_to_int(value, width) & ((1 << width) - 1)
+
+    def __new_like(self, value: int) -> BinaryInt:
+        """
+        Creates an integer of the same class and width holding the given value, wrapped around.
+        """
+        number: BinaryInt = object.__new__(type(self))
+        number.__width = self.__width
+        number.__value = value & ((1 << self.__width) - 1)
+        return number
+
+    @classmethod
+    def from_bytes(cls, data, byteorder: str = "little") -> BinaryInt:
+        """
+        Creates an integer from its bytes.
+        :param data: the bytes, as a ByteArray, any object supporting the buffer protocol
+        or an iterable of Byte and int.
+        :param byteorder: "little" if the first byte is the least significant, "big" otherwise.
+        :return: a new integer. A fixed width subclass accepts at most its number of bytes,
+        BinaryInt takes the width of the data.
+        :raises ValueError: if the data is empty for BinaryInt, or too long for a fixed width subclass.
+        """
+        view: memoryview = as_memoryview(data)
+        width: int | None = cls.WIDTH
+        if width is None:
+            if not view:
+                raise ValueError("a BinaryInt needs at least one byte")
+            width = 8 * len(view)
+        elif len(view) > width // 8:
+            raise ValueError(f"{cls.__name__} holds {width // 8} bytes, got {len(view)}")
+        number: BinaryInt = object.__new__(cls)
+        number.__width = width
+        number.__value = int.from_bytes(view, byteorder)
+        return number
+
+    def to_bytes(self, byteorder: str = "little") -> bytes:
+        """
+        :return: the bytes of the integer, the most significant one padded with 0 bits
+        when the width is not a multiple of 8.
+        """
+        return self.__value.to_bytes(self.__byte_count(), byteorder)
+
+    def __byte_count(self) -> int:
+        return (self.__width + 7) // 8
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def signed(self) -> int:
+        """
+        The two's complement signed integer represented by the bits.
+        """
+        if self.__value >> (self.__width - 1):
+            return self.__value - (1 << self.__width)
+        return self.__value
+
+    def byte(self, index: int) -> Byte:
+        """
+        Gets one byte of the integer.
+        :param index: the index of the byte, 0 being the least significant byte.
+        :return: the interned Byte holding the bits 8 * index to 8 * index + 7.
+        """
+        index = int(index)
+        if not 0 <= index < self.__byte_count():
+            raise IndexError("byte index out of range")
+        return Byte.from_int(self.__value >> (8 * index))
+
+    def bytes(self) -> list[Byte]:
+        """
+        :return: the interned Bytes of the integer, from the least significant to the most significant.
+        """
+        return [Byte.from_int(value) for value in self.to_bytes("little")]
+
+    def __getitem__(self, item) -> int:
+        """
+        Gets a bit of the integer, like Byte.__getitem__.
+        :param item: the index of the bit, 0 being the least significant bit, as an int, a str or a Byte.
+        :return: the bit, 0 or 1.
+        """
+        index: int = int(item)
+        if not 0 <= index < self.__width:
+            raise IndexError("bit index out of range")
+        return (self.__value >> index) & 1
+
+    def __len__(self) -> int:
+        return self.__width
+
+    def __int__(self) -> int:
+        return self.__value
+
+    def __index__(self) -> int:
+        return self.__value
+
+    def __bool__(self) -> bool:
+        return self.__value != 0
+
+    def __str__(self) -> str:
+        return format(self.__value, f"0{self.__width}b")[::-1]
+
+    def __repr__(self) -> str:
+        if type(self).WIDTH is None:
+            return f"{type(self).__name__}({self.__value:#0{(self.__width + 3) // 4 + 2}x}, {self.__width})"
+        return f"{type(self).__name__}({self.__value:#0{(self.__width + 3) // 4 + 2}x})"
+
+    @staticmethod
+    def __operand_to_int(other, width: int) -> int:
+        """
+        Converts an operand into an integer. BinaryInts and Bytes give their value, integers are used as is,
+        strings are parsed as a string of bits with the least significant bit first (like Byte.from_str)
+        and other objects are converted through int().
+        """
+        if isinstance(other, BinaryInt):
+            return other.__value
+        elif isinstance(other, int):
+            return other
+        elif isinstance(other, str):
+            return sum(1 << index for index, char in enumerate(other[:width]) if char == "1")
+        else:
+            return int(other)
+
+    def __operand(self, other) -> int:
+        return BinaryInt.__operand_to_int(other, self.__width)
+
+    def __add__(self, other) -> BinaryInt:
+        return self.__new_like(self.__value + self.__operand(other))
+
+    def __radd__(self, other) -> BinaryInt:
+        return self.__new_like(self.__operand(other) + self.__value)
+
+    def __sub__(self, other) -> BinaryInt:
+        return self.__new_like(self.__value - self.__operand(other))
+
+    def __rsub__(self, other) -> BinaryInt:
+        return self.__new_like(self.__operand(other) - self.__value)
+
+    def __mul__(self, other) -> BinaryInt:
+        return self.__new_like(self.__value * self.__operand(other))
+
+    def __rmul__(self, other) -> BinaryInt:
+        return self.__new_like(self.__operand(other) * self.__value)
+
+    def __divmod__(self, other) -> tuple[BinaryInt, BinaryInt]:
+        quotient, remainder = divmod(self.__value, self.__operand(other))
+        return self.__new_like(quotient), self.__new_like(remainder)
+
+    def __floordiv__(self, other) -> BinaryInt:
+        return self.__divmod__(other)[0]
+
+    def __mod__(self, other) -> BinaryInt:
+        return self.__divmod__(other)[1]
+
+    def add_with_carry(self, other, carry_in: bool = False) -> ArithmeticResult:
+        """
+        Adds the other operand and the incoming carry, like the ADC instruction of a processor.
+        :param other: the other object to add, truncated to the width of this integer.
+        :param carry_in: True to add one more to the sum.
+        :return: the wrapped sum, the carry out of the most significant bit and the two's complement overflow.
+        """
+        mask: int = (1 << self.__width) - 1
+        other_value: int = self.__operand(other) & mask
+        total: int = self.__value + other_value + (1 if carry_in else 0)
+        result: int = total & mask
+        sign: int = 1 << (self.__width - 1)
+        overflow: bool = ((self.__value ^ result) & (other_value ^ result) & sign) != 0
+        return ArithmeticResult(self.__new_like(result), total > mask, overflow)
+
+    def subtract_with_borrow(self, other, borrow_in: bool = False) -> ArithmeticResult:
+        """
+        Subtracts the other operand and the incoming borrow, like the SBB instruction of a processor.
+        :param other: the other object to subtract, truncated to the width of this integer.
+        :param borrow_in: True to subtract one more from the difference.
+        :return: the wrapped difference, the borrow (stored as the carry) and the two's complement overflow.
+        """
+        mask: int = (1 << self.__width) - 1
+        other_value: int = self.__operand(other) & mask
+        total: int = self.__value - other_value - (1 if borrow_in else 0)
+        result: int = total & mask
+        sign: int = 1 << (self.__width - 1)
+        overflow: bool = ((self.__value ^ other_value) & (self.__value ^ result) & sign) != 0
+        return ArithmeticResult(self.__new_like(result), total < 0, overflow)
+
+    def multiply_with_carry(self, other) -> ArithmeticResult:
+        """
+        Multiplies by the other operand as unsigned integers.
+        :param other: the other object to multiply by, truncated to the width of this integer.
+        :return: the wrapped product, True as the carry if the unsigned product does not fit in the width
+        and True as the overflow if the two's complement product does not fit in the width.
+        """
+        other_number: BinaryInt = self.__new_like(self.__operand(other))
+        product: int = self.__value * other_number.__value
+        signed_product: int = self.signed * other_number.signed
+        limit: int = 1 << (self.__width - 1)
+        return ArithmeticResult(self.__new_like(product), product >> self.__width != 0,
+                                not -limit <= signed_product < limit)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (BinaryInt, Byte, int)):
+            return self.__value == int(other)
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        if isinstance(other, (BinaryInt, Byte, int)):
+            return self.__value != int(other)
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        return self.__value < self.__operand(other)
+
+    def __le__(self, other) -> bool:
+        return self.__value <= self.__operand(other)
+
+    def __gt__(self, other) -> bool:
+        return self.__value > self.__operand(other)
+
+    def __ge__(self, other) -> bool:
+        return self.__value >= self.__operand(other)
+
+    def __hash__(self) -> int:
+        return hash(self.__value)
+
+
+class Word16(BinaryInt):
+    """
+    A 16-bit unsigned integer.
+    """
+
+    __slots__ = ()
+
+    WIDTH = 16
+
+
+class Word32(BinaryInt):
+    """
+    A 32-bit unsigned integer.
+    """
+
+    __slots__ = ()
+
+    WIDTH = 32
+
+
+class Word64(BinaryInt):
+    """
+    A 64-bit unsigned integer.
+    """
+
+    __slots__ = ()
+
+    WIDTH = 64